@@ -0,0 +1,229 @@
+/*
+ * 사이트 검색 (scripts/search_index.py가 만든 assets/search/ 색인 사용)
+ *
+ * docs.json(문서 목록과 토큰화 설정)을 한 번 받고, 검색어 용어가 속한 샤드만 내려받아
+ * tf-idf 점수로 정렬합니다. 모든 용어가 들어 있는 문서를 보여주고, 없으면 가장 많은 용어가
+ * 맞은 문서를 (절반 이상 맞은 경우만) 보여줍니다.
+ * 토큰화와 샤드 규칙은 scripts/search_index.py의 tokenize/shard_key와 같아야 합니다.
+ *
+ *   <script src=".../assets/js/search.js" data-index=".../assets/search/" data-baseurl=""></script>
+ */
+(function () {
+  'use strict';
+
+  var script = document.currentScript;
+  var indexUrl = script.getAttribute('data-index');
+  var baseurl = script.getAttribute('data-baseurl') || '';
+
+  var HANGUL_BASE = 0xac00;
+  var HANGUL_LAST = 0xd7a3;
+  var JONGSEONG_COUNT = 28;
+  var TOKEN_PATTERN = /[가-힣]+|[0-9a-z][0-9a-z_]*/g;
+  var MAX_RESULTS = 20;
+  var DEBOUNCE_MS = 150;
+
+  var indexPromise = null;
+  var shards = {};
+
+  function fetchJSON(url) {
+    return fetch(url).then(function (response) {
+      // 아직 용어가 하나도 없는 샤드는 파일이 없음
+      if (response.status === 404) {
+        return {};
+      }
+      if (!response.ok) {
+        throw new Error(url + ': ' + response.status);
+      }
+      return response.json();
+    });
+  }
+
+  function loadIndex() {
+    if (indexPromise === null) {
+      indexPromise = fetchJSON(indexUrl + 'docs.json');
+    }
+    return indexPromise;
+  }
+
+  function loadShard(key) {
+    if (!(key in shards)) {
+      shards[key] = fetchJSON(indexUrl + 'shards/' + key + '.json');
+    }
+    return shards[key];
+  }
+
+  function isHangul(code) {
+    return code >= HANGUL_BASE && code <= HANGUL_LAST;
+  }
+
+  function stripParticle(word, particles) {
+    for (var i = 0; i < particles.length; i++) {
+      var particle = particles[i];
+      if (word.length - particle.length >= 2 && word.endsWith(particle)) {
+        return word.slice(0, -particle.length);
+      }
+    }
+    return word;
+  }
+
+  function tokenize(text, tokenizer) {
+    var terms = [];
+    var tokens = text.toLowerCase().match(TOKEN_PATTERN) || [];
+    tokens.forEach(function (token) {
+      if (isHangul(token.charCodeAt(0))) {
+        var word = stripParticle(token, tokenizer.particles);
+        if (word.length <= 2) {
+          if (tokenizer.particles.indexOf(word) === -1) {
+            terms.push(word);
+          }
+        } else {
+          for (var i = 0; i < word.length - 1; i++) {
+            terms.push(word.slice(i, i + 2));
+          }
+        }
+      } else if (token.length >= 2 && token.length <= tokenizer.max_term_length &&
+                 tokenizer.stopwords.indexOf(token) === -1) {
+        terms.push(token);
+      }
+    });
+    return terms.filter(function (term, i) { return terms.indexOf(term) === i; });
+  }
+
+  function shardKey(term) {
+    var code = term.charCodeAt(0);
+    if (isHangul(code)) {
+      var index = Math.floor((code - HANGUL_BASE) / JONGSEONG_COUNT);
+      return 'h' + ('000' + index).slice(-4);
+    }
+    if (code >= 0x30 && code <= 0x39) {
+      return '0';
+    }
+    return term.charAt(0);
+  }
+
+  function search(query) {
+    return loadIndex().then(function (index) {
+      var terms = tokenize(query, index.tokenizer);
+      var total = Object.keys(index.docs).length;
+      return Promise.all(terms.map(function (term) {
+        return loadShard(shardKey(term)).then(function (shard) { return shard[term] || []; });
+      })).then(function (postingsList) {
+        var scores = {};
+        var matched = {};
+        postingsList.forEach(function (postings) {
+          var df = postings.length / 2;
+          if (df === 0) {
+            return;
+          }
+          var idf = Math.log(1 + total / df);
+          for (var i = 0; i < postings.length; i += 2) {
+            var id = postings[i];
+            scores[id] = (scores[id] || 0) + (1 + Math.log(postings[i + 1])) * idf;
+            matched[id] = (matched[id] || 0) + 1;
+          }
+        });
+
+        // 가장 많은 용어가 맞은 문서만 (모두 맞은 문서가 없으면 절반 이상 맞은 문서)
+        var ids = Object.keys(scores);
+        var best = ids.reduce(function (max, id) { return Math.max(max, matched[id]); }, 0);
+        if (best * 2 < terms.length) {
+          ids = [];
+        }
+        var results = ids.filter(function (id) { return matched[id] === best; }).map(function (id) {
+          return { doc: index.docs[id], score: scores[id] };
+        }).filter(function (result) { return result.doc; });
+        results.sort(function (a, b) {
+          return b.score - a.score || (b.doc.date > a.doc.date ? 1 : b.doc.date < a.doc.date ? -1 : 0);
+        });
+        return { results: results.slice(0, MAX_RESULTS), partial: best < terms.length };
+      });
+    });
+  }
+
+  function element(tag, className, text) {
+    var node = document.createElement(tag);
+    if (className) {
+      node.className = className;
+    }
+    if (text) {
+      node.textContent = text;
+    }
+    return node;
+  }
+
+  function render(container, query, found) {
+    container.replaceChildren();
+    if (!query.trim()) {
+      return;
+    }
+    if (found.results.length === 0) {
+      container.appendChild(element('p', 'text-grey-dk-000', '검색 결과가 없습니다.'));
+      return;
+    }
+    if (found.partial) {
+      container.appendChild(element('p', 'text-grey-dk-000', '모든 검색어가 들어 있는 문서가 없어 가장 많이 맞는 문서를 보여줍니다.'));
+    }
+    var list = element('ul', 'recoblog-search-list');
+    found.results.forEach(function (result) {
+      var item = element('li');
+      var link = element('a', null, result.doc.title);
+      link.href = baseurl + result.doc.url;
+      item.appendChild(link);
+      if (result.doc.date) {
+        item.appendChild(element('span', 'text-grey-dk-000 fs-2', ' ' + result.doc.date));
+      }
+      if (result.doc.excerpt) {
+        item.appendChild(element('p', 'fs-3', result.doc.excerpt));
+      }
+      list.appendChild(item);
+    });
+    container.appendChild(list);
+  }
+
+  function init() {
+    var input = document.getElementById('recoblog-search-input');
+    var container = document.getElementById('recoblog-search-results');
+    if (!input || !container) {
+      return;
+    }
+
+    var timer = null;
+    var latest = 0;
+    function run() {
+      var query = input.value;
+      var request = ++latest;
+      var url = new URL(window.location.href);
+      if (query.trim()) {
+        url.searchParams.set('q', query);
+      } else {
+        url.searchParams.delete('q');
+      }
+      window.history.replaceState(null, '', url);
+      search(query).then(function (found) {
+        // 입력이 바뀌는 동안 늦게 끝난 이전 검색 결과는 버림
+        if (request === latest) {
+          render(container, query, found);
+        }
+      }).catch(function (error) {
+        container.replaceChildren(element('p', 'text-red-200', '검색 색인을 불러오지 못했습니다: ' + error.message));
+      });
+    }
+
+    input.addEventListener('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(run, DEBOUNCE_MS);
+    });
+
+    var initial = new URL(window.location.href).searchParams.get('q');
+    if (initial) {
+      input.value = initial;
+      run();
+    }
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
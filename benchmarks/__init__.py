@@ -0,0 +1 @@
+# recoblog benchmarks package
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+agent-*.jsonl 디코딩 벤치마크
+
+실제 크기에 가까운 합성 transcript(도구 결과, progress 이벤트, 여러 날짜에 걸친 기록)를
+만들어 두고, 한 날짜를 수집하는 데 걸리는 시간을 비교합니다.
+
+- legacy: 모든 줄을 텍스트로 읽어 표준 json.loads 후 필터링 (이전 방식)
+- stdlib / orjson / msgspec: bytes 사전 필터 + 선택한 디코딩 백엔드
+
+사용법:
+    python3 -m benchmarks.bench_json_decode
+    python3 -m benchmarks.bench_json_decode --lines 500000 --days 14 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.collect_conversations import ConversationCollector, DayWindow, parse_agent_file
+from scripts.json_backend import BACKENDS, get_backend
+
+
+def write_transcript(path: Path, lines: int, days: int, seed: int = 42) -> datetime:
+    """
+    합성 agent transcript 생성
+
+    Returns:
+        가운데 날짜 (수집 대상)
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    step = timedelta(days=days) / lines
+    filler = "def handler(event):\n    return process(event)  # 한글 주석\n" * 40
+
+    with open(path, 'w', encoding='utf-8') as f:
+        ts = start
+        for i in range(lines):
+            ts += step
+            ts_str = ts.strftime('%Y-%m-%dT%H:%M:%S.') + f"{ts.microsecond // 1000:03d}Z"
+            kind = rng.random()
+            if kind < 0.35:
+                entry = {
+                    "type": "user", "sessionId": "bench-session", "timestamp": ts_str,
+                    "message": {"role": "user", "content": [
+                        {"type": "tool_result", "tool_use_id": f"toolu_{i}",
+                         "content": filler[:rng.randint(500, len(filler))]}
+                    ]},
+                    "toolUseResult": {"stdout": filler[:rng.randint(200, 2000)]},
+                }
+            elif kind < 0.55:
+                entry = {
+                    "type": "progress", "sessionId": "bench-session", "timestamp": ts_str,
+                    "data": {"type": "hook_progress", "hookName": "PostToolUse"},
+                }
+            elif kind < 0.80:
+                entry = {
+                    "type": "assistant", "sessionId": "bench-session", "timestamp": ts_str,
+                    "message": {"role": "assistant", "content": [
+                        {"type": "text", "text": "파일을 확인해 보겠습니다. " * rng.randint(1, 20)},
+                        {"type": "tool_use", "id": f"toolu_{i}", "name": "Read",
+                         "input": {"file_path": "/src/app.py"}},
+                    ]},
+                }
+            else:
+                entry = {
+                    "type": "user", "sessionId": "bench-session", "timestamp": ts_str,
+                    "message": {"role": "user", "content": "이 함수가 왜 느린지 설명해줘 " * rng.randint(1, 10)},
+                }
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if rng.random() < 0.001:
+                f.write("{malformed\n")
+
+    return start + timedelta(days=days // 2)
+
+
+def legacy_parse(agent_file: Path, window: DayWindow) -> int:
+    """이전 방식: 모든 줄을 json.loads 하고 datetime으로 변환한 뒤 필터링. 수집된 메시지 수 반환"""
+    count = 0
+    with open(agent_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            ts = ConversationCollector._parse_timestamp(entry.get('timestamp', ''))
+            if ts is None or not window.contains(ts):
+                continue
+            if entry.get('type') in ('user', 'assistant'):
+                message = entry.get('message', {})
+                text = ConversationCollector._extract_text_content(message.get('content', []))
+                if text and text.strip():
+                    count += 1
+    return count
+
+
+def best_of(repeat: int, func) -> tuple[float, object]:
+    """repeat번 실행 중 가장 빠른 시간과 결과"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='agent-*.jsonl 디코딩 벤치마크')
+    parser.add_argument('--lines', type=int, default=200_000, help='생성할 줄 수')
+    parser.add_argument('--days', type=int, default=10, help='기록이 걸쳐 있는 날짜 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        agent_file = Path(tmp) / "agent-bench.jsonl"
+        target = write_transcript(agent_file, args.lines, args.days)
+        size_mb = agent_file.stat().st_size / 1024 / 1024
+        window = DayWindow.for_date(target)
+
+        print(f"=== agent-*.jsonl 디코딩 벤치마크 ===")
+        print(f"파일: {args.lines:,}줄, {size_mb:.1f}MB, {args.days}일치 (대상: {target:%Y-%m-%d})\n")
+
+        legacy_time, legacy_count = best_of(
+            args.repeat, lambda: legacy_parse(agent_file, window)
+        )
+        print(f"{'legacy':>8}: {legacy_time:7.3f}s  {size_mb / legacy_time:7.1f}MB/s  "
+              f"메시지 {legacy_count}개")
+
+        for name in BACKENDS:
+            try:
+                get_backend(name)
+            except ValueError:
+                print(f"{name:>8}: 설치되지 않아 건너뜀")
+                continue
+            elapsed, conversation = best_of(
+                args.repeat,
+                lambda: parse_agent_file(agent_file, "/bench", window, name)
+            )
+            count = len(conversation.messages) if conversation else 0
+            mismatch = "" if count == legacy_count else "  [불일치!]"
+            print(f"{name:>8}: {elapsed:7.3f}s  {size_mb / elapsed:7.1f}MB/s  "
+                  f"메시지 {count}개  ({legacy_time / elapsed:.1f}x){mismatch}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Message/Conversation 메모리 벤치마크
+
+합성된 "바쁜 하루"(수만 개 메시지)를 메모리에 올렸을 때의 최대 RSS를 비교합니다.
+각 구현은 별도 프로세스에서 실행하여 서로의 할당이 섞이지 않게 합니다.
+
+- legacy: 이전 방식 (__slots__ 없는 dataclass, 메시지마다 문자열/aware datetime 보유)
+- compact: 현재 Message (__slots__, intern된 문자열, epoch 밀리초 timestamp)
+
+사용법:
+    python3 -m benchmarks.bench_memory
+    python3 -m benchmarks.bench_memory --messages 500000 --sessions 200
+"""
+
+import argparse
+import gc
+import resource
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.collect_conversations import Conversation, ConversationCollector, Message
+
+
+@dataclass
+class LegacyMessage:
+    """이전 Message 정의"""
+    role: str
+    content: str
+    timestamp: datetime
+    project: str
+    session_id: str
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 bytes 단위
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def build_day(impl: str, messages: int, sessions: int, content_chars: int) -> list[Conversation]:
+    """
+    합성 하루치 대화 생성
+
+    JSON 디코딩처럼 메시지마다 새 문자열 객체가 만들어지도록 project/session 문자열을
+    매번 조립합니다.
+    """
+    message_cls = LegacyMessage if impl == 'legacy' else Message
+    start = datetime(2026, 2, 6, tzinfo=timezone.utc)
+    body = "이 함수의 동작을 설명해 주세요. def f(x): return x * 2 " * (content_chars // 50 + 1)
+
+    conversations = [
+        Conversation(project=f"/Users/evan/project-{i % 30}", session_id=f"session-{i:08d}")
+        for i in range(sessions)
+    ]
+    for i in range(messages):
+        conv = conversations[i % sessions]
+        conv.messages.append(message_cls(
+            role='user' if i % 2 == 0 else 'assistant',
+            content=body[:content_chars] + str(i),
+            timestamp=start + timedelta(milliseconds=i * 1500),
+            project=''.join(['/Users/evan/', 'project-', str(i % sessions % 30)]),
+            session_id=''.join(['session-', f"{i % sessions:08d}"]),
+        ))
+
+    for conv in conversations:
+        conv.start_time = conv.messages[0].timestamp
+        conv.end_time = conv.messages[-1].timestamp
+    return conversations
+
+
+def run_child(args) -> None:
+    """자식 프로세스: 하루치를 만들고 최대 RSS 출력"""
+    gc.collect()
+    baseline = peak_rss_mb()
+    conversations = build_day(args.impl, args.messages, args.sessions, args.content_chars)
+
+    # 기존 소비 코드가 그대로 동작하는지 확인
+    collector = ConversationCollector()
+    stats = collector.get_statistics(conversations)
+    assert stats['total_messages'] == args.messages
+    assert next(collector.iter_summary_parts(conversations[:1]))
+
+    print(f"{baseline:.1f} {peak_rss_mb():.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Message/Conversation 메모리 벤치마크')
+    parser.add_argument('--messages', type=int, default=200_000, help='메시지 수')
+    parser.add_argument('--sessions', type=int, default=120, help='세션 수')
+    parser.add_argument('--content-chars', type=int, default=200, help='메시지당 본문 길이')
+    parser.add_argument('--impl', choices=('legacy', 'compact'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.impl:
+        run_child(args)
+        return
+
+    print("=== Message 메모리 벤치마크 ===")
+    print(f"메시지 {args.messages:,}개, 세션 {args.sessions}개, 본문 {args.content_chars}자\n")
+
+    results = {}
+    for impl in ('legacy', 'compact'):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_memory', '--impl', impl,
+             '--messages', str(args.messages), '--sessions', str(args.sessions),
+             '--content-chars', str(args.content_chars)],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        baseline, peak = float(output[0]), float(output[1])
+        results[impl] = peak - baseline
+        print(f"{impl:>8}: 최대 RSS {peak:8.1f}MB  (증가분 {peak - baseline:8.1f}MB, "
+              f"메시지당 {(peak - baseline) * 1024 * 1024 / args.messages:6.0f}B)")
+
+    saved = results['legacy'] - results['compact']
+    print(f"\n절감: {saved:.1f}MB ({saved / results['legacy'] * 100:.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
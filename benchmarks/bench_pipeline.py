@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+publish.py 파이프라인 종단간 벤치마크
+
+합성 ~/.claude 디렉토리와 로컬 모의 LLM 서버(mock_llm_server)로 실제 API 없이
+publish.py의 단일 날짜 흐름(수집 → 생성 → 저장, git 제외)을 그대로 실행하고
+단계별 시간과 처리량을 보고합니다.
+
+- collect (cold): 체크포인트/인덱스 없이 처음 수집
+- collect (warm): 체크포인트/인덱스가 있는 상태에서 다시 수집
+- generate: 프롬프트 준비(중복 제거, 세션별 요약) + 본문 스트리밍 (첫 토큰까지 시간 포함)
+- save: 받은 본문을 임시 파일에 써서 포스트로 교체
+
+캐시는 모두 끄고 실행하므로 매번 같은 수의 요청이 나갑니다.
+
+사용법:
+    python3 -m benchmarks.bench_pipeline
+    python3 -m benchmarks.bench_pipeline --sessions 60 --messages 80 --latency 0.5 --tokens-per-second 50
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.mock_llm_server import MockLLMServer
+from benchmarks.synthetic_corpus import write_corpus
+from scripts.collect_conversations import ConversationCollector
+from scripts.generate_blog_post import AsyncBlogPostGenerator
+from scripts.summarize import DEFAULT_TOKEN_BUDGET
+
+
+def timed(func):
+    """(걸린 시간, 결과)"""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+async def timed_async(awaitable):
+    """(걸린 시간, 결과)"""
+    start = time.perf_counter()
+    result = await awaitable
+    return time.perf_counter() - start, result
+
+
+async def generate(generator: AsyncBlogPostGenerator, conversations, target: datetime):
+    """본문을 스트리밍으로 받아 (첫 토큰까지 시간, 조각 리스트) 반환"""
+    start = time.perf_counter()
+    first = None
+    pieces = []
+    async for text in generator.stream_post(conversations, target):
+        if first is None:
+            first = time.perf_counter() - start
+        pieces.append(text)
+    return first, pieces
+
+
+async def replay(pieces: list[str]):
+    for text in pieces:
+        yield text
+
+
+def main():
+    parser = argparse.ArgumentParser(description='publish.py 파이프라인 종단간 벤치마크')
+    parser.add_argument('--sessions', type=int, default=30, help='대상 날짜의 세션 수')
+    parser.add_argument('--messages', type=int, default=60,
+                        help='세션당 메시지 수 (대략, 도구/progress 줄을 포함해 그 두 배의 줄을 생성)')
+    parser.add_argument('--latency', type=float, default=0.1, help='모의 서버 첫 바이트 지연 (초)')
+    parser.add_argument('--tokens-per-second', type=float, default=1000.0, help='모의 서버 토큰 생성 속도')
+    parser.add_argument('--response-tokens', type=int, default=300, help='모의 서버 응답 길이 (토큰)')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 LLM 요청 수')
+    parser.add_argument('--token-budget', type=int, default=DEFAULT_TOKEN_BUDGET,
+                        help='원문을 그대로 보낼 최대 토큰 수 (작게 주면 세션별 요약 경로 측정)')
+    parser.add_argument('--workers', type=int, default=1, help='대화 수집 프로세스 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        claude_dir = tmp_dir / ".claude"
+        corpus = write_corpus(
+            claude_dir, args.sessions * args.messages * 2, days=1,
+            sessions_per_day=args.sessions, malformed_rate=0
+        )
+        target = corpus.start
+        input_mb = corpus.bytes / 1024 / 1024
+
+        print(f"=== publish.py 파이프라인 벤치마크 ===")
+        print(f"입력: 세션 {args.sessions}개 × 메시지 {args.messages}개, {input_mb:.1f}MB "
+              f"(대상: {target:%Y-%m-%d})")
+        print(f"모의 서버: 지연 {args.latency}s, {args.tokens_per_second:g}토큰/s, "
+              f"응답 {args.response_tokens}토큰, 동시 {args.concurrency}개\n")
+
+        results = []
+        collector = ConversationCollector(
+            cache_dir=tmp_dir / "cache", workers=args.workers, claude_dir=claude_dir
+        )
+        cold, conversations = timed(lambda: collector.collect_all(target))
+        warm, _ = timed(lambda: collector.collect_all(target))
+        message_count = sum(len(c.messages) for c in conversations)
+        results.append(("collect (cold)", cold, f"{input_mb / cold:.1f}MB/s, 메시지 {message_count:,}개"))
+        results.append(("collect (warm)", warm, f"{message_count / warm:,.0f}메시지/s"))
+
+        with MockLLMServer(
+            latency=args.latency,
+            tokens_per_second=args.tokens_per_second,
+            response_tokens=args.response_tokens
+        ) as server:
+            generator = AsyncBlogPostGenerator(
+                api_key='mock',
+                base_url=server.base_url,
+                concurrency=args.concurrency,
+                token_budget=args.token_budget
+            )
+            # 저장소의 docs/ 대신 임시 디렉토리에 저장
+            generator.posts_dir = tmp_dir / "posts"
+
+            async def run():
+                async with generator:
+                    gen_time, (first, pieces) = await timed_async(generate(generator, conversations, target))
+                    save_time, path = await timed_async(generator.save_post_stream(replay(pieces), target))
+                    return gen_time, first, pieces, save_time, path
+
+            gen_time, first, pieces, save_time, path = asyncio.run(run())
+            stats = server.snapshot()
+
+        results.append((
+            "generate", gen_time,
+            f"요청 {stats['requests']}개 (최대 동시 {stats['max_concurrent']}), "
+            f"응답 {stats['completion_tokens'] / gen_time:,.0f}토큰/s, 첫 토큰 {first:.3f}s"
+        ))
+        size_kb = path.stat().st_size / 1024
+        results.append(("save", save_time, f"{size_kb:.1f}KB"))
+
+        print()
+        for name, elapsed, detail in results:
+            print(f"{name:>15}: {elapsed:8.3f}s  {detail}")
+        total = cold + gen_time + save_time
+        print(f"{'total':>15}: {total:8.3f}s  (collect cold + generate + save)")
+
+
+if __name__ == '__main__':
+    main()
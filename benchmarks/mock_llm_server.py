@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+로컬 OpenAI 호환 chat completions 모의 서버
+
+실제 API 없이 publish.py 파이프라인을 측정하기 위한 서버입니다. 요청 내용을 보고
+블로그 포스트(프론트매터 포함), 요약, 제목/태그 JSON 중 알맞은 모양의 응답을 돌려주며,
+첫 바이트까지의 지연 시간과 초당 토큰 수를 조절할 수 있습니다. stream=True 요청에는
+SSE(chat.completion.chunk)로 토큰을 하나씩 보냅니다.
+
+- POST /v1/chat/completions: chat completion (stream 지원)
+- GET  /stats: 지금까지의 요청 통계 (JSON)
+
+사용법:
+    python3 -m benchmarks.mock_llm_server --port 8765 --latency 0.5 --tokens-per-second 50
+    export OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=mock
+    python3 -m scripts.publish --date today --no-git
+
+코드에서는 컨텍스트 매니저로 백그라운드 스레드에 띄울 수 있습니다:
+    with MockLLMServer(latency=0.2) as server:
+        generator = AsyncBlogPostGenerator(api_key='mock', base_url=server.base_url)
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+# 응답 토큰으로 돌려가며 쓰는 단어들 (한 단어 = 한 토큰으로 계산)
+_WORDS = (
+    "오늘은 ", "대화 ", "기록을 ", "정리하며 ", "`asyncio` ", "세마포어와 ",
+    "캐시 ", "구조를 ", "살펴봤다. ", "핵심은 ", "요청 ", "수를 ", "줄이는 ", "것이다.\n",
+)
+
+
+def completion_text(prompt: str, tokens: int) -> str:
+    """프롬프트 종류에 맞는 응답 본문 (tokens개 단어)"""
+    if "JSON만" in prompt:
+        return json.dumps({"title": "모의 서버 학습 기록", "tags": ["benchmark", "mock"]},
+                          ensure_ascii=False)
+
+    body = ''.join(_WORDS[i % len(_WORDS)] for i in range(tokens))
+    if "Jekyll" in prompt:
+        return (
+            "---\nlayout: default\ntitle: \"모의 서버 학습 기록\"\nparent: 학습 기록\ntags: [benchmark, mock]\n---\n\n"
+            f"# 모의 서버 학습 기록\n\n{body}\n\n```python\nprint('ok')\n```\n"
+        )
+    return f"- {body}"
+
+
+def split_tokens(text: str) -> list[str]:
+    """스트리밍할 토큰 단위 (공백 뒤에서 자름)"""
+    tokens = []
+    start = 0
+    for index, ch in enumerate(text):
+        if ch in ' \n':
+            tokens.append(text[start:index + 1])
+            start = index + 1
+    if start < len(text):
+        tokens.append(text[start:])
+    return tokens
+
+
+class MockLLMServer:
+    """
+    백그라운드 스레드에서 도는 모의 chat completions 서버
+
+    Attributes:
+        stats: 요청 수, 스트리밍 요청 수, 최대 동시 요청 수, 프롬프트 글자 수, 응답 토큰 수
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.2,
+        tokens_per_second: float = 200.0,
+        response_tokens: int = 300
+    ):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            latency: 요청마다 첫 바이트까지 기다릴 시간 (초)
+            tokens_per_second: 응답 토큰 생성 속도 (0 이하면 지연 없이 한 번에)
+            response_tokens: 응답 길이 (요청의 max_tokens가 더 작으면 그 값)
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.stats = {
+            'requests': 0, 'streamed': 0, 'active': 0, 'max_concurrent': 0,
+            'prompt_chars': 0, 'completion_tokens': 0,
+        }
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """OPENAI_BASE_URL로 쓸 주소"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'MockLLMServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockLLMServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.stats)
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                self.stats[key] += delta
+            self.stats['max_concurrent'] = max(self.stats['max_concurrent'], self.stats['active'])
+
+    def _token_delay(self, tokens: int) -> float:
+        return tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.rstrip('/') != '/stats':
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+                self._send_json(200, server.snapshot())
+
+            def do_POST(self):
+                if not self.path.rstrip('/').endswith('/chat/completions'):
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+                try:
+                    body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                    prompt = ''.join(
+                        message.get('content') or '' for message in body.get('messages', [])
+                    )
+                except (ValueError, AttributeError) as e:
+                    self._send_json(400, {"error": {"message": f"invalid request: {e}"}})
+                    return
+
+                max_tokens = body.get('max_tokens') or server.response_tokens
+                text = completion_text(prompt, min(server.response_tokens, max_tokens))
+                tokens = split_tokens(text)
+                model = body.get('model', 'mock')
+
+                server._count(requests=1, active=1, prompt_chars=len(prompt),
+                              streamed=1 if body.get('stream') else 0)
+                try:
+                    time.sleep(server.latency)
+                    if body.get('stream'):
+                        self._stream(model, tokens)
+                    else:
+                        time.sleep(server._token_delay(len(tokens)))
+                        self._send_json(200, {
+                            "id": "mock", "object": "chat.completion", "created": int(time.time()),
+                            "model": model,
+                            "choices": [{
+                                "index": 0, "finish_reason": "stop",
+                                "message": {"role": "assistant", "content": text},
+                            }],
+                            "usage": {
+                                "prompt_tokens": len(prompt) // 4,
+                                "completion_tokens": len(tokens),
+                                "total_tokens": len(prompt) // 4 + len(tokens),
+                            },
+                        })
+                    server._count(completion_tokens=len(tokens))
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    server._count(active=-1)
+
+            def _stream(self, model: str, tokens: list[str]) -> None:
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+
+                delay = server._token_delay(1)
+                for token in tokens:
+                    self._send_event({
+                        "id": "mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                    })
+                    if delay:
+                        time.sleep(delay)
+                self._send_event({
+                    "id": "mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                })
+                self._send_chunk(b'data: [DONE]\n\n')
+                self.wfile.write(b'0\r\n\r\n')
+                self.wfile.flush()
+
+            def _send_event(self, payload: dict) -> None:
+                self._send_chunk(b'data: ' + json.dumps(payload, ensure_ascii=False).encode('utf-8') + b'\n\n')
+
+            def _send_chunk(self, data: bytes) -> None:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+                self.wfile.flush()
+
+            def _send_json(self, status: int, payload: dict) -> None:
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 OpenAI 호환 chat completions 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8765, help='포트')
+    parser.add_argument('--latency', type=float, default=0.2, help='첫 바이트까지의 지연 시간 (초)')
+    parser.add_argument('--tokens-per-second', type=float, default=200.0,
+                        help='응답 토큰 생성 속도 (0이면 지연 없음)')
+    parser.add_argument('--response-tokens', type=int, default=300, help='응답 길이 (토큰)')
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        args.host, args.port, args.latency, args.tokens_per_second, args.response_tokens
+    )
+    print(f"[정보] 모의 LLM 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+    print(f"  export OPENAI_BASE_URL={server.base_url} OPENAI_API_KEY=mock")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
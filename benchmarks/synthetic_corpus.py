@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+합성 ~/.claude 디렉토리 생성기
+
+실제 기록과 비슷한 모양의 history.jsonl과 projects/*/agent-*.jsonl 트리를 만듭니다.
+벤치마크와 테스트에서 ConversationCollector(claude_dir=...)나 CLAUDE_CONFIG_DIR로 가리켜 씁니다.
+
+- 여러 날짜에 걸친 세션 (일부는 자정을 넘겨 다음 날까지 이어짐)
+- 한 agent 파일에 여러 세션 (이어서 작업한 세션)
+- 사용자 프롬프트, assistant 텍스트 + tool_use, tool_result(+ toolUseResult),
+  progress/system 이벤트, timestamp 없는 summary 줄
+- 잘린 JSON 줄과 빈 줄 (malformed_rate 비율)
+
+모든 파일을 스트리밍으로 쓰므로 1,000만 줄 규모도 메모리에 올리지 않고 만들 수 있습니다
+(history.jsonl 정렬용으로 사용자 프롬프트 timestamp만 정수 배열로 보관).
+
+사용법:
+    python3 -m benchmarks.synthetic_corpus --scale 1m --out /tmp/claude-1m
+    CLAUDE_CONFIG_DIR=/tmp/claude-1m python3 -m scripts.publish --date 2026-02-03 --dry-run
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from pathlib import Path
+from typing import Iterator
+
+# 규모 이름 → agent 파일 전체 줄 수
+SCALES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000,
+}
+
+# 줄 종류별 비율 (누적 확률 기준으로 고름)
+_KINDS = (
+    ('prompt', 0.12),
+    ('assistant', 0.30),
+    ('tool_result', 0.28),
+    ('progress', 0.22),
+    ('system', 0.08),
+)
+
+_PROMPTS = (
+    "이 함수가 왜 느린지 설명해줘",
+    "테스트가 실패하는 이유를 찾아줘",
+    "history.jsonl 파서를 리팩터링하고 싶어",
+    "캐시 키를 어떻게 만들면 좋을까?",
+    "Fix the flaky test in test_publish.py",
+    "README에 사용법을 추가해줘",
+)
+
+_CODE = (
+    "def handler(event):\n"
+    "    # 이벤트를 처리하고 결과를 돌려줌\n"
+    "    return process(event)\n"
+)
+
+
+@dataclass
+class CorpusInfo:
+    """생성된 코퍼스 요약"""
+    claude_dir: Path
+    start: datetime          # 첫 날짜 (로컬 자정)
+    days: int
+    projects: list[str]
+    sessions: int
+    agent_files: int
+    agent_lines: int
+    history_lines: int
+    bytes: int
+
+    def dates(self) -> list[datetime]:
+        """기록이 걸쳐 있는 날짜들 (로컬 자정)"""
+        return [self.start + timedelta(days=i) for i in range(self.days)]
+
+
+def _iso(ts_ms: int) -> str:
+    ts = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc)
+    return ts.strftime('%Y-%m-%dT%H:%M:%S.') + f"{ts_ms % 1000:03d}Z"
+
+
+def _text(rng: random.Random, base: str, low: int, high: int) -> str:
+    repeat = max(1, rng.randint(low, high) // len(base))
+    return (base + " ") * repeat
+
+
+def _entry(kind: str, rng: random.Random, session_id: str, ts_str: str, seq: int) -> dict:
+    """줄 종류별 JSON 엔트리"""
+    if kind == 'prompt':
+        return {
+            "parentUuid": None, "type": "user", "sessionId": session_id, "timestamp": ts_str,
+            "message": {"role": "user", "content": _text(rng, rng.choice(_PROMPTS), 20, 400)},
+        }
+    if kind == 'assistant':
+        return {
+            "type": "assistant", "sessionId": session_id, "timestamp": ts_str,
+            "message": {"role": "assistant", "content": [
+                {"type": "text", "text": f"확인해 보겠습니다 ({seq}).\n\n```python\n"
+                                         f"{_text(rng, _CODE, 50, 1500)}```"},
+                {"type": "tool_use", "id": f"toolu_{seq}", "name": rng.choice(("Read", "Bash", "Edit")),
+                 "input": {"file_path": "/src/app.py"}},
+            ]},
+        }
+    if kind == 'tool_result':
+        output = _text(rng, _CODE, 100, 2000)
+        return {
+            "type": "user", "sessionId": session_id, "timestamp": ts_str,
+            "message": {"role": "user", "content": [
+                {"type": "tool_result", "tool_use_id": f"toolu_{seq}", "content": output},
+            ]},
+            "toolUseResult": {"stdout": output[:rng.randint(50, len(output))], "stderr": ""},
+        }
+    if kind == 'progress':
+        return {
+            "type": "progress", "sessionId": session_id, "timestamp": ts_str,
+            "data": {"type": "hook_progress", "hookName": "PostToolUse"},
+        }
+    return {
+        "type": "system", "sessionId": session_id, "timestamp": ts_str,
+        "content": "Conversation compacted", "level": "info",
+    }
+
+
+def _pick_kind(rng: random.Random) -> str:
+    value = rng.random()
+    total = 0.0
+    for kind, weight in _KINDS:
+        total += weight
+        if value < total:
+            return kind
+    return _KINDS[-1][0]
+
+
+def write_corpus(
+    claude_dir: Path,
+    lines: int,
+    days: int = 7,
+    projects: int = 8,
+    sessions_per_day: int = 12,
+    malformed_rate: float = 0.001,
+    seed: int = 42,
+    start: datetime = datetime(2026, 2, 1)
+) -> CorpusInfo:
+    """
+    합성 코퍼스 생성
+
+    Args:
+        claude_dir: 만들 디렉토리 (history.jsonl, projects/ 생성)
+        lines: agent 파일 전체 줄 수 (대략)
+        days: 기록이 걸쳐 있는 날짜 수
+        projects: 프로젝트 수
+        sessions_per_day: 날짜별 세션 수
+        malformed_rate: 잘린 JSON 줄/빈 줄 비율
+        seed: 난수 시드 (같으면 같은 코퍼스)
+        start: 첫 날짜 (로컬 자정)
+
+    Returns:
+        CorpusInfo
+    """
+    rng = random.Random(seed)
+    project_paths = [f"/Users/synthetic/project-{i:02d}" for i in range(projects)]
+    session_count = max(1, days * sessions_per_day)
+    lines_per_session = max(2, lines // session_count)
+
+    # 세션별 사용자 프롬프트 timestamp (history.jsonl 병합용)
+    prompt_times: list[array] = []
+    session_ids: list[str] = []
+    session_projects: list[int] = []
+    last_file: dict[int, Path] = {}
+    file_mtimes: dict[Path, int] = {}
+    agent_lines = 0
+
+    for index in range(session_count):
+        day = start + timedelta(days=index // sessions_per_day)
+        project = rng.randrange(projects)
+        session_id = f"{seed:04x}{index:08x}-synthetic-session"
+        project_dir = claude_dir / "projects" / project_paths[project].replace('/', '-')
+        project_dir.mkdir(parents=True, exist_ok=True)
+
+        # 10%는 같은 프로젝트의 이전 agent 파일에 이어서 기록
+        if project in last_file and rng.random() < 0.1:
+            agent_file = last_file[project]
+        else:
+            agent_file = project_dir / f"agent-{index:06x}.jsonl"
+            last_file[project] = agent_file
+
+        # 하루 중 임의 시각에 시작해 30분~6시간 진행 (늦게 시작하면 자정을 넘김)
+        start_ms = int(day.timestamp() * 1000) + rng.randint(0, 22 * 3600 * 1000)
+        # agent 파일은 뒤에 덧붙여지기만 하므로 이어 쓰는 세션은 앞 세션이 끝난 뒤에 시작
+        start_ms = max(start_ms, file_mtimes.get(agent_file, 0) + 60 * 1000)
+        step_ms = max(1, rng.randint(30, 360) * 60 * 1000 // lines_per_session)
+        ts_ms = start_ms
+        times = array('q')
+
+        with open(agent_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"type": "summary", "summary": "이전 대화 요약",
+                                "leafUuid": session_id}, ensure_ascii=False) + "\n")
+            for seq in range(lines_per_session - 1):
+                ts_ms += rng.randint(1, 2 * step_ms)
+                if rng.random() < malformed_rate:
+                    f.write("\n" if rng.random() < 0.3 else '{"type": "user", "sessionId": "trunc\n')
+                    continue
+                kind = 'prompt' if seq == 0 else _pick_kind(rng)
+                if kind == 'prompt':
+                    times.append(ts_ms)
+                f.write(json.dumps(_entry(kind, rng, session_id, _iso(ts_ms), seq),
+                                   ensure_ascii=False) + "\n")
+
+        agent_lines += lines_per_session
+        file_mtimes[agent_file] = max(file_mtimes.get(agent_file, 0), ts_ms)
+        prompt_times.append(times)
+        session_ids.append(session_id)
+        session_projects.append(project)
+
+    # 마지막 기록 직후에 수정된 것처럼 mtime 설정 (수집기는 구간 전에 수정이 멈춘 파일을 건너뜀)
+    for agent_file, last_ms in file_mtimes.items():
+        mtime = last_ms / 1000 + 5
+        os.utime(agent_file, (mtime, mtime))
+
+    def history_entries() -> Iterator[tuple[int, int]]:
+        return heapq.merge(*(
+            zip(times, repeat(index)) for index, times in enumerate(prompt_times)
+        ))
+
+    history_lines = 0
+    with open(claude_dir / "history.jsonl", 'w', encoding='utf-8') as f:
+        for ts_ms, index in history_entries():
+            if rng.random() < malformed_rate:
+                f.write('{"display": "잘린 줄", "timest\n')
+            f.write(json.dumps({
+                "display": _PROMPTS[ts_ms % len(_PROMPTS)],
+                "pastedContents": {},
+                "timestamp": ts_ms,
+                "project": project_paths[session_projects[index]],
+                "sessionId": session_ids[index],
+            }, ensure_ascii=False) + "\n")
+            history_lines += 1
+
+    total_bytes = sum(p.stat().st_size for p in claude_dir.rglob("*.jsonl"))
+    return CorpusInfo(
+        claude_dir=claude_dir,
+        start=start,
+        days=days,
+        projects=project_paths,
+        sessions=session_count,
+        agent_files=len(file_mtimes),
+        agent_lines=agent_lines,
+        history_lines=history_lines,
+        bytes=total_bytes,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 ~/.claude 디렉토리 생성')
+    parser.add_argument('--out', type=Path, required=True, help='만들 디렉토리')
+    parser.add_argument('--scale', choices=SCALES, default='100k', help='agent 파일 전체 줄 수')
+    parser.add_argument('--lines', type=int, default=None, help='줄 수 직접 지정 (--scale 무시)')
+    parser.add_argument('--days', type=int, default=7, help='기록이 걸쳐 있는 날짜 수')
+    parser.add_argument('--projects', type=int, default=8, help='프로젝트 수')
+    parser.add_argument('--sessions-per-day', type=int, default=12, help='날짜별 세션 수')
+    parser.add_argument('--malformed-rate', type=float, default=0.001, help='잘린 줄 비율')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    args = parser.parse_args()
+
+    if (args.out / "history.jsonl").exists():
+        print(f"[오류] 이미 코퍼스가 있습니다: {args.out}")
+        sys.exit(1)
+
+    lines = args.lines or SCALES[args.scale]
+    started = time.perf_counter()
+    info = write_corpus(
+        args.out, lines, days=args.days, projects=args.projects,
+        sessions_per_day=args.sessions_per_day, malformed_rate=args.malformed_rate, seed=args.seed
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"[완료] {info.claude_dir} ({elapsed:.1f}s)")
+    print(f"  - agent 파일 {info.agent_files}개, {info.agent_lines:,}줄 (세션 {info.sessions}개)")
+    print(f"  - history.jsonl {info.history_lines:,}줄")
+    print(f"  - {info.bytes / 1024 / 1024:.1f}MB, "
+          f"{info.start:%Y-%m-%d} ~ {info.dates()[-1]:%Y-%m-%d}")
+
+
+if __name__ == '__main__':
+    main()
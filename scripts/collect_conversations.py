@@ -8,27 +8,114 @@ Claude Code 대화 기록 수집 스크립트
 - 프로젝트별 상세 기록: ~/.claude/projects/{encoded-path}/agent-{agentId}.jsonl
   - 형식: 완전한 대화 내용 (user, assistant 메시지 포함)
   - timestamp는 ISO 8601 형식
+
+~/.claude 대신 CLAUDE_CONFIG_DIR 환경변수(Claude Code와 같은 변수)나
+ConversationCollector(claude_dir=...)로 다른 디렉토리를 지정할 수 있습니다.
+
+사용법 (오늘 대화 수집 결과 미리보기):
+    python3 scripts/collect_conversations.py
+    python3 -m scripts.collect_conversations
 """
 
-import json
+import bisect
+import heapq
 import os
-from datetime import datetime, timedelta, timezone
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+# python3 scripts/collect_conversations.py로 직접 실행해도 패키지 안의 상대 import가 동작하도록
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    __package__ = 'scripts'
+
+from .json_backend import SESSION_ID_PATTERN, get_backend, may_contain_message
+from .history_reader import HistoryCheckpoint, scan_history_by_date
+from .state import DEFAULT_CACHE_DIR
+from .transcript_index import TranscriptIndex, recent_files
+
+
+# epoch 밀리초 ↔ datetime 변환 기준점
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MS = timedelta(milliseconds=1)
+
+# iter_messages에서 동시에 열어 둘 최대 파일 수 (macOS 기본 파일 디스크립터 한도 256보다 충분히 작게)
+MAX_OPEN_STREAMS = 64
+
+
+def default_claude_dir() -> Path:
+    """Claude Code 데이터 디렉토리 (CLAUDE_CONFIG_DIR 환경변수, 없으면 ~/.claude)"""
+    configured = os.environ.get('CLAUDE_CONFIG_DIR')
+    return Path(configured).expanduser() if configured else Path.home() / ".claude"
+
+
+def datetime_to_ms(ts: datetime) -> int:
+    """datetime을 epoch 밀리초로 변환 (타임존 없는 값은 로컬 시각으로 간주)"""
+    if ts.tzinfo is None:
+        ts = ts.astimezone()
+    return (ts - EPOCH) // ONE_MS
 
 
-@dataclass
 class Message:
-    """단일 메시지를 나타내는 데이터 클래스"""
-    role: str  # 'user' or 'assistant'
-    content: str
-    timestamp: datetime
-    project: str
-    session_id: str
+    """
+    단일 메시지
 
+    바쁜 날에는 수만 개가 만들어지므로 메모리를 아끼는 형태로 보관합니다.
+    - __slots__로 인스턴스별 __dict__ 제거
+    - project, session_id, role 문자열은 intern하여 메시지 간에 공유
+    - timestamp는 epoch 밀리초 정수로 저장하고, 접근할 때만 UTC datetime으로 변환
+    """
+    __slots__ = ('role', 'content', 'timestamp_ms', 'project', 'session_id')
 
-@dataclass
+    def __init__(
+        self,
+        role: str,  # 'user' or 'assistant'
+        content: str,
+        timestamp,  # datetime 또는 epoch 밀리초
+        project: str,
+        session_id: str
+    ):
+        self.role = sys.intern(role) if isinstance(role, str) else role
+        self.content = content
+        self.timestamp_ms = timestamp if isinstance(timestamp, int) else datetime_to_ms(timestamp)
+        self.project = sys.intern(project)
+        self.session_id = sys.intern(session_id)
+
+    @property
+    def timestamp(self) -> datetime:
+        """UTC datetime (접근할 때마다 새로 생성)"""
+        return EPOCH + self.timestamp_ms * ONE_MS
+
+    def _fields(self) -> tuple:
+        return (self.role, self.content, self.timestamp_ms, self.project, self.session_id)
+
+    def __getstate__(self) -> tuple:
+        return self._fields()
+
+    def __setstate__(self, state: tuple) -> None:
+        # 병렬 수집 워커에서 넘어온 문자열도 다시 intern
+        role, content, timestamp_ms, project, session_id = state
+        self.__init__(role, content, timestamp_ms, project, session_id)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        return (
+            f"Message(role={self.role!r}, content={self.content!r}, "
+            f"timestamp={self.timestamp!r}, project={self.project!r}, "
+            f"session_id={self.session_id!r})"
+        )
+
+
+@dataclass(slots=True)
 class Conversation:
     """하나의 대화 세션을 나타내는 데이터 클래스"""
     project: str
@@ -39,13 +126,467 @@ class Conversation:
     end_time: Optional[datetime] = None
 
 
+# format_for_summary에서 메시지 하나에 표시할 최대 글자 수
+MESSAGE_CHAR_LIMIT = 3000
+
+# 예산이 있을 때 어떤 메시지부터 포함할지 정하는 정책
+# - sequential: 대화 순서, 메시지 순서대로
+# - round-robin: 각 대화의 첫 메시지부터 번갈아 가며 (모든 대화가 고르게 들어감)
+# - user-first: 사용자 메시지를 모두 먼저, 그다음 Claude 응답
+# - recent-first: 최근에 시작한 대화부터
+SUMMARY_POLICIES = ('sequential', 'round-robin', 'user-first', 'recent-first')
+
+
+@dataclass
+class SummaryReport:
+    """format_for_summary_with_report 결과에서 포함/생략된 양"""
+    budget: Optional[int]
+    used: int = 0
+    included_messages: int = 0
+    omitted_messages: int = 0
+    included_conversations: int = 0
+    omitted_conversations: int = 0
+
+    @property
+    def complete(self) -> bool:
+        """생략된 메시지가 없는지"""
+        return self.omitted_messages == 0
+
+    def summary(self) -> str:
+        """생략 내역 요약 문자열"""
+        total_messages = self.included_messages + self.omitted_messages
+        total_conversations = self.included_conversations + self.omitted_conversations
+        if self.complete:
+            return f"대화 {total_conversations}개, 메시지 {total_messages}개 모두 포함 (사용량 {self.used:,})"
+        return (
+            f"예산({self.budget:,}) 초과로 메시지 {total_messages}개 중 {self.omitted_messages}개, "
+            f"대화 {total_conversations}개 중 {self.omitted_conversations}개 생략"
+        )
+
+
+# ISO 8601 → UTC 문자열 경계 형식 (초 단위까지, 분수 초/Z 없음)
+ISO_BOUND_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def is_canonical_utc(ts_str: str) -> bool:
+    """'YYYY-MM-DDTHH:MM:SS[.fff]Z' 형태라 문자열 비교로 범위를 판단할 수 있는지"""
+    return len(ts_str) >= 20 and ts_str[-1] == 'Z' and ts_str[10] == 'T' and ts_str[4] == '-'
+
+
+class DayWindow(NamedTuple):
+    """
+    로컬 달력 기준 [start, end) 수집 구간
+
+    같은 구간을 여러 형태로 미리 계산해 두어, 줄마다 datetime을 만들지 않고
+    UTC ISO 문자열 비교만으로 범위 밖 줄을 걸러낼 수 있게 합니다.
+    """
+    start: datetime  # 로컬 시각 (타임존 없음)
+    end: datetime
+    start_ms: int  # epoch 밀리초
+    end_ms: int
+    start_iso: str  # UTC 'YYYY-MM-DDTHH:MM:SS'
+    end_iso: str
+
+    @classmethod
+    def for_date(cls, target_date: datetime, days: int = 1) -> 'DayWindow':
+        """target_date의 로컬 자정부터 days일 구간"""
+        start = datetime.combine(target_date.date(), datetime.min.time())
+        end = start + timedelta(days=days)
+        # astimezone()은 타임존 없는 값을 로컬 시각으로 해석 (DST 반영)
+        start_utc = start.astimezone(timezone.utc)
+        end_utc = end.astimezone(timezone.utc)
+        return cls(
+            start=start,
+            end=end,
+            start_ms=int(start_utc.timestamp() * 1000),
+            end_ms=int(end_utc.timestamp() * 1000),
+            start_iso=start_utc.strftime(ISO_BOUND_FORMAT),
+            end_iso=end_utc.strftime(ISO_BOUND_FORMAT),
+        )
+
+    def day_starts_ms(self) -> list[int]:
+        """구간에 속한 각 로컬 날짜의 시작 시각 (epoch 밀리초, DST 반영)"""
+        return [
+            int((self.start + timedelta(days=i)).astimezone(timezone.utc).timestamp() * 1000)
+            for i in range((self.end - self.start).days)
+        ]
+
+    def date_keys(self) -> list[str]:
+        """구간에 속한 각 로컬 날짜 키 (YYYY-MM-DD)"""
+        return [
+            (self.start + timedelta(days=i)).strftime('%Y-%m-%d')
+            for i in range((self.end - self.start).days)
+        ]
+
+    def contains(self, ts: datetime) -> bool:
+        """datetime이 구간 안인지 (타임존 없는 값은 로컬 시각으로 간주)"""
+        if ts.tzinfo is None:
+            return self.start <= ts < self.end
+        return self.start_ms <= ts.timestamp() * 1000 < self.end_ms
+
+    def contains_iso(self, ts_str: str) -> Optional[bool]:
+        """
+        ISO 문자열이 구간 안인지 문자열 비교로 판단
+
+        Returns:
+            판단할 수 있으면 True/False, 정규 UTC 형식이 아니면 None
+        """
+        if not is_canonical_utc(ts_str):
+            return None
+        return self.start_iso <= ts_str < self.end_iso
+
+
+@dataclass
+class ParseStats:
+    """agent 파일 읽기 통계 (파이프라인 측정용)"""
+    files_opened: int = 0
+    files_skipped: int = 0
+    bytes_read: int = 0
+    lines_read: int = 0
+    lines_decoded: int = 0
+    json_errors: int = 0
+
+    def add(self, other: 'ParseStats') -> None:
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+class AgentFileStream:
+    """
+    agent-*.jsonl 파일 하나에서 window 구간의 메시지를 순서대로 흘려보내는 스트림
+
+    파일은 반복을 시작할 때 열리고 끝나면 닫힙니다. 각 줄은 bytes 단계의 사전 필터를
+    먼저 통과해야 전체 디코딩되고, timestamp는 문자열 비교로 범위를 확인한 뒤에만
+    datetime으로 변환됩니다. transcript는 시간순으로 덧붙여지므로 파일 순서가 곧
+    timestamp 순서입니다.
+
+    읽기 오류(IOError)는 그대로 전파됩니다 (일부만 읽은 결과를 조용히 돌려주지 않음).
+
+    session_ids가 주어지면(인덱스 없이 고른 파일) 파일이 그 세션 중 하나를 담고 있는지를
+    읽으면서 확인합니다. 확인되기 전의 메시지는 잡아 두었다가 확인되면 흘려보내고,
+    끝까지 확인되지 않으면 버립니다. 인덱스로 고른 파일과 같은 결과가 됩니다.
+
+    Attributes:
+        session_id: 파일에서 처음 발견된 sessionId (반복 중에 채워짐)
+        sessions: 파일에 들어 있는 sessionId들 (인덱스에서 받거나, session_ids가 주어지면
+            반복 중에 채워짐)
+        stats: 읽은 바이트/줄 수, 디코딩한 줄 수, JSON 오류 수 (반복이 끝나면 채워짐)
+    """
+
+    def __init__(
+        self,
+        agent_file: Path,
+        project_path: str,
+        window: DayWindow,
+        json_backend: Optional[str] = None,
+        session_ids: Optional[frozenset[str]] = None,
+        sessions: frozenset[str] = frozenset()
+    ):
+        """
+        Args:
+            agent_file: agent-*.jsonl 경로
+            project_path: 프로젝트 절대 경로
+            window: 수집 구간
+            json_backend: JSON 디코딩 백엔드 이름 (None이면 기본값)
+            session_ids: 읽으면서 확인할 세션 ID들 (None이면 확인하지 않음, 비어 있으면 모두 통과)
+            sessions: 인덱스에 기록된 파일의 세션 ID들
+        """
+        self.agent_file = agent_file
+        self.project_path = project_path
+        self.window = window
+        self.json_backend = json_backend
+        self.session_ids = session_ids
+        self.agent_id = agent_file.stem.replace('agent-', '')
+        self.session_id = ""
+        self.sessions = sessions
+        self.stats = ParseStats()
+
+    def __iter__(self) -> Iterator[Message]:
+        backend = get_backend(self.json_backend)
+        window = self.window
+        start_iso = window.start_iso.encode()
+        end_iso = window.end_iso.encode()
+        lines_read = bytes_read = lines_decoded = json_errors = 0
+
+        # 세션을 확인하기 전까지 잡아 둔 메시지 (None이면 바로 흘려보냄)
+        session_ids = self.session_ids
+        held: Optional[list[Message]] = None
+        if session_ids is not None:
+            found: set[str] = set()
+            self.sessions = found
+            if session_ids:
+                held = []
+
+        try:
+            with open(self.agent_file, 'rb') as f:
+                self.stats.files_opened = 1
+                for line in f:
+                    lines_read += 1
+                    bytes_read += len(line)
+                    if not line.strip():
+                        continue
+
+                    # 인덱스와 같은 기준으로 파일의 세션을 모음 (디코딩과 관계없이 모든 줄)
+                    if session_ids is not None:
+                        for match in SESSION_ID_PATTERN.finditer(line):
+                            found.add(match.group(1).decode('utf-8', errors='replace'))
+                        if held is not None and not found.isdisjoint(session_ids):
+                            yield from held
+                            held = None
+
+                    # 세션 ID를 얻기 전까지는 모든 줄을 디코딩
+                    if self.session_id and not may_contain_message(line, start_iso, end_iso):
+                        continue
+
+                    lines_decoded += 1
+                    try:
+                        entry = backend.decode_transcript(line)
+                    except ValueError:
+                        json_errors += 1
+                        continue
+                    if entry is None:
+                        continue
+
+                    # 세션 ID 추출
+                    entry_session = entry.session_id
+                    if not self.session_id and entry_session:
+                        self.session_id = entry_session
+
+                    # 타임스탬프 파싱 (ISO 8601 형식)
+                    ts_str = entry.timestamp
+                    if not ts_str or not isinstance(ts_str, str):
+                        continue
+
+                    # 타겟 날짜 필터링 (로컬 시간 기준)
+                    # 정규 UTC 형식이면 문자열 비교로 먼저 거르고, 통과한 줄만 파싱
+                    in_window = window.contains_iso(ts_str)
+                    if in_window is False:
+                        continue
+
+                    # ISO 8601 파싱
+                    ts = ConversationCollector._parse_timestamp(ts_str)
+                    if ts is None:
+                        continue
+                    if in_window is None and not window.contains(ts):
+                        continue
+
+                    # 메시지 타입 확인
+                    if entry.type in ('user', 'assistant'):
+                        # 텍스트 콘텐츠 추출
+                        text_content = ConversationCollector._extract_text_content(entry.content)
+
+                        if text_content and len(text_content.strip()) > 0:
+                            message = Message(
+                                role=entry.role,
+                                content=text_content,
+                                timestamp=ts,
+                                project=self.project_path,
+                                session_id=entry_session
+                            )
+                            if held is None:
+                                yield message
+                            else:
+                                held.append(message)
+
+        finally:
+            self.stats.lines_read = lines_read
+            self.stats.bytes_read = bytes_read
+            self.stats.lines_decoded = lines_decoded
+            self.stats.json_errors = json_errors
+
+    def to_conversation(self) -> Optional[Conversation]:
+        """스트림 전체를 읽어 Conversation으로 변환 (메시지가 없으면 None)"""
+        return self._make_conversation(list(self))
+
+    def to_conversations_by_day(self) -> dict[int, Conversation]:
+        """
+        스트림 전체를 읽어 로컬 날짜별 Conversation으로 나눔
+
+        Returns:
+            dict[구간 내 날짜 인덱스(0부터), Conversation]
+        """
+        day_starts = self.window.day_starts_ms()
+        buckets: dict[int, list[Message]] = {}
+        for msg in self:
+            day_index = bisect.bisect_right(day_starts, msg.timestamp_ms) - 1
+            buckets.setdefault(max(day_index, 0), []).append(msg)
+
+        return {
+            day_index: self._make_conversation(messages)
+            for day_index, messages in sorted(buckets.items())
+        }
+
+    def _make_conversation(self, messages: list[Message]) -> Optional[Conversation]:
+        """메시지들을 시간순으로 정렬해 Conversation 생성 (비어 있으면 None)"""
+        if not messages:
+            return None
+
+        messages.sort(key=lambda m: m.timestamp_ms)
+        return Conversation(
+            project=self.project_path,
+            session_id=self.session_id,
+            agent_id=self.agent_id,
+            messages=messages,
+            start_time=messages[0].timestamp,
+            end_time=messages[-1].timestamp,
+        )
+
+
+def parse_agent_file(
+    agent_file: Path,
+    project_path: str,
+    window: DayWindow,
+    json_backend: Optional[str] = None
+) -> Optional[Conversation]:
+    """
+    agent-*.jsonl 파일 하나에서 window 구간의 대화를 수집
+
+    Returns:
+        메시지가 있으면 Conversation, 없으면 None
+    """
+    return AgentFileStream(agent_file, project_path, window, json_backend).to_conversation()
+
+
+def parse_agent_file_by_day(
+    agent_file: Path,
+    project_path: str,
+    window: DayWindow,
+    json_backend: Optional[str] = None
+) -> dict[int, Conversation]:
+    """
+    agent-*.jsonl 파일 하나에서 window 구간의 대화를 로컬 날짜별로 수집
+
+    Returns:
+        dict[구간 내 날짜 인덱스(0부터), Conversation]
+    """
+    return AgentFileStream(agent_file, project_path, window, json_backend).to_conversations_by_day()
+
+
+def merge_sorted(
+    streams: Iterable[Iterable[Any]],
+    key: Callable[[Any], Any],
+    max_open: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    각각 key 순으로 정렬된 스트림들을 병합하되 동시에 max_open개까지만 반복
+
+    스트림이 더 많으면 max_open개씩 heapq.merge로 병합한 결과를 임시 파일에 pickle로
+    흘려 쓰고, 그 임시 파일들을 같은 방식으로 다시 병합합니다 (외부 병합 정렬).
+    열린 파일 수와 메모리 사용량이 스트림 수와 관계없이 max_open에 비례합니다.
+    같은 key끼리는 heapq.merge와 같이 앞 스트림의 항목이 먼저 나옵니다.
+
+    Args:
+        streams: key 순으로 정렬된 반복 가능한 객체들 (반복을 시작할 때 파일을 여는 스트림)
+        key: 정렬 키 함수
+        max_open: 동시에 반복할 최대 스트림 수 (기본값: MAX_OPEN_STREAMS)
+    """
+    max_open = max(2, max_open or MAX_OPEN_STREAMS)
+    streams = list(streams)
+    if len(streams) <= max_open:
+        yield from heapq.merge(*streams, key=key)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='recoblog-merge-') as tmp_dir:
+        runs = []
+        for start in range(0, len(streams), max_open):
+            run = Path(tmp_dir) / f"run-{len(runs):05d}.pickle"
+            with open(run, 'wb') as f:
+                for item in heapq.merge(*streams[start:start + max_open], key=key):
+                    pickle.dump(item, f, protocol=pickle.HIGHEST_PROTOCOL)
+            runs.append(run)
+        yield from merge_sorted([_read_run(run) for run in runs], key, max_open)
+
+
+def _read_run(path: Path) -> Iterator[Any]:
+    """merge_sorted가 쓴 임시 파일을 순서대로 읽음 (반복을 시작할 때 열림)"""
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def _run_stream(
+    method: Callable[[AgentFileStream], Any],
+    stream: AgentFileStream
+) -> tuple[Any, AgentFileStream]:
+    """
+    스트림 하나를 method(예: list)로 읽고 (결과, 다 읽은 스트림) 반환
+
+    병렬 수집 시 워커 프로세스에서 실행되므로 모듈 수준 함수로 둡니다.
+    스트림은 pickle로 오가므로, 읽으면서 채워진 session_id/sessions/stats도 함께 돌아옵니다.
+    """
+    return method(stream), stream
+
+
+def _tag_messages(index: int, messages: Iterable[Message]) -> Iterator[tuple[int, Message]]:
+    """메시지마다 스트림 번호를 붙임 (병합 후에도 어느 파일의 메시지인지 알 수 있도록)"""
+    for msg in messages:
+        yield index, msg
+
+
 class ConversationCollector:
     """Claude Code 대화 기록을 수집하는 클래스"""
 
-    def __init__(self):
-        self.claude_dir = Path.home() / ".claude"
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        workers: int = 1,
+        json_backend: Optional[str] = None,
+        claude_dir: Optional[Path] = None
+    ):
+        """
+        Args:
+            cache_dir: 체크포인트/인덱스 저장 디렉토리 (기본값: 저장소의 .cache/)
+            use_cache: False면 상태 파일 없이 매번 원본을 직접 스캔
+            workers: agent 파일 파싱 프로세스 수 (1이면 직렬, 0이면 CPU 수)
+            json_backend: JSON 디코딩 백엔드 (stdlib, orjson, msgspec)
+            claude_dir: Claude Code 데이터 디렉토리 (기본값: CLAUDE_CONFIG_DIR 또는 ~/.claude)
+
+        Attributes:
+            stats: 지금까지 수집하면서 agent 파일을 읽은 통계 (열거나 건너뛴 파일, 바이트, 줄)
+        """
+        self.claude_dir = claude_dir or default_claude_dir()
         self.history_file = self.claude_dir / "history.jsonl"
         self.projects_dir = self.claude_dir / "projects"
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.use_cache = use_cache
+        self.transcript_index = TranscriptIndex(self.cache_dir / "transcript_index")
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.json_backend = get_backend(json_backend).name
+        self.stats = ParseStats()
+
+    def get_sessions_by_date(self, window: DayWindow) -> dict[str, dict[str, set[str]]]:
+        """
+        history.jsonl에서 구간 안 세션 ID들을 로컬 날짜별, 프로젝트별로 수집
+
+        use_cache가 켜져 있으면 체크포인트 이후에 추가된 부분만 읽고,
+        꺼져 있으면 timestamp 이진 탐색으로 해당 구간만 읽습니다.
+
+        Args:
+            window: 수집 구간
+
+        Returns:
+            dict[날짜 키(YYYY-MM-DD), dict[project_path, set[session_ids]]]
+        """
+        if not self.history_file.exists():
+            print(f"[경고] history.jsonl 파일이 없습니다: {self.history_file}")
+            return {}
+
+        loads = get_backend(self.json_backend).loads
+
+        if self.use_cache:
+            checkpoint = HistoryCheckpoint(self.cache_dir / "history_checkpoint.json", loads=loads)
+            sessions_by_date = checkpoint.refresh(self.history_file)
+            return {
+                day: sessions_by_date[day]
+                for day in window.date_keys()
+                if day in sessions_by_date
+            }
+
+        return scan_history_by_date(self.history_file, window.start_ms, window.end_ms, loads=loads)
 
     def get_today_sessions(self, target_date: datetime) -> dict[str, set[str]]:
         """
@@ -58,34 +599,9 @@ class ConversationCollector:
             dict[project_path, set[session_ids]]
         """
         sessions_by_project: dict[str, set[str]] = {}
-
-        if not self.history_file.exists():
-            print(f"[경고] history.jsonl 파일이 없습니다: {self.history_file}")
-            return sessions_by_project
-
-        # 타겟 날짜의 시작/끝 타임스탬프 (밀리초)
-        day_start = datetime.combine(target_date.date(), datetime.min.time())
-        day_end = day_start + timedelta(days=1)
-        start_ts = int(day_start.timestamp() * 1000)
-        end_ts = int(day_end.timestamp() * 1000)
-
-        with open(self.history_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                    ts = entry.get('timestamp', 0)
-                    if start_ts <= ts < end_ts:
-                        project = entry.get('project', '')
-                        session_id = entry.get('sessionId', '')
-                        if project and session_id:
-                            if project not in sessions_by_project:
-                                sessions_by_project[project] = set()
-                            sessions_by_project[project].add(session_id)
-                except json.JSONDecodeError:
-                    continue
-
+        for projects in self.get_sessions_by_date(DayWindow.for_date(target_date)).values():
+            for project, session_ids in projects.items():
+                sessions_by_project.setdefault(project, set()).update(session_ids)
         return sessions_by_project
 
     def encode_project_path(self, project_path: str) -> str:
@@ -93,14 +609,19 @@ class ConversationCollector:
         # Claude는 '/'를 '-'로 변환하여 디렉토리명으로 사용
         return project_path.replace('/', '-')
 
-    def collect_project_conversations(
+    def select_agent_files(
         self,
         project_path: str,
         session_ids: set[str],
         target_date: datetime
-    ) -> list[Conversation]:
+    ) -> list[Path]:
         """
-        특정 프로젝트의 agent-*.jsonl 파일에서 대화 수집
+        특정 프로젝트에서 대상 날짜의 대화를 담고 있을 수 있는 agent-*.jsonl 파일 선택
+
+        날짜 시작 전에 수정이 멈춘 파일은 열지 않습니다. use_cache가 켜져 있으면 인덱스로
+        session_ids를 포함하고 timestamp 범위가 날짜와 겹치는 파일만 고르고, 꺼져 있으면
+        수정 시각으로만 고른 뒤 세션은 파일을 읽으면서 확인합니다.
+        session_ids가 비어 있으면 세션으로 거르지 않습니다.
 
         Args:
             project_path: 프로젝트 절대 경로
@@ -108,94 +629,75 @@ class ConversationCollector:
             target_date: 대상 날짜
 
         Returns:
-            수집된 Conversation 리스트
+            파일명 순으로 정렬된 agent 파일 경로 리스트
+        """
+        return [
+            stream.agent_file for stream in
+            self._select_streams(project_path, session_ids, DayWindow.for_date(target_date))
+        ]
+
+    def _select_streams(
+        self,
+        project_path: str,
+        session_ids: set[str],
+        window: DayWindow
+    ) -> list[AgentFileStream]:
+        """
+        window 구간의 대화를 담고 있을 수 있는 agent 파일 스트림 (파일명 순)
+
+        인덱스가 없으면(use_cache=False) 파일을 미리 훑지 않고, 스트림이 읽으면서
+        인덱스와 같은 기준으로 세션을 확인하므로 각 파일을 한 번만 읽습니다.
+        어느 쪽이든 스트림의 sessions에 파일의 세션 ID들이 들어 있습니다 (인덱스가 없으면 반복 후).
         """
-        conversations: list[Conversation] = []
         encoded_path = self.encode_project_path(project_path)
         project_dir = self.projects_dir / encoded_path
 
         if not project_dir.exists():
             print(f"[경고] 프로젝트 디렉토리가 없습니다: {project_dir}")
-            return conversations
-
-        # 타겟 날짜 범위 (UTC 기준)
-        day_start = datetime.combine(target_date.date(), datetime.min.time())
-        day_end = day_start + timedelta(days=1)
-
-        # agent-*.jsonl 파일들 처리
-        for agent_file in project_dir.glob("agent-*.jsonl"):
-            agent_id = agent_file.stem.replace('agent-', '')
-            conversation = Conversation(
-                project=project_path,
-                session_id="",
-                agent_id=agent_id
+            return []
+
+        if self.use_cache:
+            entries, candidates = self.transcript_index.select_entries(
+                project_dir, session_ids, window.start_ms, window.end_ms
             )
+            streams = [
+                AgentFileStream(agent_file, project_path, window, self.json_backend,
+                                sessions=frozenset(sessions))
+                for agent_file, sessions in entries
+            ]
+        else:
+            agent_files, candidates = recent_files(project_dir, window.start_ms * 1_000_000)
+            streams = [
+                AgentFileStream(agent_file, project_path, window, self.json_backend,
+                                session_ids=frozenset(session_ids))
+                for agent_file in agent_files
+            ]
+
+        self.stats.files_skipped += candidates - len(streams)
+        return streams
 
-            try:
-                with open(agent_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            entry = json.loads(line)
-
-                            # 세션 ID 추출
-                            entry_session = entry.get('sessionId', '')
-                            if not conversation.session_id and entry_session:
-                                conversation.session_id = entry_session
-
-                            # 타임스탬프 파싱 (ISO 8601 형식)
-                            ts_str = entry.get('timestamp', '')
-                            if not ts_str:
-                                continue
-
-                            # ISO 8601 파싱
-                            ts = self._parse_timestamp(ts_str)
-                            if ts is None:
-                                continue
-
-                            # 타겟 날짜 필터링 (로컬 시간 기준)
-                            ts_local = ts.replace(tzinfo=None)
-                            if not (day_start <= ts_local < day_end):
-                                continue
-
-                            # 메시지 타입 확인
-                            msg_type = entry.get('type', '')
-                            message_data = entry.get('message', {})
-
-                            if msg_type in ('user', 'assistant'):
-                                role = message_data.get('role', msg_type)
-                                content_parts = message_data.get('content', [])
-
-                                # 텍스트 콘텐츠 추출
-                                text_content = self._extract_text_content(content_parts)
-
-                                if text_content and len(text_content.strip()) > 0:
-                                    msg = Message(
-                                        role=role,
-                                        content=text_content,
-                                        timestamp=ts,
-                                        project=project_path,
-                                        session_id=entry_session
-                                    )
-                                    conversation.messages.append(msg)
-
-                        except (json.JSONDecodeError, KeyError, ValueError) as e:
-                            continue
-
-            except IOError as e:
-                print(f"[경고] 파일 읽기 오류: {agent_file}: {e}")
-                continue
+    def collect_project_conversations(
+        self,
+        project_path: str,
+        session_ids: set[str],
+        target_date: datetime
+    ) -> list[Conversation]:
+        """
+        특정 프로젝트의 agent-*.jsonl 파일에서 대화 수집
 
-            if conversation.messages:
-                conversation.messages.sort(key=lambda m: m.timestamp)
-                conversation.start_time = conversation.messages[0].timestamp
-                conversation.end_time = conversation.messages[-1].timestamp
-                conversations.append(conversation)
+        Args:
+            project_path: 프로젝트 절대 경로
+            session_ids: 수집할 세션 ID 세트
+            target_date: 대상 날짜
 
-        return conversations
+        Returns:
+            수집된 Conversation 리스트
+        """
+        window = DayWindow.for_date(target_date)
+        return self._group_by_stream(self._select_streams(project_path, session_ids, window))
 
-    def _parse_timestamp(self, ts_str: str) -> Optional[datetime]:
+    @staticmethod
+    def _parse_timestamp(ts_str: str) -> Optional[datetime]:
         """ISO 8601 타임스탬프 파싱"""
         try:
             # 'Z' 를 '+00:00'으로 변환
@@ -204,7 +706,8 @@ class ConversationCollector:
         except ValueError:
             return None
 
-    def _extract_text_content(self, content_parts) -> str:
+    @staticmethod
+    def _extract_text_content(content_parts) -> str:
         """메시지 content에서 텍스트만 추출"""
         if isinstance(content_parts, str):
             return content_parts
@@ -224,65 +727,392 @@ class ConversationCollector:
 
         return '\n'.join(texts)
 
-    def collect_all(self, target_date: datetime) -> list[Conversation]:
+    def iter_agent_streams(self, target_date: datetime) -> list[AgentFileStream]:
         """
-        특정 날짜의 모든 대화 수집
+        특정 날짜의 대화를 담고 있을 수 있는 모든 agent 파일 스트림
+
+        history.jsonl에서 세션을 찾고 프로젝트별로 파일을 고르는 단계까지만 수행하며,
+        파일 내용은 스트림을 반복할 때 읽힙니다.
 
         Args:
             target_date: 수집할 날짜
 
         Returns:
-            모든 프로젝트의 Conversation 리스트
+            프로젝트 순서, 파일명 순서의 AgentFileStream 리스트
         """
-        all_conversations: list[Conversation] = []
-
         # history.jsonl에서 오늘 세션 정보 수집
         sessions_by_project = self.get_today_sessions(target_date)
 
         print(f"[정보] {len(sessions_by_project)}개 프로젝트에서 대화 발견")
 
+        window = DayWindow.for_date(target_date)
+        streams: list[AgentFileStream] = []
         for project_path, session_ids in sessions_by_project.items():
             print(f"  - {Path(project_path).name}: {len(session_ids)}개 세션")
-            conversations = self.collect_project_conversations(
-                project_path, session_ids, target_date
+            streams.extend(self._select_streams(project_path, session_ids, window))
+
+        return streams
+
+    def iter_messages(self, target_date: datetime) -> Iterator[Message]:
+        """
+        특정 날짜의 모든 메시지를 timestamp 순으로 흘려보냄
+
+        파일별 스트림을 merge_sorted로 합치므로 동시에 여는 파일은 MAX_OPEN_STREAMS개 이하이고,
+        메모리 사용량은 하루치 데이터 크기가 아니라 그 수에 비례합니다. 파일이 더 많으면
+        나눠서 병합한 중간 결과를 임시 파일에 씁니다. 파일 읽기 오류는 그대로 전파됩니다.
+
+        Args:
+            target_date: 수집할 날짜
+
+        Yields:
+            timestamp 순 Message
+        """
+        for _, msg in self._merge_streams(self.iter_agent_streams(target_date)):
+            yield msg
+
+    def _merge_streams(self, streams: list[AgentFileStream]) -> Iterator[tuple[int, Message]]:
+        """
+        스트림들의 메시지를 (스트림 번호, Message)로 timestamp 순 병합
+
+        iter_messages, collect_all, collect_range가 모두 이 병합 결과를 씁니다.
+        workers가 2 이상이면 파일을 프로세스 풀에서 읽은 뒤 파일별 메시지 리스트를 병합합니다
+        (이때는 메모리 사용량이 파일 크기에 비례). 읽기 통계는 다 읽으면 stats에 더해집니다.
+        """
+        parallel = self.workers > 1 and len(streams) > 1
+        sources = self._map_streams(list, streams) if parallel else streams
+        try:
+            yield from merge_sorted(
+                [_tag_messages(index, source) for index, source in enumerate(sources)],
+                key=lambda item: item[1].timestamp_ms
             )
-            all_conversations.extend(conversations)
+        finally:
+            if not parallel:
+                for stream in streams:
+                    self.stats.add(stream.stats)
+
+    def collect_all(self, target_date: datetime) -> list[Conversation]:
+        """
+        특정 날짜의 모든 대화 수집 (iter_messages와 같은 병합 결과를 파일별로 묶음)
+
+        Args:
+            target_date: 수집할 날짜
+
+        Returns:
+            모든 프로젝트의 Conversation 리스트
+        """
+        all_conversations = self._group_by_stream(self.iter_agent_streams(target_date))
 
         # 시작 시간순 정렬
         all_conversations.sort(key=lambda c: c.start_time or datetime.min)
 
         return all_conversations
 
-    def format_for_summary(self, conversations: list[Conversation]) -> str:
+    def _group_by_stream(self, streams: list[AgentFileStream]) -> list[Conversation]:
+        """병합된 메시지를 파일별 Conversation으로 묶음 (스트림 순서, 메시지가 없는 파일은 제외)"""
+        messages_by_stream: dict[int, list[Message]] = {}
+        for index, msg in self._merge_streams(streams):
+            messages_by_stream.setdefault(index, []).append(msg)
+        return [
+            streams[index]._make_conversation(messages)
+            for index, messages in sorted(messages_by_stream.items())
+        ]
+
+    def collect_range(self, start_date: datetime, end_date: datetime) -> dict[date, list[Conversation]]:
         """
-        AI 요약을 위한 텍스트 포맷
+        여러 날짜의 대화를 한 번에 수집
+
+        history.jsonl과 각 agent 파일을 구간 전체에 대해 한 번씩만 읽고,
+        메시지를 로컬 날짜별로 나눕니다. 각 날짜의 결과는 collect_all(그 날짜)와 같습니다.
+
+        Args:
+            start_date: 시작 날짜 (포함)
+            end_date: 끝 날짜 (포함)
+
+        Returns:
+            dict[날짜, 그 날짜의 Conversation 리스트] (대화가 없는 날짜도 빈 리스트로 포함)
+
+        Raises:
+            ValueError: end_date가 start_date보다 앞선 경우
+        """
+        days = (end_date.date() - start_date.date()).days + 1
+        if days < 1:
+            raise ValueError(f"종료 날짜가 시작 날짜보다 앞섭니다: {start_date:%Y-%m-%d} > {end_date:%Y-%m-%d}")
+
+        window = DayWindow.for_date(start_date, days)
+        day_keys = window.date_keys()
+        dates = [start_date.date() + timedelta(days=i) for i in range(days)]
+
+        sessions_by_date = self.get_sessions_by_date(window)
+        sessions_by_project: dict[str, set[str]] = {}
+        for projects in sessions_by_date.values():
+            for project_path, session_ids in projects.items():
+                sessions_by_project.setdefault(project_path, set()).update(session_ids)
+
+        print(f"[정보] {day_keys[0]} ~ {day_keys[-1]}: {len(sessions_by_project)}개 프로젝트에서 대화 발견")
+
+        streams: list[AgentFileStream] = []
+        for project_path, session_ids in sessions_by_project.items():
+            print(f"  - {Path(project_path).name}: {len(session_ids)}개 세션")
+            streams.extend(self._select_streams(project_path, session_ids, window))
+
+        # iter_messages와 같은 병합 결과를 (파일, 로컬 날짜)별로 묶음
+        day_starts = window.day_starts_ms()
+        buckets: dict[tuple[int, int], list[Message]] = {}
+        for index, msg in self._merge_streams(streams):
+            day_index = max(bisect.bisect_right(day_starts, msg.timestamp_ms) - 1, 0)
+            buckets.setdefault((index, day_index), []).append(msg)
+
+        conversations_by_date: dict[date, list[Conversation]] = {d: [] for d in dates}
+        for (index, day_index), messages in sorted(buckets.items()):
+            stream = streams[index]
+            # 하루 단위 수집과 같은 기준: 그날 활동한 프로젝트의, 그날 세션이 든 파일만
+            day_sessions = sessions_by_date.get(day_keys[day_index], {}).get(stream.project_path)
+            if not day_sessions:
+                continue
+            if day_sessions.isdisjoint(stream.sessions):
+                continue
+            conversations_by_date[dates[day_index]].append(stream._make_conversation(messages))
+
+        for conversations in conversations_by_date.values():
+            conversations.sort(key=lambda c: c.start_time or datetime.min)
+
+        return conversations_by_date
+
+    def _map_streams(
+        self,
+        method: Callable[[AgentFileStream], Any],
+        streams: list[AgentFileStream]
+    ) -> list:
+        """
+        스트림마다 method(stream)를 실행하고 읽기 통계를 stats에 더함
+
+        workers가 2 이상이면 파일 단위로 프로세스 풀에 분배합니다. map은 입력 순서대로
+        결과를 돌려주므로 직렬 경로와 같은 순서로 병합됩니다.
+        """
+        if self.workers > 1 and len(streams) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(streams))) as executor:
+                chunksize = max(1, len(streams) // (self.workers * 4))
+                outputs = list(executor.map(
+                    _run_stream, [method] * len(streams), streams, chunksize=chunksize
+                ))
+            for stream, (_, done) in zip(streams, outputs):
+                stream.session_id = done.session_id
+                stream.sessions = done.sessions
+                stream.stats = done.stats
+            results = [result for result, _ in outputs]
+        else:
+            results = [method(stream) for stream in streams]
+
+        for stream in streams:
+            self.stats.add(stream.stats)
+        return results
+
+    def iter_summary_parts(
+        self,
+        conversations: Iterable[Conversation],
+        show_date: bool = False
+    ) -> Iterator[str]:
+        """
+        AI 요약용 텍스트를 조각 단위로 생성 (format_for_summary의 스트리밍 버전)
+
+        Args:
+            conversations: 포맷할 Conversation들
+            show_date: 시간 앞에 날짜(MM-DD)도 표시 (여러 날짜를 한 번에 요약할 때)
+
+        Yields:
+            줄 단위 텍스트 조각 ('\n'으로 이으면 format_for_summary 결과와 같음)
+        """
+        return self._iter_selected_parts(
+            ((conv, conv.messages) for conv in conversations), show_date
+        )
+
+    def _iter_selected_parts(
+        self,
+        selected: Iterable[tuple[Conversation, list[Message]]],
+        show_date: bool
+    ) -> Iterator[str]:
+        """(대화, 포함할 메시지들) 쌍을 요약용 텍스트 조각으로 변환"""
+        time_format = '%m-%d %H:%M' if show_date else '%H:%M'
+        for conv, messages in selected:
+            yield from self._header_parts(conv, time_format, len(conv.messages) - len(messages))
+            for msg in messages:
+                yield from self._message_parts(msg)
+
+    @staticmethod
+    def _header_parts(conv: Conversation, time_format: str, omitted: int = 0) -> tuple[str, ...]:
+        """대화 하나의 헤더 줄들"""
+        project_name = Path(conv.project).name
+        start_str = conv.start_time.strftime(time_format) if conv.start_time else 'N/A'
+        end_str = conv.end_time.strftime(time_format) if conv.end_time else 'N/A'
+        count = f"메시지 수: {len(conv.messages)}개"
+        if omitted:
+            count += f" (예산 초과로 {omitted}개 생략)"
+        return (
+            f"\n## 프로젝트: {project_name}",
+            f"시간: {start_str} ~ {end_str}",
+            count,
+            "-" * 50,
+        )
+
+    @staticmethod
+    def _message_parts(msg: Message) -> tuple[str, str]:
+        """메시지 하나의 줄들"""
+        role_label = "사용자" if msg.role == 'user' else "Claude"
+        # 너무 긴 메시지는 잘라서 표시
+        content = msg.content[:MESSAGE_CHAR_LIMIT] if len(msg.content) > MESSAGE_CHAR_LIMIT else msg.content
+        return f"\n### {role_label}:", content
+
+    @staticmethod
+    def _policy_order(conversations: list[Conversation], policy: str) -> Iterator[tuple[int, int]]:
+        """정책에 따른 (대화 인덱스, 메시지 인덱스) 우선순위"""
+        if policy == 'sequential':
+            for ci, conv in enumerate(conversations):
+                for mi in range(len(conv.messages)):
+                    yield ci, mi
+        elif policy == 'round-robin':
+            longest = max((len(conv.messages) for conv in conversations), default=0)
+            for mi in range(longest):
+                for ci, conv in enumerate(conversations):
+                    if mi < len(conv.messages):
+                        yield ci, mi
+        elif policy == 'user-first':
+            for want_user in (True, False):
+                for ci, conv in enumerate(conversations):
+                    for mi, msg in enumerate(conv.messages):
+                        if (msg.role == 'user') == want_user:
+                            yield ci, mi
+        elif policy == 'recent-first':
+            recent = sorted(
+                range(len(conversations)),
+                key=lambda ci: conversations[ci].start_time or datetime.min,
+                reverse=True
+            )
+            for ci in recent:
+                for mi in range(len(conversations[ci].messages)):
+                    yield ci, mi
+        else:
+            raise ValueError(f"알 수 없는 요약 정책: {policy} (사용 가능: {', '.join(SUMMARY_POLICIES)})")
+
+    def select_for_summary(
+        self,
+        conversations: Iterable[Conversation],
+        budget: int,
+        policy: str = 'sequential',
+        measure: Callable[[str], int] = len,
+        show_date: bool = False
+    ) -> tuple[list[tuple[Conversation, list[Message]]], SummaryReport]:
+        """
+        예산 안에 들어가는 메시지를 정책에 따라 고름
+
+        우선순위대로 메시지를 하나씩 넣다가 처음으로 예산을 넘는 메시지에서 멈춥니다.
+        대화 헤더는 그 대화의 메시지가 처음 들어갈 때 함께 계산합니다.
+
+        Args:
+            conversations: 대상 Conversation들
+            budget: 최대 사용량 (measure 단위)
+            policy: SUMMARY_POLICIES 중 하나
+            measure: 텍스트 조각의 크기 (기본값: 글자 수, 토큰 추정 함수도 가능)
+            show_date: 시간 앞에 날짜도 표시
+
+        Returns:
+            ([(대화, 시간순으로 포함된 메시지들)] (원래 대화 순서), SummaryReport)
+
+        Raises:
+            ValueError: 알 수 없는 정책
+        """
+        conversations = list(conversations)
+        time_format = '%m-%d %H:%M' if show_date else '%H:%M'
+        chosen: list[list[int]] = [[] for _ in conversations]
+        report = SummaryReport(budget=budget)
+
+        def cost(parts: Iterable[str]) -> int:
+            # '\n'.join 결과 기준으로 조각마다 줄바꿈 하나씩
+            return sum(measure(part) + 1 for part in parts)
+
+        for ci, mi in self._policy_order(conversations, policy):
+            conv = conversations[ci]
+            needed = cost(self._message_parts(conv.messages[mi]))
+            if not chosen[ci]:
+                # 생략 표시가 붙는 경우까지 포함해 넉넉하게 계산 (결과가 예산을 넘지 않도록)
+                needed += cost(self._header_parts(conv, time_format, omitted=len(conv.messages)))
+            if report.used + needed > budget:
+                break
+            chosen[ci].append(mi)
+            report.used += needed
+
+        selected = []
+        for conv, indices in zip(conversations, chosen):
+            if indices:
+                indices.sort()
+                selected.append((conv, [conv.messages[mi] for mi in indices]))
+                report.included_conversations += 1
+            else:
+                report.omitted_conversations += 1
+            report.included_messages += len(indices)
+            report.omitted_messages += len(conv.messages) - len(indices)
+
+        return selected, report
+
+    def format_for_summary_with_report(
+        self,
+        conversations: list[Conversation],
+        budget: Optional[int] = None,
+        policy: str = 'sequential',
+        measure: Callable[[str], int] = len,
+        show_date: bool = False
+    ) -> tuple[str, SummaryReport]:
+        """
+        예산 안에서 AI 요약용 텍스트를 만들고, 무엇이 생략되었는지 함께 반환
+
+        예산을 넘는 부분은 아예 포맷하지 않습니다. budget이 None이면
+        format_for_summary와 같은 전체 텍스트를 반환합니다.
 
         Args:
             conversations: 포맷할 Conversation 리스트
+            budget: 최대 사용량 (measure 단위, None이면 제한 없음)
+            policy: SUMMARY_POLICIES 중 하나
+            measure: 텍스트 조각의 크기 (기본값: 글자 수)
+            show_date: 시간 앞에 날짜도 표시
 
         Returns:
-            포맷된 문자열
+            (포맷된 문자열, SummaryReport)
         """
-        output_parts = []
+        if budget is None:
+            text = '\n'.join(self.iter_summary_parts(conversations, show_date))
+            total = sum(len(conv.messages) for conv in conversations)
+            return text, SummaryReport(
+                budget=None,
+                used=measure(text),
+                included_messages=total,
+                included_conversations=len(conversations),
+            )
 
-        for conv in conversations:
-            project_name = Path(conv.project).name
-            start_str = conv.start_time.strftime('%H:%M') if conv.start_time else 'N/A'
-            end_str = conv.end_time.strftime('%H:%M') if conv.end_time else 'N/A'
+        selected, report = self.select_for_summary(conversations, budget, policy, measure, show_date)
+        return '\n'.join(self._iter_selected_parts(selected, show_date)), report
 
-            output_parts.append(f"\n## 프로젝트: {project_name}")
-            output_parts.append(f"시간: {start_str} ~ {end_str}")
-            output_parts.append(f"메시지 수: {len(conv.messages)}개")
-            output_parts.append("-" * 50)
+    def format_for_summary(
+        self,
+        conversations: list[Conversation],
+        show_date: bool = False,
+        budget: Optional[int] = None,
+        policy: str = 'sequential'
+    ) -> str:
+        """
+        AI 요약을 위한 텍스트 포맷
 
-            for msg in conv.messages:
-                role_label = "사용자" if msg.role == 'user' else "Claude"
-                # 너무 긴 메시지는 잘라서 표시
-                content = msg.content[:3000] if len(msg.content) > 3000 else msg.content
-                output_parts.append(f"\n### {role_label}:")
-                output_parts.append(content)
+        Args:
+            conversations: 포맷할 Conversation 리스트
+            show_date: 시간 앞에 날짜(MM-DD)도 표시
+            budget: 최대 글자 수 (선택, 넘는 메시지는 policy에 따라 생략)
+            policy: 예산이 있을 때 우선순위 정책 (SUMMARY_POLICIES)
 
-        return '\n'.join(output_parts)
+        Returns:
+            포맷된 문자열
+        """
+        text, _ = self.format_for_summary_with_report(
+            conversations, budget=budget, policy=policy, show_date=show_date
+        )
+        return text
 
     def get_statistics(self, conversations: list[Conversation]) -> dict:
         """대화 통계 생성"""
@@ -293,7 +1123,7 @@ class ConversationCollector:
         )
         assistant_messages = total_messages - user_messages
 
-        projects = list(set(c.project for c in conversations))
+        projects = sorted(set(c.project for c in conversations))
 
         return {
             'total_conversations': len(conversations),
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+LLM 응답 디스크 캐시
+
+같은 (model, prompt, max_tokens) 요청에는 같은 응답을 재사용합니다. 같은 날짜를 다시
+발행할 때(푸시 실패 후 재실행, 템플릿 수정 등) API를 다시 호출하지 않기 위한 것입니다.
+
+저장 위치: .cache/completions/{키 앞 2글자}/{sha256 키}.json
+    {"model": str, "max_tokens": int, "created": float, "content": str}
+
+SessionSummaryCache는 같은 방식으로 대화 세션(Conversation) 하나의 요약을 저장합니다.
+긴 하루를 나눠서 요약할 때 세션 단위로 요약하므로, 다시 발행할 때는 새로 생기거나
+내용이 바뀐 세션만 요약을 요청합니다.
+
+저장 위치: .cache/session-summaries/{키 앞 2글자}/{sha256 키}.json
+    {"model": str, "project": str, "session_id": str, "created": float, "content": str}
+
+적중 시 파일 mtime을 갱신하므로 mtime이 곧 마지막 사용 시각입니다. 조회와 정리 모두
+이 시각 하나로 나이를 재어, max_age_days 동안 사용되지 않은 항목은 사용하지 않고 정리 때
+지웁니다. 정리는 실행 중 처음 저장할 때와 그 뒤 EVICT_INTERVAL번 저장할 때마다 한 번씩
+캐시 디렉토리를 훑어, 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .state import DEFAULT_CACHE_DIR, atomic_write_text, load_json_state
+
+# 기본 최대 크기 (바이트)
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# 기본 최대 보관 기간 (일)
+DEFAULT_MAX_AGE_DAYS = 30
+
+# 이 횟수만큼 저장할 때마다 정리 (저장할 때마다 디렉토리 전체를 훑지 않도록)
+EVICT_INTERVAL = 100
+
+
+def completion_key(model: str, prompt: str, max_tokens: int) -> str:
+    """(model, prompt, max_tokens)의 sha256 키"""
+    payload = json.dumps([model, max_tokens, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def session_summary_key(model: str, prompts: Sequence[str], max_tokens: int) -> str:
+    """
+    세션 요약 키: 세션의 조각별 요약 프롬프트들의 sha256
+
+    프롬프트에는 세션의 메시지 내용이 그대로 들어가므로, 메시지가 추가되거나 바뀌면
+    (또는 프롬프트 형식이 바뀌면) 키가 달라집니다.
+    """
+    payload = json.dumps([model, max_tokens, list(prompts)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CompletionCache:
+    """
+    내용 주소 기반 LLM 응답 캐시
+
+    Attributes:
+        hits: 이번 실행에서 캐시 적중 수
+        misses: 이번 실행에서 캐시 미스 수
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본값: 저장소의 .cache/completions)
+            max_bytes: 전체 캐시 최대 크기
+            max_age_days: 항목 최대 보관 기간
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR / "completions"
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, model: str, prompt: str, max_tokens: int) -> Optional[str]:
+        """캐시된 응답 (없거나 만료되었으면 None)"""
+        return self._load(completion_key(model, prompt, max_tokens))
+
+    def put(self, model: str, prompt: str, max_tokens: int, content: str) -> None:
+        """응답 저장 (정리 주기가 되었으면 한도를 넘은 항목 정리)"""
+        self._store(completion_key(model, prompt, max_tokens), {
+            'model': model,
+            'max_tokens': max_tokens,
+            'content': content,
+        })
+
+    def _load(self, key: str) -> Optional[str]:
+        """키에 저장된 content (없거나 max_age_days 동안 사용되지 않았으면 None)"""
+        path = self._path(key)
+        try:
+            expired = time.time() - path.stat().st_mtime > self.max_age_seconds
+        except OSError:
+            expired = True
+        entry = None if expired else load_json_state(path, default=None)
+
+        if not isinstance(entry, dict) or not isinstance(entry.get('content'), str):
+            self.misses += 1
+            return None
+
+        try:
+            # 마지막 사용 시각 갱신 (크기 초과 시 오래 안 쓴 항목부터 삭제)
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return entry['content']
+
+    def _store(self, key: str, entry: dict) -> None:
+        """항목에 생성 시각을 붙여 원자적으로 저장 (처음과 EVICT_INTERVAL번째 저장마다 정리)"""
+        atomic_write_text(self._path(key), json.dumps(
+            {**entry, 'created': time.time()}, ensure_ascii=False
+        ))
+        if self._stores % EVICT_INTERVAL == 0:
+            self.evict()
+        self._stores += 1
+
+    def evict(self) -> int:
+        """
+        max_age_days 동안 사용되지 않은 항목을 지우고, 전체 크기가 max_bytes 이하가 될 때까지
+        오래 안 쓴 항목 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        now = time.time()
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        removed = 0
+        total = 0
+        kept = []
+        for mtime, size, path in entries:
+            if now - mtime > self.max_age_seconds:
+                removed += self._remove(path)
+            else:
+                kept.append((mtime, size, path))
+                total += size
+
+        kept.sort()
+        for mtime, size, path in kept:
+            if total <= self.max_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+
+        return removed
+
+    @staticmethod
+    def _remove(path: Path) -> int:
+        try:
+            path.unlink()
+            return 1
+        except OSError:
+            return 0
+
+    def summary(self) -> str:
+        """적중/미스 요약 문자열"""
+        return f"LLM 캐시: 적중 {self.hits}회, 미스 {self.misses}회"
+
+
+class SessionSummaryCache(CompletionCache):
+    """
+    세션별 요약 캐시
+
+    hits는 저장된 요약을 재사용한 세션 수, misses는 새로 요약한 세션 수입니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본값: 저장소의 .cache/session-summaries)
+            max_bytes: 전체 캐시 최대 크기
+            max_age_days: 항목 최대 보관 기간
+        """
+        super().__init__(
+            cache_dir or DEFAULT_CACHE_DIR / "session-summaries", max_bytes, max_age_days
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """session_summary_key로 저장된 세션 요약 (없거나 만료되었으면 None)"""
+        return self._load(key)
+
+    def put(self, key: str, content: str, model: str, project: str, session_id: str) -> None:
+        """세션 요약 저장 (model, project, session_id는 확인용으로 함께 기록)"""
+        self._store(key, {
+            'model': model,
+            'project': project,
+            'session_id': session_id,
+            'content': content,
+        })
+
+    def summary(self) -> str:
+        """재사용/새 요약 세션 수 요약 문자열"""
+        return f"세션 요약 캐시: 재사용 {self.hits}개, 새로 요약 {self.misses}개"
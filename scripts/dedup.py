@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+요약 전 중복 메시지 제거
+
+대화 기록에는 같은 파일을 다시 붙여 넣은 메시지, 다시 시도한 프롬프트, 앞의 출력을
+되풀이하는 응답처럼 거의 같은 내용이 많습니다. format_for_summary 전에 이런 메시지를
+걸러 프롬프트 토큰과 지연 시간을 줄입니다.
+
+방법:
+(format_for_summary처럼 메시지마다 앞 MESSAGE_CHAR_LIMIT글자만 비교합니다)
+1. 공백을 정규화한 내용이 완전히 같은 메시지는 해시 조회로 제거
+2. 나머지는 단어 3-gram 슁글로 one-permutation MinHash 서명을 만들고,
+   LSH 밴드 버킷에서 후보를 찾은 뒤 서명으로 추정한 Jaccard 유사도가 threshold 이상이면 제거
+
+먼저 나온 메시지를 남기고 뒤에 나온 중복을 지우며, 같은 역할(user/assistant)끼리만
+비교합니다. 메시지 하나당 슁글 수에 비례하는 시간이 들고, 남긴 메시지마다 서명(정수 64개)만
+보관하며, 후보 검증은 같은 밴드 값을 공유하는 메시지로 한정되므로 하루 수만 개 메시지도
+처리할 수 있습니다. 모든 해시가 결정적이라 실행마다 결과가 같습니다(프롬프트 캐시 키 유지).
+"""
+
+import bisect
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable, Optional
+
+from .collect_conversations import MESSAGE_CHAR_LIMIT, Conversation, Message
+
+# 기본 유사도 기준 (Jaccard)
+DEFAULT_THRESHOLD = 0.8
+
+# 이보다 단어 수가 적은 메시지는 비교하지 않음 ("계속", "ok" 같은 짧은 메시지 보존)
+MIN_WORDS = 20
+
+# MinHash 서명 길이 (one-permutation hashing의 버킷 수)
+NUM_BUCKETS = 64
+
+# (밴드 수, 밴드당 행 수) 후보: 유사도 곡선 중간점 (1/b)^(1/r)가 기준보다 충분히 낮은 것 중
+# 행이 가장 많은 설정을 고름
+_BAND_LAYOUTS = ((8, 8), (16, 4), (32, 2))
+
+# 내장 해시 값의 최솟값 (64비트 부호 있는 정수)
+_HASH_MIN = -(1 << 63)
+
+
+@dataclass
+class DedupReport:
+    """중복 제거 결과"""
+    messages: int = 0
+    exact_removed: int = 0
+    near_removed: int = 0
+    bytes_saved: int = 0
+    tokens_saved: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.exact_removed + self.near_removed
+
+    def summary(self) -> str:
+        """제거 내역 요약 문자열"""
+        return (
+            f"중복 메시지 {self.removed}개 제거 (완전 일치 {self.exact_removed}개, "
+            f"유사 {self.near_removed}개 / 전체 {self.messages}개), "
+            f"{self.bytes_saved:,}바이트, 약 {self.tokens_saved:,}토큰 절약"
+        )
+
+
+def word_hash(word: str) -> int:
+    """단어의 crc32 (실행마다 같은 값이 나오도록 내장 str 해시 대신 사용)"""
+    return zlib.crc32(word.encode('utf-8'))
+
+
+def shingles(words: list[str], hash_word: Callable[[str], int] = word_hash) -> set[int]:
+    """
+    단어 3-gram 슁글의 64비트 해시 집합
+
+    정수 튜플의 내장 해시는 PYTHONHASHSEED와 무관하게 항상 같으므로, 단어를 crc32로
+    바꾼 뒤 3개씩 묶은 튜플을 해시합니다 (반복이 모두 C 수준에서 돌아 빠름).
+    """
+    hashes = list(map(hash_word, words))
+    return set(map(hash, zip(hashes, hashes[1:], hashes[2:])))
+
+
+def minhash_signature(shingle_set: set[int], num_buckets: int = NUM_BUCKETS) -> list[int]:
+    """
+    one-permutation MinHash 서명
+
+    64비트 해시 공간을 num_buckets개 구간으로 나누고 구간별 최솟값을 서명으로 씁니다.
+    슁글 해시를 한 번 정렬한 뒤 구간 경계마다 이진 탐색하므로 파이썬 반복은 버킷 수만큼만
+    돕니다. 빈 버킷은 오른쪽으로 가장 가까운 채워진 버킷 값을 빌려 채웁니다(densification).
+    """
+    ordered = sorted(shingle_set)
+    width = (1 << 64) // num_buckets
+    mins: list[Optional[int]] = []
+    for bucket in range(num_buckets):
+        low = _HASH_MIN + bucket * width
+        pos = bisect.bisect_left(ordered, low)
+        if pos < len(ordered) and ordered[pos] < low + width:
+            mins.append(ordered[pos])
+        else:
+            mins.append(None)
+
+    if not ordered or None not in mins:
+        return mins
+
+    signature = list(mins)
+    for bucket in range(num_buckets):
+        if signature[bucket] is None:
+            # 오른쪽(순환)으로 가장 가까운 채워진 버킷, 거리만큼 값을 달리해 충돌 방지
+            for distance in range(1, num_buckets):
+                source = mins[(bucket + distance) % num_buckets]
+                if source is not None:
+                    signature[bucket] = source + (distance << 64)
+                    break
+    return signature
+
+
+def _band_layout(threshold: float, num_buckets: int = NUM_BUCKETS) -> tuple[int, int]:
+    """기준 유사도에 맞는 (밴드 수, 행 수)"""
+    for bands, rows in _BAND_LAYOUTS:
+        if bands * rows == num_buckets and (1 / bands) ** (1 / rows) <= threshold - 0.1:
+            return bands, rows
+    return _BAND_LAYOUTS[-1]
+
+
+def check_threshold(threshold: float) -> float:
+    """유사도 기준 검증 (0보다 크고 1 이하가 아니면 ValueError)"""
+    if not 0 < threshold <= 1:
+        raise ValueError(f"중복 제거 기준은 0보다 크고 1 이하여야 합니다: {threshold}")
+    return threshold
+
+
+def estimate_similarity(a: list[int], b: list[int]) -> float:
+    """두 MinHash 서명에서 추정한 Jaccard 유사도 (같은 위치 값이 일치하는 비율)"""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def dedup_conversations(
+    conversations: Iterable[Conversation],
+    threshold: float = DEFAULT_THRESHOLD,
+    measure: Optional[Callable[[str], int]] = None
+) -> tuple[list[Conversation], DedupReport]:
+    """
+    대화들의 메시지 흐름에서 중복 메시지 제거
+
+    원본 Conversation은 바꾸지 않고, 남은 메시지만 담은 새 Conversation을 만듭니다.
+    메시지가 모두 지워진 대화는 결과에서 빠집니다.
+
+    Args:
+        conversations: 시간순 Conversation들
+        threshold: 유사 중복으로 볼 최소 Jaccard 유사도 (1.0이면 완전 일치만 제거)
+        measure: 절약한 토큰 수를 셀 함수 (없으면 0으로 보고)
+
+    Returns:
+        (중복이 제거된 Conversation 리스트, DedupReport)
+
+    Raises:
+        ValueError: threshold가 (0, 1] 범위 밖인 경우
+    """
+    check_threshold(threshold)
+    report = DedupReport()
+    bands, rows = _band_layout(threshold)
+    # 같은 단어가 반복해서 나오므로 이번 호출 동안 단어 해시를 기억해 둠
+    hash_word = lru_cache(maxsize=None)(word_hash)
+    seen_exact: set[tuple[str, str]] = set()
+    # (역할, 밴드 번호, 밴드 값) → 남긴 메시지들의 MinHash 서명
+    buckets: dict[tuple, list[list[int]]] = {}
+    result: list[Conversation] = []
+
+    for conv in conversations:
+        kept: list[Message] = []
+        for msg in conv.messages:
+            report.messages += 1
+            # 프롬프트에는 앞부분만 들어가므로 그 부분으로만 비교
+            words = msg.content[:MESSAGE_CHAR_LIMIT].split()
+            if len(words) < MIN_WORDS:
+                kept.append(msg)
+                continue
+
+            normalized = ' '.join(words)
+            if (msg.role, normalized) in seen_exact:
+                report.exact_removed += 1
+                _count_saved(report, msg, measure)
+                continue
+            seen_exact.add((msg.role, normalized))
+
+            if threshold >= 1.0:
+                kept.append(msg)
+                continue
+
+            signature = minhash_signature(shingles(words, hash_word))
+            keys = [
+                (msg.role, band, tuple(signature[band * rows:(band + 1) * rows]))
+                for band in range(bands)
+            ]
+
+            duplicate = False
+            checked: set[int] = set()
+            for key in keys:
+                for candidate in buckets.get(key, ()):
+                    if id(candidate) in checked:
+                        continue
+                    checked.add(id(candidate))
+                    if estimate_similarity(signature, candidate) >= threshold:
+                        duplicate = True
+                        break
+                if duplicate:
+                    break
+
+            if duplicate:
+                report.near_removed += 1
+                _count_saved(report, msg, measure)
+                continue
+
+            for key in keys:
+                buckets.setdefault(key, []).append(signature)
+            kept.append(msg)
+
+        if kept:
+            if len(kept) == len(conv.messages):
+                result.append(conv)
+            else:
+                result.append(Conversation(
+                    project=conv.project,
+                    session_id=conv.session_id,
+                    agent_id=conv.agent_id,
+                    messages=kept,
+                    start_time=conv.start_time,
+                    end_time=conv.end_time,
+                ))
+
+    return result, report
+
+
+def _count_saved(report: DedupReport, msg: Message, measure: Optional[Callable[[str], int]]) -> None:
+    """지운 메시지가 프롬프트에서 차지했을 양 (format_for_summary와 같이 잘린 길이 기준)"""
+    content = msg.content[:MESSAGE_CHAR_LIMIT]
+    report.bytes_saved += len(content.encode('utf-8'))
+    if measure is not None:
+        report.tokens_saved += measure(content)
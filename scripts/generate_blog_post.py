@@ -1,37 +1,27 @@
 #!/usr/bin/env python3
 """
 OpenAI 호환 API를 사용하여 대화 내용을 블로그 글로 변환하는 스크립트
+
+- BlogPostGenerator: 동기 OpenAI 클라이언트로 요청을 하나씩 보냄
+- AsyncBlogPostGenerator: AsyncOpenAI 클라이언트 하나(연결 풀 공유)로 여러 요청을
+  세마포어 한도 안에서 동시에 보냄 (여러 날짜 포스트, 긴 대화의 세션별 요약)
+
+두 생성기 모두 stream_post로 응답을 조각 단위로 받아, save_post_stream으로
+임시 파일에 이어 쓴 뒤 원자적으로 교체할 수 있습니다. 저장 전 후처리(유니코드 정규화,
+프론트매터 검증, 코드 블록 언어 표시)는 postprocess.PostProcessor가 한 번에 수행합니다.
 """
 
+import asyncio
+import json
 import os
 import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-
-def normalize_unicode(text: str) -> str:
-    """유니코드 특수 문자를 표준 ASCII로 변환"""
-    replacements = {
-        '\u2011': '-',  # NON-BREAKING HYPHEN
-        '\u2010': '-',  # HYPHEN
-        '\u2012': '-',  # FIGURE DASH
-        '\u2013': '-',  # EN DASH
-        '\u2014': '-',  # EM DASH
-        '\u2015': '-',  # HORIZONTAL BAR
-        '\u2018': "'",  # LEFT SINGLE QUOTATION
-        '\u2019': "'",  # RIGHT SINGLE QUOTATION
-        '\u201C': '"',  # LEFT DOUBLE QUOTATION
-        '\u201D': '"',  # RIGHT DOUBLE QUOTATION
-        '\u2026': '...',  # HORIZONTAL ELLIPSIS
-        '\u00A0': ' ',  # NO-BREAK SPACE
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ImportError:
     print("[오류] openai 패키지가 설치되지 않았습니다.")
     print("실행: pip install openai")
@@ -40,20 +30,124 @@ except ImportError:
 from dotenv import load_dotenv
 
 from .collect_conversations import ConversationCollector, Conversation
+from .completion_cache import CompletionCache, SessionSummaryCache, session_summary_key
+from .dedup import DEFAULT_THRESHOLD, check_threshold, dedup_conversations
+from .metrics import PipelineMetrics
+from .postprocess import PostProcessor, normalize_unicode
+from .state import AtomicWriter, write_text_if_changed
+from .summarize import (
+    DEFAULT_CHUNK_TOKENS,
+    DEFAULT_TOKEN_BUDGET,
+    SUMMARY_MAX_TOKENS,
+    build_map_prompt,
+    build_reduce_prompt,
+    estimate_tokens,
+    group_by_budget,
+    session_chunks,
+)
 
 # .env 파일 로드
 load_dotenv()
 
+# 블로그 포스트 응답의 최대 토큰 수
+POST_MAX_TOKENS = 8192
+
+# max_tokens에 닿아 응답이 잘렸을 때의 finish_reason (이런 응답은 캐시에 저장하지 않음)
+TRUNCATED = 'length'
+
+
+def is_date_range(start_date: datetime, end_date: Optional[datetime]) -> bool:
+    """end_date가 start_date와 다른 날짜이면 기간 요약"""
+    return end_date is not None and end_date.date() != start_date.date()
+
+
+def _delta_text(chunk) -> str:
+    """스트리밍 응답 조각의 텍스트 (없으면 빈 문자열)"""
+    if not chunk.choices:
+        return ''
+    return chunk.choices[0].delta.content or ''
+
+
+def _finish_reason(chunk) -> Optional[str]:
+    """스트리밍 응답 조각의 종료 이유 (마지막 조각에만 있음)"""
+    if not chunk.choices:
+        return None
+    return getattr(chunk.choices[0], 'finish_reason', None)
+
+
+class StreamingPostWriter(AtomicWriter):
+    """
+    스트리밍 응답을 후처리하며 임시 파일에 이어 쓰고, 정상적으로 끝나면 원자적으로 교체
+
+    조각마다 PostProcessor.feed를 거쳐 확정된 줄만 쓰고, 끝나면 finish 결과
+    (기본 프론트매터나 닫는 펜스)를 마저 씁니다. 결과가 기존 포스트와 같으면 교체하지 않고
+    (changed가 False), 도중에 예외가 나면 임시 파일을 지우므로 기존 포스트는 그대로 남습니다.
+    임시 파일과 권한 처리는 state.AtomicWriter와 같습니다.
+    """
+
+    def __init__(self, path: Path, processor: PostProcessor):
+        """
+        Args:
+            path: 최종 포스트 경로
+            processor: 이 포스트의 후처리기
+        """
+        super().__init__(path, skip_unchanged=True)
+        self.processor = processor
+
+    def __enter__(self) -> 'StreamingPostWriter':
+        super().__enter__()
+        return self
+
+    def write(self, text: str) -> None:
+        """조각 하나 쓰기"""
+        self._file.write(self.processor.feed(text))
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            try:
+                self._file.write(self.processor.finish())
+            except BaseException as e:
+                super().__exit__(type(e), e, e.__traceback__)
+                raise
+        super().__exit__(exc_type, exc, tb)
+
 
 class BlogPostGenerator:
     """대화 내용을 블로그 포스트로 변환하는 클래스"""
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache: Optional[CompletionCache] = None,
+        session_cache: Optional[SessionSummaryCache] = None,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        summary_policy: Optional[str] = None,
+        dedup_threshold: Optional[float] = DEFAULT_THRESHOLD,
+        metrics: Optional[PipelineMetrics] = None
+    ):
         """
         Args:
             api_key: OpenAI 호환 API 키 (없으면 환경변수에서 로드)
             base_url: API 엔드포인트 URL (없으면 환경변수에서 로드)
+            cache: LLM 응답 캐시 (None이면 항상 API 호출)
+            session_cache: 세션별 요약 캐시 (None이면 나눠서 요약할 때 모든 세션을 요약)
+            token_budget: 대화 원문을 그대로 보낼 최대 토큰 수 (넘으면 나눠서 요약)
+            chunk_tokens: 나눠서 요약할 때 조각 하나의 최대 토큰 수
+            summary_policy: 지정하면 예산을 넘을 때 나눠서 요약하지 않고, 이 정책
+                (SUMMARY_POLICIES)으로 예산 안에 들어가는 메시지만 골라 한 번에 보냄
+            dedup_threshold: 이 Jaccard 유사도 이상인 중복 메시지를 프롬프트에서 제외
+                (None이면 중복 제거 안 함)
+            metrics: LLM 요청별 지연 시간/토큰 수를 기록할 측정 객체
         """
+        self.cache = cache
+        self.session_cache = session_cache
+        self.token_budget = token_budget
+        self.chunk_tokens = min(chunk_tokens, token_budget)
+        self.summary_policy = summary_policy
+        self.dedup_threshold = None if dedup_threshold is None else check_threshold(dedup_threshold)
+        self.metrics = metrics
         self.api_key = api_key or os.environ.get('OPENAI_API_KEY')
         self.base_url = base_url or os.environ.get('OPENAI_BASE_URL')
         self.model = os.environ.get('OPENAI_MODEL', 'gpt-4o')
@@ -64,38 +158,320 @@ class BlogPostGenerator:
                 "환경변수로 설정하거나 .env 파일에 추가해주세요."
             )
 
-        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self.client = self._create_client()
         self.blog_dir = Path(__file__).parent.parent
         self.posts_dir = self.blog_dir / "docs" / "learning-records"
         self.docs_dir = self.blog_dir / "docs"
 
+    def _create_client(self):
+        """API 클라이언트 생성"""
+        return OpenAI(api_key=self.api_key, base_url=self.base_url)
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        """chat completion 요청 하나 실행 (캐시가 있으면 먼저 조회)"""
+        if self.cache is not None:
+            cached = self.cache.get(self.model, prompt, max_tokens)
+            if cached is not None:
+                self._record_llm(prompt, cached, cached=True)
+                return cached
+
+        started = time.perf_counter()
+        response = self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        content = response.choices[0].message.content
+        self._record_llm(prompt, content, started, usage=getattr(response, 'usage', None))
+
+        # max_tokens에서 잘린 응답은 저장하지 않음 (다음 실행에서 다시 요청)
+        if self.cache is not None and content and response.choices[0].finish_reason != TRUNCATED:
+            self.cache.put(self.model, prompt, max_tokens, content)
+        return content
+
     def generate_post(
         self,
         conversations: list[Conversation],
-        target_date: datetime
+        target_date: datetime,
+        end_date: Optional[datetime] = None
     ) -> str:
         """
         대화 내용을 블로그 포스트로 변환
 
+        대화 내용이 token_budget을 넘으면 세션별로 요약(map)하고 요약들을 합친(reduce) 뒤
+        그 결과로 포스트를 작성합니다.
+
         Args:
             conversations: 변환할 대화 리스트
-            target_date: 포스트 날짜
+            target_date: 포스트 날짜 (기간 요약이면 시작 날짜)
+            end_date: 기간 요약의 끝 날짜 (선택)
 
         Returns:
-            마크다운 형식의 블로그 포스트
+            마크다운 형식의 블로그 포스트 (후처리 전 응답, 저장할 때 ensure_frontmatter/save_post가 처리)
         """
+        prompt = self._prepare_post_prompt(conversations, target_date, end_date)
+
+        print(f"[정보] {self.model} API로 블로그 글 생성 중...")
+
+        return self._complete(prompt, max_tokens=POST_MAX_TOKENS)
+
+    def stream_post(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> Iterator[str]:
+        """
+        generate_post의 스트리밍 버전
+
+        Yields:
+            도착하는 대로 응답 조각 (후처리 전, save_post_stream이나 post_processor로 처리)
+        """
+        prompt = self._prepare_post_prompt(conversations, target_date, end_date)
+
+        print(f"[정보] {self.model} API로 블로그 글 생성 중 (스트리밍)...")
+
+        yield from self._stream_complete(prompt, max_tokens=POST_MAX_TOKENS)
+
+    def _stream_complete(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """chat completion을 stream=True로 요청해 조각 단위로 전달 (캐시 적중 시 한 조각)"""
+        if self.cache is not None:
+            cached = self.cache.get(self.model, prompt, max_tokens)
+            if cached is not None:
+                self._record_llm(prompt, cached, stream=True, cached=True)
+                yield cached
+                return
+
+        started = time.perf_counter()
+        first_token = None
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True
+        )
+        pieces = []
+        finish_reason = None
+        for chunk in stream:
+            finish_reason = _finish_reason(chunk) or finish_reason
+            text = _delta_text(chunk)
+            if text:
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+                pieces.append(text)
+                yield text
+        self._record_llm(prompt, ''.join(pieces), started, first_token=first_token, stream=True)
+
+        # 끝까지 받았고 max_tokens에서 잘리지 않은 응답만 캐시에 저장
+        if self.cache is not None and pieces and finish_reason != TRUNCATED:
+            self.cache.put(self.model, prompt, max_tokens, ''.join(pieces))
+
+    def _record_llm(
+        self,
+        prompt: str,
+        content: Optional[str],
+        started: Optional[float] = None,
+        first_token: Optional[float] = None,
+        usage=None,
+        stream: bool = False,
+        cached: bool = False
+    ) -> None:
+        """LLM 요청 하나를 metrics에 기록 (usage가 없으면 토큰 수는 추정치)"""
+        if self.metrics is None:
+            return
+        prompt_tokens = getattr(usage, 'prompt_tokens', None)
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        self.metrics.record_llm(
+            latency_seconds=0.0 if started is None else time.perf_counter() - started,
+            prompt_tokens=prompt_tokens if prompt_tokens is not None else estimate_tokens(prompt),
+            completion_tokens=(
+                completion_tokens if completion_tokens is not None else estimate_tokens(content or '')
+            ),
+            first_token_seconds=first_token,
+            stream=stream,
+            cached=cached,
+        )
+
+    def _prepare_post_prompt(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> str:
+        """포스트 프롬프트 생성 (대화가 예산을 넘으면 먼저 세션별 요약 후 reduce)"""
+        content, sessions = self.prepare_content(conversations, target_date, end_date)
+
+        if sessions:
+            summaries = [
+                self._summarize_session(conversation, prompts)
+                for conversation, prompts in sessions
+            ]
+            while (groups := self.reduce_groups(summaries)) is not None:
+                summaries = [
+                    self._complete(build_reduce_prompt(group, target_date, end_date), SUMMARY_MAX_TOKENS)
+                    for group in groups
+                ]
+            content = self.join_summaries(summaries)
+
+        return self.build_post_prompt(
+            conversations, target_date, end_date, content, summarized=bool(sessions)
+        )
+
+    def _summarize_session(self, conversation: Conversation, prompts: list[str]) -> str:
+        """세션 하나의 요약 (저장된 요약이 없을 때만 조각별로 요청해 합침)"""
+        key = session_summary_key(self.model, prompts, SUMMARY_MAX_TOKENS)
+        if self.session_cache is not None:
+            cached = self.session_cache.get(key)
+            if cached is not None:
+                return cached
+
+        summary = self.join_summaries([
+            self._complete(prompt, SUMMARY_MAX_TOKENS) for prompt in prompts
+        ])
+        self._store_session_summary(key, conversation, summary)
+        return summary
+
+    def _store_session_summary(self, key: str, conversation: Conversation, summary: str) -> None:
+        if self.session_cache is not None and summary.strip():
+            self.session_cache.put(
+                key, summary, self.model, conversation.project, conversation.session_id
+            )
+
+    def prepare_content(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> tuple[Optional[str], list[tuple[Conversation, list[str]]]]:
+        """
+        대화 내용을 그대로 보낼지, 세션별로 나눠서 요약할지 결정
+
+        세션별 요약 프롬프트는 그 세션 안에서만 중복을 지운 내용으로 만듭니다. 전체 대화에서 지운
+        결과로 만들면 앞선 세션에 따라 프롬프트(세션 요약 캐시 키)가 달라져, 같은 세션을 하루/기간
+        발행이나 다시 실행에서 재사용하지 못하기 때문입니다.
+
+        Returns:
+            (예산 안이면 포맷된 대화 내용, 넘으면 None,
+             세션별 (Conversation, 조각 요약 프롬프트 리스트) (예산 안이면 빈 리스트))
+        """
+        is_range = is_date_range(target_date, end_date)
+        collector = ConversationCollector()
+        sessions_source = conversations
+
+        if self.dedup_threshold is not None:
+            conversations, dedup_report = dedup_conversations(
+                conversations, self.dedup_threshold, measure=estimate_tokens
+            )
+            if dedup_report.removed:
+                print(f"[정보] {dedup_report.summary()}")
+
+        # 예산까지만 포맷하고, 생략된 메시지가 있는지로 나눠서 요약할지 판단
+        formatted_content, report = collector.format_for_summary_with_report(
+            conversations,
+            budget=self.token_budget,
+            policy=self.summary_policy or 'sequential',
+            measure=estimate_tokens,
+            show_date=is_range
+        )
+        if report.complete:
+            return formatted_content, []
+
+        if self.summary_policy is not None:
+            print(f"[정보] {report.summary()} (정책: {self.summary_policy})")
+            return formatted_content, []
+
+        sessions = [
+            (conversation, self.build_map_prompts(
+                session_chunks(collector, conversation, self.chunk_tokens)
+            ))
+            for conversation in self.dedup_sessions(sessions_source)
+        ]
+        print(
+            f"[정보] 대화 내용이 예산({self.token_budget:,} 토큰)을 넘어 "
+            f"세션 {len(sessions)}개를 각각 요약합니다 "
+            f"(조각 {sum(len(prompts) for _, prompts in sessions)}개)."
+        )
+        return None, sessions
+
+    def dedup_sessions(self, conversations: list[Conversation]) -> list[Conversation]:
+        """세션마다 그 세션 안의 중복 메시지만 제거 (다른 세션과는 비교하지 않음)"""
+        if self.dedup_threshold is None:
+            return conversations
+        return [
+            deduped
+            for conversation in conversations
+            for deduped in dedup_conversations([conversation], self.dedup_threshold)[0]
+        ]
+
+    @staticmethod
+    def build_map_prompts(chunks: list[str]) -> list[str]:
+        """세션 조각별 요약 프롬프트 리스트"""
+        return [
+            build_map_prompt(chunk, index, len(chunks))
+            for index, chunk in enumerate(chunks, 1)
+        ]
+
+    def reduce_groups(self, summaries: list[str]) -> Optional[list[list[str]]]:
+        """
+        부분 요약들을 한 단계 더 합칠 묶음
+
+        Returns:
+            합친 결과가 token_budget 안이거나 더 줄일 수 없으면 None
+        """
+        if len(summaries) <= 1 or estimate_tokens(self.join_summaries(summaries)) <= self.token_budget:
+            return None
+        groups = group_by_budget(summaries, self.chunk_tokens)
+        return groups if len(groups) < len(summaries) else None
+
+    @staticmethod
+    def join_summaries(summaries: list[str]) -> str:
+        """부분 요약들을 포스트 프롬프트에 넣을 하나의 텍스트로 합침"""
+        return '\n\n'.join(summaries)
+
+    def build_post_prompt(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None,
+        content: Optional[str] = None,
+        summarized: bool = False
+    ) -> str:
+        """
+        generate_post에서 사용하는 프롬프트 생성
+
+        Args:
+            content: 프롬프트에 넣을 대화 내용 (없으면 전체 대화를 포맷)
+            summarized: content가 나눠서 요약한 결과인지
+        """
+        is_range = is_date_range(target_date, end_date)
         collector = ConversationCollector()
-        formatted_content = collector.format_for_summary(conversations)
+        if content is None:
+            content = collector.format_for_summary(conversations, show_date=is_range)
         stats = collector.get_statistics(conversations)
 
         # 프로젝트 목록 추출
         project_names = [Path(p).name for p in stats['projects']]
 
-        prompt = f"""다음은 오늘 ({target_date.strftime('%Y년 %m월 %d일')}) Claude Code로 작업한 대화 기록입니다.
+        if is_range:
+            period = f"{target_date.strftime('%Y년 %m월 %d일')} ~ {end_date.strftime('%Y년 %m월 %d일')}"
+            intro = f"이 기간 ({period}) 동안"
+            scope = "이 기간 동안"
+        else:
+            intro = f"오늘 ({target_date.strftime('%Y년 %m월 %d일')})"
+            scope = "오늘"
+
+        if summarized:
+            intro_line = f"다음은 {intro} Claude Code로 작업한 대화 기록을 부분별로 요약한 내용입니다."
+            content_heading = "## 대화 요약:"
+        else:
+            intro_line = f"다음은 {intro} Claude Code로 작업한 대화 기록입니다."
+            content_heading = "## 대화 내용:"
+
+        return f"""{intro_line}
 이 대화들을 분석하여 Jekyll 블로그 포스트 (Just the Docs 테마)로 작성해주세요.
 
 ## 요청사항:
-1. 오늘 학습하거나 작업한 내용을 주제별로 정리해주세요
+1. {scope} 학습하거나 작업한 내용을 주제별로 정리해주세요
 2. 각 주제에 대해 핵심 개념과 배운 점을 요약해주세요
 3. 코드 예시가 있다면 중요한 부분만 포함해주세요
 4. 한국어로 작성해주세요
@@ -103,6 +479,7 @@ class BlogPostGenerator:
 
 ## 출력 형식:
 YAML 프론트매터로 시작하고, 그 다음 본문 내용을 작성해주세요.
+tags에는 관련 기술 태그 3-5개를 적어주세요 (영문, 소문자, 하이픈 사용).
 
 프론트매터 예시:
 ```
@@ -111,6 +488,7 @@ layout: default
 title: "제목"
 parent: 학습 기록
 nav_order: 1
+tags: [python, asyncio]
 ---
 
 # 제목
@@ -123,8 +501,8 @@ nav_order: 1
 - 총 메시지: {stats['total_messages']}개 (사용자 {stats['user_messages']}개, Claude {stats['assistant_messages']}개)
 - 작업한 프로젝트: {', '.join(project_names)}
 
-## 대화 내용:
-{formatted_content[:80000]}
+{content_heading}
+{content}
 
 ## 주의사항:
 - 코드 블록에는 적절한 언어 표시를 해주세요
@@ -133,17 +511,6 @@ nav_order: 1
 - 실제로 배운 내용이나 해결한 문제 위주로 정리해주세요
 """
 
-        print(f"[정보] {self.model} API로 블로그 글 생성 중...")
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            max_tokens=8192,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        content = response.choices[0].message.content
-        return normalize_unicode(content)
-
     def generate_title_and_tags(
         self,
         content: str,
@@ -159,10 +526,16 @@ nav_order: 1
         Returns:
             (제목, 태그 리스트) 튜플
         """
-        prompt = f"""다음 블로그 포스트의 내용을 분석하여 적절한 제목과 태그를 추천해주세요.
+        text = self._complete(self.build_title_and_tags_prompt(content), max_tokens=500)
+        return self.parse_title_and_tags(text, target_date)
+
+    @staticmethod
+    def build_title_and_tags_prompt(content: str) -> str:
+        """generate_title_and_tags에서 사용하는 프롬프트 생성"""
+        return f"""다음 블로그 포스트의 내용을 분석하여 적절한 제목과 태그를 추천해주세요.
 
 ## 포스트 내용 (처음 3000자):
-{content[:3000]}
+{normalize_unicode(content[:3000])}
 
 ## 요청:
 1. 포스트의 핵심 주제를 반영한 간결한 한국어 제목 (20자 이내)
@@ -174,90 +547,168 @@ nav_order: 1
 JSON만 출력해주세요.
 """
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        import json
+    @staticmethod
+    def parse_title_and_tags(text: str, target_date: datetime) -> tuple[str, list[str]]:
+        """제목/태그 응답(JSON) 파싱 (실패하면 기본값)"""
         try:
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(text)
             return result.get('title', f'{target_date.strftime("%Y-%m-%d")} 학습 기록'), result.get('tags', [])
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, TypeError, AttributeError):
             return f'{target_date.strftime("%Y-%m-%d")} 학습 기록', ['til', 'claude-code']
 
+    def post_processor(
+        self,
+        target_date: datetime,
+        title: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+        end_date: Optional[datetime] = None
+    ) -> PostProcessor:
+        """
+        포스트 하나의 후처리기 생성
+
+        Args:
+            target_date: 포스트 날짜 (기간 요약이면 시작 날짜)
+            title: 본문에 프론트매터가 없을 때 쓸 제목 (선택)
+            tags: 본문에 프론트매터가 없을 때 쓸 태그 (선택)
+            end_date: 기간 요약의 끝 날짜 (선택, 있으면 date에 사용)
+        """
+        if is_date_range(target_date, end_date):
+            default_title = (
+                f"{target_date.strftime('%Y년 %m월 %d일')} ~ "
+                f"{end_date.strftime('%Y년 %m월 %d일')} 학습 기록"
+            )
+        else:
+            default_title = f"{target_date.strftime('%Y년 %m월 %d일')} 학습 기록"
+
+        return PostProcessor(
+            default_title=default_title,
+            date=(end_date or target_date).strftime('%Y-%m-%d'),
+            title=title,
+            tags=tags,
+        )
+
     def ensure_frontmatter(
         self,
         content: str,
         target_date: datetime,
         title: Optional[str] = None,
-        tags: Optional[list[str]] = None
+        tags: Optional[list[str]] = None,
+        end_date: Optional[datetime] = None
     ) -> str:
         """
-        프론트매터가 있는지 확인하고, 없으면 추가
+        포스트 후처리: 프론트매터가 있으면 검증해 빠진 키를 채우고, 없으면 추가
+
+        유니코드 정규화와 코드 블록 언어 표시 확인도 같은 패스에서 처리합니다
+        (post_processor 참고).
 
         Args:
             content: 블로그 포스트 내용
-            target_date: 포스트 날짜
+            target_date: 포스트 날짜 (기간 요약이면 시작 날짜)
             title: 포스트 제목 (선택)
             tags: 포스트 태그 (선택)
+            end_date: 기간 요약의 끝 날짜 (선택, 있으면 date에 사용)
 
         Returns:
             프론트매터가 포함된 콘텐츠
         """
-        if content.strip().startswith('---'):
-            return content
-
-        if not title:
-            title = f"{target_date.strftime('%Y년 %m월 %d일')} 학습 기록"
-
-        if not tags:
-            tags = ['til', 'claude-code']
-
-        tags_str = ', '.join(tags)
-        frontmatter = f"""---
-layout: default
-title: "{title}"
-parent: 학습 기록
-date: {target_date.strftime('%Y-%m-%d')}
-tags: [{tags_str}]
----
-
-"""
-        return frontmatter + content
+        return self.post_processor(target_date, title, tags, end_date).process(content)
 
     def save_post(
         self,
         content: str,
         target_date: datetime,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        end_date: Optional[datetime] = None,
+        postprocess: bool = True
     ) -> Path:
         """
         블로그 포스트를 파일로 저장
 
+        임시 파일에 쓴 뒤 교체하므로 도중에 중단되어도 잘린 포스트가 남지 않고,
+        기존 파일과 내용이 같으면 쓰지 않습니다.
+
         Args:
             content: 저장할 콘텐츠
-            target_date: 포스트 날짜
-            filename: 파일명 (선택, 기본값: YYYY-MM-DD-daily-learning.md)
+            target_date: 포스트 날짜 (기간 요약이면 시작 날짜)
+            filename: 파일명 (선택, 기본값: YYYY-MM-DD-daily-learning.md,
+                기간 요약은 YYYY-MM-DD-to-YYYY-MM-DD-learning.md)
+            end_date: 기간 요약의 끝 날짜 (선택)
+            postprocess: False면 후처리 없이 그대로 저장 (generate_complete_post 결과처럼
+                이미 처리된 포스트)
 
         Returns:
             저장된 파일 경로
         """
         self.posts_dir.mkdir(exist_ok=True)
 
+        filepath = self.post_path(target_date, filename, end_date)
+
+        if postprocess:
+            processor = self.post_processor(target_date, end_date=end_date)
+            content = processor.process(content)
+            self._report_postprocess(processor)
+
+        self._report_saved(filepath, write_text_if_changed(filepath, content))
+        return filepath
+
+    @staticmethod
+    def _report_saved(filepath: Path, changed: bool) -> None:
+        if changed:
+            print(f"[정보] 포스트 저장됨: {filepath}")
+        else:
+            print(f"[정보] 기존 포스트와 내용이 같아 그대로 둠: {filepath}")
+
+    @staticmethod
+    def _report_postprocess(processor: PostProcessor) -> None:
+        """후처리 내역 출력 (고친 것이 없으면 생략)"""
+        if processor.issues:
+            print(f"[정보] 포스트 후처리: {processor.summary()}")
+
+    def post_path(
+        self,
+        target_date: datetime,
+        filename: Optional[str] = None,
+        end_date: Optional[datetime] = None
+    ) -> Path:
+        """save_post가 저장할 경로"""
         if not filename:
-            filename = f"{target_date.strftime('%Y-%m-%d')}-daily-learning.md"
+            if is_date_range(target_date, end_date):
+                filename = (
+                    f"{target_date.strftime('%Y-%m-%d')}-to-"
+                    f"{end_date.strftime('%Y-%m-%d')}-learning.md"
+                )
+            else:
+                filename = f"{target_date.strftime('%Y-%m-%d')}-daily-learning.md"
 
-        filepath = self.posts_dir / filename
+        return self.posts_dir / filename
 
-        # 프론트매터 확인 및 추가
-        content = self.ensure_frontmatter(content, target_date)
+    def save_post_stream(
+        self,
+        chunks: Iterable[str],
+        target_date: datetime,
+        filename: Optional[str] = None,
+        end_date: Optional[datetime] = None
+    ) -> Path:
+        """
+        stream_post 조각들을 받는 대로 임시 파일에 쓰고, 끝나면 포스트 파일로 교체
+        (기존 포스트와 내용이 같으면 교체하지 않음)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        Args:
+            chunks: 응답 조각들
+            나머지는 save_post와 같음
 
-        print(f"[정보] 포스트 저장됨: {filepath}")
+        Returns:
+            저장된 파일 경로
+        """
+        filepath = self.post_path(target_date, filename, end_date)
+        processor = self.post_processor(target_date, end_date=end_date)
+
+        with StreamingPostWriter(filepath, processor) as writer:
+            for text in chunks:
+                writer.write(text)
+
+        self._report_postprocess(processor)
+        self._report_saved(filepath, writer.changed)
         return filepath
 
     def save_to_docs(
@@ -286,12 +737,252 @@ tags: [{tags_str}]
         safe_title = ''.join(c for c in safe_title if c.isalnum() or c == '-')
         filepath = category_dir / f"{safe_title}.md"
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if write_text_if_changed(filepath, content):
+            print(f"[정보] 문서 저장됨: {filepath}")
+        else:
+            print(f"[정보] 기존 문서와 내용이 같아 그대로 둠: {filepath}")
+        return filepath
+
 
-        print(f"[정보] 문서 저장됨: {filepath}")
+class AsyncBlogPostGenerator(BlogPostGenerator):
+    """
+    AsyncOpenAI 기반 블로그 포스트 생성기
+
+    모든 요청이 클라이언트 하나(하나의 HTTP 연결 풀)를 공유하고, 동시에 진행되는
+    요청 수는 세마포어로 concurrency개까지 제한합니다.
+
+    사용 예:
+        async with AsyncBlogPostGenerator(concurrency=4) as generator:
+            posts = await generator.generate_posts([(conversations, date), ...])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache: Optional[CompletionCache] = None,
+        session_cache: Optional[SessionSummaryCache] = None,
+        concurrency: int = 4,
+        **kwargs
+    ):
+        """
+        Args:
+            api_key: OpenAI 호환 API 키 (없으면 환경변수에서 로드)
+            base_url: API 엔드포인트 URL (없으면 환경변수에서 로드)
+            cache: LLM 응답 캐시 (None이면 항상 API 호출)
+            session_cache: 세션별 요약 캐시 (None이면 나눠서 요약할 때 모든 세션을 요약)
+            concurrency: 동시에 보낼 최대 요청 수
+            **kwargs: BlogPostGenerator 옵션 (token_budget, chunk_tokens, summary_policy, dedup_threshold, metrics)
+        """
+        super().__init__(
+            api_key=api_key, base_url=base_url, cache=cache, session_cache=session_cache, **kwargs
+        )
+        self.concurrency = max(1, concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _create_client(self):
+        return AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+
+    async def __aenter__(self) -> 'AsyncBlogPostGenerator':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """HTTP 연결 풀 정리"""
+        await self.client.close()
+
+    async def _complete(self, prompt: str, max_tokens: int) -> str:
+        """세마포어 한도 안에서 chat completion 요청 하나 실행 (캐시가 있으면 먼저 조회)"""
+        if self.cache is not None:
+            cached = self.cache.get(self.model, prompt, max_tokens)
+            if cached is not None:
+                self._record_llm(prompt, cached, cached=True)
+                return cached
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            # 세마포어 대기 시간은 빼고 요청 지연 시간만 잼
+            started = time.perf_counter()
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        content = response.choices[0].message.content
+        self._record_llm(prompt, content, started, usage=getattr(response, 'usage', None))
+
+        # max_tokens에서 잘린 응답은 저장하지 않음 (다음 실행에서 다시 요청)
+        if self.cache is not None and content and response.choices[0].finish_reason != TRUNCATED:
+            self.cache.put(self.model, prompt, max_tokens, content)
+        return content
+
+    async def generate_post(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> str:
+        """BlogPostGenerator.generate_post의 비동기 버전 (세션별 요약을 동시에 요청)"""
+        prompt = await self._prepare_post_prompt(conversations, target_date, end_date)
+
+        print(f"[정보] {self.model} API로 블로그 글 생성 중... ({target_date.strftime('%Y-%m-%d')})")
+
+        return await self._complete(prompt, max_tokens=POST_MAX_TOKENS)
+
+    async def stream_post(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[str]:
+        """BlogPostGenerator.stream_post의 비동기 버전"""
+        prompt = await self._prepare_post_prompt(conversations, target_date, end_date)
+
+        print(f"[정보] {self.model} API로 블로그 글 생성 중 (스트리밍)... ({target_date.strftime('%Y-%m-%d')})")
+
+        async for text in self._stream_complete(prompt, max_tokens=POST_MAX_TOKENS):
+            yield text
+
+    async def _stream_complete(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """세마포어 한도 안에서 stream=True 요청 (캐시 적중 시 한 조각)"""
+        if self.cache is not None:
+            cached = self.cache.get(self.model, prompt, max_tokens)
+            if cached is not None:
+                self._record_llm(prompt, cached, stream=True, cached=True)
+                yield cached
+                return
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        pieces = []
+        first_token = None
+        finish_reason = None
+        async with self._semaphore:
+            started = time.perf_counter()
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                stream=True
+            )
+            async for chunk in stream:
+                finish_reason = _finish_reason(chunk) or finish_reason
+                text = _delta_text(chunk)
+                if text:
+                    if first_token is None:
+                        first_token = time.perf_counter() - started
+                    pieces.append(text)
+                    yield text
+        self._record_llm(prompt, ''.join(pieces), started, first_token=first_token, stream=True)
+
+        # 끝까지 받았고 max_tokens에서 잘리지 않은 응답만 캐시에 저장
+        if self.cache is not None and pieces and finish_reason != TRUNCATED:
+            self.cache.put(self.model, prompt, max_tokens, ''.join(pieces))
+
+    async def _prepare_post_prompt(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> str:
+        """BlogPostGenerator._prepare_post_prompt의 비동기 버전 (세션별 요약을 동시에 요청)"""
+        content, sessions = self.prepare_content(conversations, target_date, end_date)
+
+        if sessions:
+            summaries = await asyncio.gather(*(
+                self._summarize_session(conversation, prompts)
+                for conversation, prompts in sessions
+            ))
+            while (groups := self.reduce_groups(summaries)) is not None:
+                summaries = await asyncio.gather(*(
+                    self._complete(build_reduce_prompt(group, target_date, end_date), SUMMARY_MAX_TOKENS)
+                    for group in groups
+                ))
+            content = self.join_summaries(summaries)
+
+        return self.build_post_prompt(
+            conversations, target_date, end_date, content, summarized=bool(sessions)
+        )
+
+    async def _summarize_session(self, conversation: Conversation, prompts: list[str]) -> str:
+        """BlogPostGenerator._summarize_session의 비동기 버전 (조각별 요약을 동시에 요청)"""
+        key = session_summary_key(self.model, prompts, SUMMARY_MAX_TOKENS)
+        if self.session_cache is not None:
+            cached = self.session_cache.get(key)
+            if cached is not None:
+                return cached
+
+        summary = self.join_summaries(await asyncio.gather(*(
+            self._complete(prompt, SUMMARY_MAX_TOKENS) for prompt in prompts
+        )))
+        self._store_session_summary(key, conversation, summary)
+        return summary
+
+    async def save_post_stream(
+        self,
+        chunks: AsyncIterable[str],
+        target_date: datetime,
+        filename: Optional[str] = None,
+        end_date: Optional[datetime] = None
+    ) -> Path:
+        """BlogPostGenerator.save_post_stream의 비동기 버전"""
+        filepath = self.post_path(target_date, filename, end_date)
+        processor = self.post_processor(target_date, end_date=end_date)
+
+        with StreamingPostWriter(filepath, processor) as writer:
+            async for text in chunks:
+                writer.write(text)
+
+        self._report_postprocess(processor)
+        self._report_saved(filepath, writer.changed)
         return filepath
 
+    async def generate_complete_post(
+        self,
+        conversations: list[Conversation],
+        target_date: datetime,
+        end_date: Optional[datetime] = None
+    ) -> str:
+        """
+        본문을 생성해 후처리 (단일 날짜의 save_post_stream과 같은 규칙)
+
+        제목/태그는 본문의 프론트매터, 없으면 첫 '# 제목' 줄, 그것도 없으면 기본 제목을 씁니다.
+        따로 요청하지 않으므로 같은 날짜는 --date로 발행하든 --from/--to로 발행하든 같은 포스트가 됩니다.
+
+        Returns:
+            후처리를 마친 블로그 포스트 (save_post(..., postprocess=False)로 저장)
+        """
+        content = await self.generate_post(conversations, target_date, end_date)
+        processor = self.post_processor(target_date, end_date=end_date)
+        post = processor.process(content)
+
+        self._report_postprocess(processor)
+        return post
+
+    async def generate_posts(
+        self,
+        targets: list[tuple[list[Conversation], datetime]]
+    ) -> list:
+        """
+        여러 날짜의 포스트를 동시에 생성
+
+        Args:
+            targets: (대화 리스트, 포스트 날짜) 리스트
+
+        Returns:
+            targets 순서대로 포스트 문자열 또는 실패한 경우 예외 객체
+        """
+        return await asyncio.gather(
+            *(self.generate_complete_post(conversations, target_date)
+              for conversations, target_date in targets),
+            return_exceptions=True
+        )
+
 
 def main():
     """테스트용 메인 함수"""
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+저장한 포스트 파일만 골라 커밋하고 푸시
+
+`git status --porcelain` + `git add .`는 실행할 때마다 워킹 트리 전체를 훑고, logs/나 .env처럼
+저장소에 있는 다른 파일까지 커밋할 위험이 있습니다. 여기서는 save_post/save_to_docs가 돌려준
+경로만 git plumbing으로 커밋합니다.
+
+1. 임시 인덱스(GIT_INDEX_FILE)에 HEAD 트리를 읽음 (read-tree, 워킹 트리를 훑지 않음)
+2. 파일들을 한 번에 blob으로 저장 (hash-object -w --stdin-paths)
+3. 임시 인덱스에 경로들을 한 번에 반영 (update-index --index-info, 없어진 파일은
+   update-index --force-remove) 후 write-tree
+4. 트리가 HEAD와 같으면 커밋하지 않음, 다르면 commit-tree + update-ref (HEAD가 그 사이 바뀌었으면 실패)
+5. 실제 인덱스에도 같은 경로만 반영해 git status가 깨끗하게 보이도록 함
+6. 실행마다 push는 한 번 (새 커밋이 없어도 지난 실행에서 push하지 못한 커밋이 있으면 push)
+
+사용자가 실제 인덱스에 스테이징해 둔 다른 변경은 커밋에 섞이지 않고 그대로 남습니다.
+plumbing으로 커밋하므로 pre-commit/commit-msg 훅은 실행되지 않습니다.
+"""
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+class GitPublisher:
+    """
+    지정한 경로만 커밋하고 푸시
+
+    사용 예:
+        publisher = GitPublisher(blog_dir)
+        publisher.publish([post_path], "Add daily learning post: 2026-02-01")
+    """
+
+    def __init__(self, repo_dir: Path, remote: Optional[str] = None):
+        """
+        Args:
+            repo_dir: 저장소 디렉토리 (워킹 트리 루트)
+            remote: push할 원격 이름 (None이면 git push 기본 동작, 보통 현재 브랜치의 upstream)
+        """
+        self.repo_dir = Path(repo_dir).resolve()
+        self.remote = remote
+
+    def _git(
+        self,
+        *args: str,
+        input: Optional[str] = None,
+        env: Optional[dict] = None,
+        check: bool = True
+    ) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ['git', *args],
+            cwd=self.repo_dir,
+            input=input,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=check,
+        )
+
+    def _relative(self, path: Path) -> str:
+        """저장소 기준 상대 경로 (저장소 밖이거나 디렉토리면 ValueError, 없는 파일은 삭제로 취급)"""
+        resolved = Path(path).resolve()
+        try:
+            relative = resolved.relative_to(self.repo_dir)
+        except ValueError:
+            raise ValueError(f"저장소 밖의 경로입니다: {path}") from None
+        if resolved.exists() and not resolved.is_file():
+            raise ValueError(f"파일이 아닙니다: {path}")
+        return relative.as_posix()
+
+    def _head(self) -> Optional[str]:
+        """HEAD 커밋 (아직 커밋이 없으면 None)"""
+        result = self._git('rev-parse', '--verify', '--quiet', 'HEAD^{commit}', check=False)
+        return result.stdout.strip() or None
+
+    def commit(self, paths: Iterable[Path], message: str) -> Optional[str]:
+        """
+        paths만 담은 커밋을 만들어 HEAD를 옮김
+
+        Args:
+            paths: 커밋할 파일 경로들 (저장소 안의 파일, 없어진 파일은 커밋에서 삭제)
+            message: 커밋 메시지
+
+        Returns:
+            새 커밋 해시 (HEAD와 바뀐 내용이 없으면 None)
+
+        Raises:
+            ValueError: 저장소 밖의 경로이거나 디렉토리인 경우
+            subprocess.CalledProcessError: git 명령 실패 (HEAD가 도중에 바뀐 경우 포함)
+        """
+        relative = sorted({self._relative(path) for path in paths})
+        if not relative:
+            return None
+
+        head = self._head()
+        present = [path for path in relative if (self.repo_dir / path).is_file()]
+        removed = [path for path in relative if path not in present]
+        blobs = self._git(
+            'hash-object', '-w', '--stdin-paths', input=''.join(f"{path}\n" for path in present)
+        ).stdout.split() if present else []
+        index_info = ''.join(
+            f"{self._mode(path)} {blob}\t{path}\n" for path, blob in zip(present, blobs)
+        )
+
+        with tempfile.TemporaryDirectory(prefix='recoblog-index-') as tmp:
+            env = {**os.environ, 'GIT_INDEX_FILE': str(Path(tmp) / 'index')}
+            if head is not None:
+                self._git('read-tree', head, env=env)
+            self._update_index(index_info, removed, env=env)
+            tree = self._git('write-tree', env=env).stdout.strip()
+
+        if head is not None and tree == self._git('rev-parse', f'{head}^{{tree}}').stdout.strip():
+            return None
+
+        parents = ['-p', head] if head is not None else []
+        commit = self._git('commit-tree', tree, *parents, '-m', message).stdout.strip()
+        # HEAD가 그 사이 다른 커밋으로 바뀌었으면 덮어쓰지 않고 실패
+        self._git('update-ref', '-m', f"commit: {message.splitlines()[0]}", 'HEAD', commit, head or '')
+        # 실제 인덱스에는 커밋한 경로만 반영 (사용자가 스테이징한 다른 변경은 유지)
+        self._update_index(index_info, removed)
+        return commit
+
+    def _update_index(self, index_info: str, removed: list[str], env: Optional[dict] = None) -> None:
+        """인덱스에 새 blob들을 반영하고 없어진 경로는 뺌 (env로 임시 인덱스 지정)"""
+        if index_info:
+            self._git('update-index', '--add', '--index-info', input=index_info, env=env)
+        if removed:
+            self._git(
+                'update-index', '--force-remove', '-z', '--stdin',
+                input=''.join(f"{path}\0" for path in removed), env=env
+            )
+
+    def _mode(self, relative: str) -> str:
+        return '100755' if os.access(self.repo_dir / relative, os.X_OK) else '100644'
+
+    def _unpushed(self) -> bool:
+        """upstream보다 앞선 커밋이 있는지 (upstream이 없으면 False)"""
+        result = self._git('rev-list', '--count', '@{upstream}..HEAD', check=False)
+        return result.returncode == 0 and result.stdout.strip() not in ('', '0')
+
+    def push(self) -> None:
+        """현재 브랜치 push (실패하면 CalledProcessError)"""
+        args = ['push']
+        if self.remote is not None:
+            args += [self.remote, 'HEAD']
+        self._git(*args)
+
+    def publish(self, paths: Iterable[Path], message: str) -> bool:
+        """
+        paths를 커밋하고 한 번 push
+
+        Returns:
+            성공 여부 (바뀐 내용이 없어도 True)
+        """
+        try:
+            commit = self.commit(paths, message)
+            if commit is None:
+                if not self._unpushed():
+                    print("[정보] 커밋할 변경사항이 없습니다.")
+                    return True
+                print("[정보] 커밋할 변경사항은 없고, 아직 푸시하지 못한 커밋을 푸시합니다.")
+            self.push()
+        except ValueError as e:
+            print(f"[오류] Git 작업 실패: {e}")
+            return False
+        except subprocess.CalledProcessError as e:
+            detail = (e.stderr or '').strip()
+            print(f"[오류] Git 작업 실패: {e}" + (f"\n{detail}" if detail else ''))
+            return False
+
+        if commit is None:
+            print("[성공] Git 푸시 완료!")
+        else:
+            print(f"[성공] Git 커밋 및 푸시 완료! ({commit[:7]})")
+        return True
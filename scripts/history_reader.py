@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+~/.claude/history.jsonl 읽기 도구
+
+history.jsonl은 계속 뒤에 덧붙여지기만 하는 파일입니다. 두 가지 읽기 방식을 제공합니다.
+
+- HistoryCheckpoint: 마지막으로 읽은 위치(byte offset), inode, 크기와 날짜별 세션 맵을
+  체크포인트로 저장하고, 다음 실행에서는 새로 추가된 꼬리 부분만 파싱합니다.
+- scan_history_by_date / scan_history_window: 상태 없이 파일을 mmap하고, timestamp 순서로 쌓인다는 점을 이용해
+  줄 경계 기준 이진 탐색으로 구간 시작점을 찾은 뒤 구간 끝에서 멈춥니다.
+"""
+
+import json
+import mmap
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .state import load_json_state, save_json_state
+
+# 체크포인트 형식 버전 (형식이 바뀌면 올려서 전체 재스캔 유도)
+CHECKPOINT_VERSION = 1
+
+# 기록 순서가 timestamp 순서와 어긋날 수 있는 최대 폭 (밀리초)
+# 이진 탐색 구간을 이만큼 넓혀서 작은 순서 뒤바뀜에도 선형 스캔과 같은 결과를 보장
+ORDER_SLACK_MS = 10 * 60 * 1000
+
+# 파일 교체 감지용으로 앞부분 몇 바이트를 지문으로 사용
+HEAD_FINGERPRINT_BYTES = 1024
+
+
+def _head_fingerprint(f, limit: int) -> int:
+    """파일 앞부분 최대 limit 바이트의 CRC32"""
+    f.seek(0)
+    return zlib.crc32(f.read(min(limit, HEAD_FINGERPRINT_BYTES)))
+
+
+def history_date_key(ts_ms) -> Optional[str]:
+    """밀리초 타임스탬프를 로컬 날짜 키(YYYY-MM-DD)로 변환"""
+    if isinstance(ts_ms, bool) or not isinstance(ts_ms, (int, float)):
+        return None
+    try:
+        return datetime.fromtimestamp(ts_ms / 1000).strftime('%Y-%m-%d')
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+class HistoryCheckpoint:
+    """
+    history.jsonl 증분 스캔 체크포인트
+
+    저장 형식:
+        {
+            "version": 1,
+            "inode": int, "size": int, "offset": int, "head": int,
+            "sessions_by_date": {"YYYY-MM-DD": {project: [session_id, ...]}}
+        }
+    """
+
+    def __init__(self, path: Path, loads: Callable[[bytes], Any] = json.loads):
+        """
+        Args:
+            path: 체크포인트 파일 경로
+            loads: 줄 디코딩 함수 (json_backend 참고)
+        """
+        self.path = path
+        self.loads = loads
+
+    def _load(self) -> dict:
+        state = load_json_state(self.path, default={})
+        if not isinstance(state, dict) or state.get('version') != CHECKPOINT_VERSION:
+            return {}
+        return state
+
+    def refresh(self, history_file: Path) -> dict[str, dict[str, set[str]]]:
+        """
+        체크포인트 이후에 추가된 부분만 읽어 날짜별 세션 맵을 갱신
+
+        파일이 잘렸거나(크기 감소) 교체된 경우(inode 또는 앞부분 지문 변경)에는
+        처음부터 다시 스캔합니다.
+
+        Args:
+            history_file: history.jsonl 경로
+
+        Returns:
+            dict[날짜 키, dict[project_path, set[session_ids]]]
+        """
+        state = self._load()
+
+        with open(history_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            offset = state.get('offset', 0)
+
+            resume = (
+                bool(state)
+                and state.get('inode') == st.st_ino
+                and state.get('size', 0) <= st.st_size
+                and 0 <= offset <= st.st_size
+                and state.get('head') == _head_fingerprint(f, offset)
+            )
+
+            if resume:
+                sessions_by_date = {
+                    day: {project: set(ids) for project, ids in projects.items()}
+                    for day, projects in state.get('sessions_by_date', {}).items()
+                }
+            else:
+                if state:
+                    print("[정보] history.jsonl이 잘렸거나 교체되어 처음부터 다시 스캔합니다.")
+                sessions_by_date = {}
+                offset = 0
+
+            if resume and offset == st.st_size:
+                return sessions_by_date
+
+            f.seek(offset)
+            for line in f:
+                # 아직 쓰는 중인 마지막 줄은 다음 실행에서 다시 읽음
+                if not line.endswith(b'\n'):
+                    break
+                offset += len(line)
+                entry = _parse_history_line(line, self.loads)
+                if entry is None:
+                    continue
+
+                day = history_date_key(entry.get('timestamp', 0))
+                project = entry.get('project', '')
+                session_id = entry.get('sessionId', '')
+                if day and project and session_id:
+                    sessions_by_date.setdefault(day, {}).setdefault(project, set()).add(session_id)
+
+            head = _head_fingerprint(f, offset)
+
+        save_json_state(self.path, {
+            'version': CHECKPOINT_VERSION,
+            'inode': st.st_ino,
+            'size': st.st_size,
+            'offset': offset,
+            'head': head,
+            'sessions_by_date': {
+                day: {project: sorted(ids) for project, ids in projects.items()}
+                for day, projects in sessions_by_date.items()
+            },
+        })
+        return sessions_by_date
+
+
+def _parse_history_line(line: bytes, loads: Callable[[bytes], Any] = json.loads) -> Optional[dict]:
+    """history.jsonl 한 줄 파싱 (실패하면 None)"""
+    if not line.strip():
+        return None
+    try:
+        entry = loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _entry_timestamp(entry: Optional[dict]):
+    """엔트리의 숫자 timestamp (없거나 숫자가 아니면 None)"""
+    if entry is None:
+        return None
+    ts = entry.get('timestamp')
+    if isinstance(ts, bool) or not isinstance(ts, (int, float)):
+        return None
+    return ts
+
+
+def _line_start_at(mm, pos: int) -> int:
+    """pos 이상인 첫 줄 시작 위치"""
+    if pos <= 0:
+        return 0
+    newline = mm.find(b'\n', pos - 1)
+    return len(mm) if newline < 0 else newline + 1
+
+
+def _first_timestamp_from(mm, pos: int, loads: Callable[[bytes], Any]):
+    """pos 이후 첫 줄부터 읽어 처음으로 만나는 유효한 timestamp"""
+    size = len(mm)
+    start = _line_start_at(mm, pos)
+    while start < size:
+        end = mm.find(b'\n', start)
+        if end < 0:
+            end = size
+        ts = _entry_timestamp(_parse_history_line(mm[start:end], loads))
+        if ts is not None:
+            return ts
+        start = end + 1
+    return None
+
+
+def _seek_timestamp(mm, target_ts, loads: Callable[[bytes], Any]) -> int:
+    """timestamp가 target_ts 이상인 첫 줄의 시작 위치를 이진 탐색"""
+    lo, hi = 0, len(mm)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ts = _first_timestamp_from(mm, mid, loads)
+        if ts is None or ts >= target_ts:
+            hi = mid
+        else:
+            lo = mid + 1
+    return _line_start_at(mm, lo)
+
+
+def scan_history_by_date(
+    history_file: Path,
+    start_ts: int,
+    end_ts: int,
+    slack_ms: int = ORDER_SLACK_MS,
+    loads: Callable[[bytes], Any] = json.loads
+) -> dict[str, dict[str, set[str]]]:
+    """
+    [start_ts, end_ts) 구간의 세션 ID들을 로컬 날짜별, 프로젝트별로 수집 (상태 없는 빠른 경로)
+
+    O(log n)번의 탐색과 해당 구간 크기만큼만 읽습니다. 순서가 slack_ms 이내로만
+    어긋나 있다면 전체 선형 스캔과 정확히 같은 결과를 반환합니다.
+
+    Args:
+        history_file: history.jsonl 경로
+        start_ts: 구간 시작 (밀리초, 포함)
+        end_ts: 구간 끝 (밀리초, 미포함)
+        slack_ms: 순서 뒤바뀜 허용 폭
+        loads: 줄 디코딩 함수 (json_backend 참고)
+
+    Returns:
+        dict[날짜 키, dict[project_path, set[session_ids]]]
+    """
+    sessions_by_date: dict[str, dict[str, set[str]]] = {}
+
+    with open(history_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return sessions_by_date
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = _seek_timestamp(mm, start_ts - slack_ms, loads)
+            stop_ts = end_ts + slack_ms
+
+            while pos < size:
+                end = mm.find(b'\n', pos)
+                if end < 0:
+                    end = size
+                entry = _parse_history_line(mm[pos:end], loads)
+                pos = end + 1
+
+                ts = _entry_timestamp(entry)
+                if ts is None:
+                    continue
+                if ts >= stop_ts:
+                    break
+                if start_ts <= ts < end_ts:
+                    day = history_date_key(ts)
+                    project = entry.get('project', '')
+                    session_id = entry.get('sessionId', '')
+                    if day and project and session_id:
+                        sessions_by_date.setdefault(day, {}).setdefault(project, set()).add(session_id)
+
+    return sessions_by_date
+
+
+def scan_history_window(
+    history_file: Path,
+    start_ts: int,
+    end_ts: int,
+    slack_ms: int = ORDER_SLACK_MS,
+    loads: Callable[[bytes], Any] = json.loads
+) -> dict[str, set[str]]:
+    """
+    [start_ts, end_ts) 구간의 세션 ID들을 프로젝트별로 수집 (scan_history_by_date 참고)
+
+    Returns:
+        dict[project_path, set[session_ids]]
+    """
+    sessions_by_project: dict[str, set[str]] = {}
+    for projects in scan_history_by_date(history_file, start_ts, end_ts, slack_ms, loads).values():
+        for project, session_ids in projects.items():
+            sessions_by_project.setdefault(project, set()).update(session_ids)
+    return sessions_by_project
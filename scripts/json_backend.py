@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+JSONL 디코딩 백엔드
+
+history.jsonl과 agent-*.jsonl의 각 줄을 bytes 그대로 디코딩합니다.
+기본값은 표준 라이브러리 json이고, 설치되어 있다면 orjson이나 msgspec(타입 지정 Struct)을
+선택할 수 있습니다.
+
+선택 방법:
+- ConversationCollector(json_backend="orjson")
+- 환경 변수 RECOBLOG_JSON_BACKEND=msgspec
+- publish.py --json-backend orjson
+
+또한 전체 디코딩 전에 bytes 단계에서 돌리는 값싼 사전 필터를 제공합니다.
+사전 필터는 보수적이어서, 통과하지 못한 줄은 디코딩해도 반드시 버려지는 줄입니다.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Optional
+
+# 사용 가능한 백엔드 이름
+BACKENDS = ('stdlib', 'orjson', 'msgspec')
+
+# 기본 백엔드를 지정하는 환경 변수
+BACKEND_ENV = 'RECOBLOG_JSON_BACKEND'
+
+# JSON 디코딩 없이 줄에서 필드 값을 찾는 패턴
+# 문자열 값 안의 따옴표는 \" 로 이스케이프되므로 본문 텍스트와는 겹치지 않음
+SESSION_ID_PATTERN = re.compile(rb'"sessionId"\s*:\s*"([^"\\]+)"')
+TIMESTAMP_PATTERN = re.compile(rb'"timestamp"\s*:\s*"([^"\\]+)"')
+
+# 최상위 type이 user/assistant인 줄에는 반드시 이 패턴이 들어 있음
+MESSAGE_TYPE_PATTERN = re.compile(rb'"type"\s*:\s*"(?:user|assistant)"')
+
+
+class TranscriptEntry(NamedTuple):
+    """agent-*.jsonl 한 줄에서 수집기가 사용하는 필드"""
+    type: str
+    timestamp: str
+    session_id: str
+    role: str
+    content: Any
+
+
+def _entry_from_dict(entry: Any) -> Optional[TranscriptEntry]:
+    """dict로 디코딩된 줄을 TranscriptEntry로 변환"""
+    if not isinstance(entry, dict):
+        return None
+    msg_type = entry.get('type') or ''
+    message = entry.get('message')
+    if not isinstance(message, dict):
+        message = {}
+    return TranscriptEntry(
+        type=msg_type,
+        timestamp=entry.get('timestamp') or '',
+        session_id=entry.get('sessionId') or '',
+        role=message.get('role') or msg_type,
+        content=[] if message.get('content') is None else message['content'],
+    )
+
+
+class JsonBackend:
+    """
+    JSON 디코딩 백엔드
+
+    Attributes:
+        name: 백엔드 이름
+        loads: bytes → 파이썬 객체 (실패 시 ValueError)
+    """
+
+    def __init__(self, name: str, loads: Callable[[bytes], Any]):
+        self.name = name
+        self.loads = loads
+
+    def decode_transcript(self, line: bytes) -> Optional[TranscriptEntry]:
+        """
+        agent-*.jsonl 한 줄 디코딩
+
+        Returns:
+            TranscriptEntry (JSON 객체가 아니면 None)
+
+        Raises:
+            ValueError: JSON 형식이 잘못된 경우
+        """
+        return _entry_from_dict(self.loads(line))
+
+
+class _MsgspecBackend(JsonBackend):
+    """필요한 필드만 타입 지정 Struct로 디코딩하는 msgspec 백엔드"""
+
+    def __init__(self):
+        import msgspec
+
+        class _Message(msgspec.Struct):
+            role: Optional[str] = None
+            content: Any = None
+
+        class _Entry(msgspec.Struct):
+            type: Optional[str] = None
+            timestamp: Optional[str] = None
+            sessionId: Optional[str] = None
+            message: Optional[_Message] = None
+
+        self._errors = (msgspec.DecodeError, msgspec.ValidationError)
+        self._entry_decoder = msgspec.json.Decoder(_Entry)
+        generic_decoder = msgspec.json.Decoder()
+
+        def loads(data: bytes) -> Any:
+            try:
+                return generic_decoder.decode(data)
+            except self._errors as e:
+                raise ValueError(str(e)) from e
+
+        super().__init__('msgspec', loads)
+
+    def decode_transcript(self, line: bytes) -> Optional[TranscriptEntry]:
+        try:
+            entry = self._entry_decoder.decode(line)
+        except self._errors as e:
+            raise ValueError(str(e)) from e
+        msg_type = entry.type or ''
+        message = entry.message
+        return TranscriptEntry(
+            type=msg_type,
+            timestamp=entry.timestamp or '',
+            session_id=entry.sessionId or '',
+            role=(message.role if message else None) or msg_type,
+            content=message.content if message and message.content is not None else [],
+        )
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    이름으로 백엔드 생성 (None이면 환경 변수, 없으면 stdlib)
+
+    Raises:
+        ValueError: 알 수 없는 이름이거나 패키지가 설치되지 않은 경우
+    """
+    name = name or os.environ.get(BACKEND_ENV) or 'stdlib'
+
+    if name == 'stdlib':
+        return JsonBackend('stdlib', json.loads)
+
+    if name == 'orjson':
+        try:
+            import orjson
+        except ImportError:
+            raise ValueError("orjson 패키지가 설치되지 않았습니다.\n실행: pip install orjson")
+        return JsonBackend('orjson', orjson.loads)
+
+    if name == 'msgspec':
+        try:
+            return _MsgspecBackend()
+        except ImportError:
+            raise ValueError("msgspec 패키지가 설치되지 않았습니다.\n실행: pip install msgspec")
+
+    raise ValueError(f"알 수 없는 JSON 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+
+
+def may_contain_message(line: bytes, start_iso: bytes, end_iso: bytes) -> bool:
+    """
+    전체 디코딩 전 사전 필터
+
+    user/assistant 타입 표시가 없거나, 줄 안의 어떤 timestamp도
+    [start_iso, end_iso) 구간에 들지 않으면 False를 반환합니다.
+
+    Args:
+        line: agent-*.jsonl 한 줄 (bytes)
+        start_iso: 구간 시작 UTC 문자열 (예: b'2026-02-05T15:00:00')
+        end_iso: 구간 끝 UTC 문자열
+    """
+    if MESSAGE_TYPE_PATTERN.search(line) is None:
+        return False
+    for match in TIMESTAMP_PATTERN.finditer(line):
+        value = match.group(1)
+        # 정규 UTC 형식('...Z')이 아닌 timestamp는 판단하지 않고 디코딩에 맡김
+        if len(value) < 20 or not value.endswith(b'Z') or value[10:11] != b'T':
+            return True
+        if start_iso <= value < end_iso:
+            return True
+    return False
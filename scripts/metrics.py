@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+발행 파이프라인 단계별 측정
+
+publish.py의 각 단계(collect, generate, save, index, git)마다 벽시계 시간과 CPU 시간,
+단계별 카운터(읽은 바이트, 파싱한 줄, 건너뛴 JSON 오류, 연 파일/건너뛴 파일 등),
+LLM 요청별 지연 시간과 토큰 수를 모아 실행마다 JSON 파일 하나로 저장합니다.
+
+저장 위치: logs/metrics-{실행 시각}.json (launchd 로그와 같은 디렉토리)
+    {
+        "run_id": str, "started": ISO 8601, "command": [str, ...],
+        "stages": {"collect": {"runs": int, "wall_seconds": float, "cpu_seconds": float, "counters": {...}}, ...},
+        "llm": {"requests": int, "cached": int, "prompt_tokens": int, "completion_tokens": int,
+                "latency_seconds": {"mean", "p50", "p95", "max"},
+                "first_token_seconds": {...}, "calls": [...]}
+    }
+
+profile을 켜면 단계마다 cProfile 결과를 logs/profile-{실행 시각}-{단계}.prof로 남깁니다
+(python3 -m pstats 또는 snakeviz로 확인).
+"""
+
+import cProfile
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .state import atomic_write_text
+
+# 기본 로그 디렉토리 (저장소 루트/logs, launchd 로그와 같은 곳)
+DEFAULT_LOG_DIR = Path(__file__).parent.parent / "logs"
+
+
+def _children_cpu_seconds() -> float:
+    """종료된 자식 프로세스(병렬 수집 워커)의 누적 CPU 시간"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _distribution(values: list[float]) -> dict:
+    """평균/중앙값/95백분위/최댓값 (값이 없으면 빈 dict)"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        'mean': round(sum(ordered) / len(ordered), 4),
+        'p50': round(ordered[len(ordered) // 2], 4),
+        'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        'max': round(ordered[-1], 4),
+    }
+
+
+@dataclass
+class StageMetrics:
+    """단계 하나의 측정값 (같은 단계를 여러 번 실행하면 누적, 카운터만 있으면 runs 0)"""
+    runs: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    counters: dict = field(default_factory=dict)
+
+
+@dataclass
+class LLMCall:
+    """LLM 요청 하나 (캐시 적중이면 latency 0)"""
+    stage: str
+    latency_seconds: float
+    prompt_tokens: int
+    completion_tokens: int
+    first_token_seconds: Optional[float] = None
+    stream: bool = False
+    cached: bool = False
+
+
+class PipelineMetrics:
+    """
+    실행 하나의 단계별 측정값 모음
+
+    사용 예:
+        metrics = PipelineMetrics(profile=args.profile)
+        with metrics.stage('collect'):
+            conversations = collector.collect_all(target_date)
+        metrics.count('collect', 'conversations', len(conversations))
+        metrics.write()
+    """
+
+    def __init__(self, log_dir: Optional[Path] = None, profile: bool = False):
+        """
+        Args:
+            log_dir: 측정 파일을 저장할 디렉토리 (기본값: 저장소의 logs/)
+            profile: 단계마다 cProfile 결과도 저장
+        """
+        self.log_dir = log_dir or DEFAULT_LOG_DIR
+        self.profile = profile
+        self.started = datetime.now()
+        self.run_id = self.started.strftime('%Y%m%d-%H%M%S')
+        self.command = list(sys.argv)
+        self.stages: dict[str, StageMetrics] = {}
+        self.llm_calls: list[LLMCall] = []
+        self.profile_paths: list[Path] = []
+        self.current_stage: Optional[str] = None
+
+    def _stage(self, name: str) -> StageMetrics:
+        return self.stages.setdefault(name, StageMetrics())
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """블록 실행 시간을 name 단계에 더함 (profile이면 cProfile도 실행)"""
+        stage = self._stage(name)
+        previous, self.current_stage = self.current_stage, name
+        profiler = cProfile.Profile() if self.profile else None
+
+        wall = time.perf_counter()
+        cpu = time.process_time() + _children_cpu_seconds()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield stage
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            stage.runs += 1
+            stage.wall_seconds += time.perf_counter() - wall
+            stage.cpu_seconds += time.process_time() + _children_cpu_seconds() - cpu
+            self.current_stage = previous
+            if profiler is not None:
+                self._dump_profile(name, profiler)
+
+    def _dump_profile(self, name: str, profiler: cProfile.Profile) -> None:
+        path = self.log_dir / f"profile-{self.run_id}-{name}.prof"
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(path)
+        except OSError as e:
+            print(f"[경고] 프로파일 저장 실패: {path}: {e}")
+            return
+        if path not in self.profile_paths:
+            self.profile_paths.append(path)
+
+    def count(self, stage: str, name: str, value: float = 1) -> None:
+        """stage 단계의 name 카운터에 value를 더함"""
+        counters = self._stage(stage).counters
+        counters[name] = counters.get(name, 0) + value
+
+    def count_all(self, stage: str, values: dict) -> None:
+        """여러 카운터를 한 번에 더함"""
+        for name, value in values.items():
+            self.count(stage, name, value)
+
+    def record_llm(
+        self,
+        latency_seconds: float,
+        prompt_tokens: int,
+        completion_tokens: int,
+        first_token_seconds: Optional[float] = None,
+        stream: bool = False,
+        cached: bool = False
+    ) -> None:
+        """LLM 요청 하나 기록 (현재 실행 중인 단계에 묶음)"""
+        self.llm_calls.append(LLMCall(
+            stage=self.current_stage or '',
+            latency_seconds=round(latency_seconds, 4),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            first_token_seconds=None if first_token_seconds is None else round(first_token_seconds, 4),
+            stream=stream,
+            cached=cached,
+        ))
+
+    def llm_summary(self) -> dict:
+        """LLM 요청 집계 (캐시 적중은 요청 수와 지연 시간 분포에서 제외)"""
+        requested = [call for call in self.llm_calls if not call.cached]
+        return {
+            'requests': len(requested),
+            'cached': len(self.llm_calls) - len(requested),
+            'prompt_tokens': sum(call.prompt_tokens for call in requested),
+            'completion_tokens': sum(call.completion_tokens for call in requested),
+            'latency_seconds': _distribution([call.latency_seconds for call in requested]),
+            'first_token_seconds': _distribution([
+                call.first_token_seconds for call in requested if call.first_token_seconds is not None
+            ]),
+            'calls': [asdict(call) for call in self.llm_calls],
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            'run_id': self.run_id,
+            'started': self.started.isoformat(timespec='seconds'),
+            'command': self.command,
+            'pid': os.getpid(),
+            'stages': {
+                name: {
+                    'runs': stage.runs,
+                    'wall_seconds': round(stage.wall_seconds, 4),
+                    'cpu_seconds': round(stage.cpu_seconds, 4),
+                    'counters': stage.counters,
+                }
+                for name, stage in self.stages.items()
+            },
+            'llm': self.llm_summary(),
+            'profiles': [str(path) for path in self.profile_paths],
+        }
+
+    def write(self) -> Optional[Path]:
+        """측정 파일 저장 (실패해도 발행은 계속되도록 경고만 출력)"""
+        path = self.log_dir / f"metrics-{self.run_id}.json"
+        try:
+            atomic_write_text(path, json.dumps(self.to_dict(), ensure_ascii=False, indent=2))
+        except OSError as e:
+            print(f"[경고] 측정 파일 저장 실패: {path}: {e}")
+            return None
+        return path
+
+    def summary(self) -> str:
+        """단계별 시간과 LLM 요청 요약 문자열"""
+        parts = [
+            f"{name} {stage.wall_seconds:.2f}s (CPU {stage.cpu_seconds:.2f}s)"
+            for name, stage in self.stages.items()
+            if stage.runs
+        ]
+        llm = self.llm_summary()
+        if llm['requests'] or llm['cached']:
+            latency = llm['latency_seconds'].get('mean')
+            parts.append(
+                f"LLM {llm['requests']}회"
+                + (f" 평균 {latency:.2f}s" if latency is not None else "")
+                + (f" (캐시 {llm['cached']}회)" if llm['cached'] else "")
+                + f", 토큰 {llm['prompt_tokens']:,}→{llm['completion_tokens']:,}"
+            )
+        return "측정: " + ", ".join(parts)
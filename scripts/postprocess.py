@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+생성된 마크다운 포스트 후처리
+
+LLM 응답을 저장하기 전에 한 번에 훑으며 다음을 처리합니다.
+
+1. 유니코드 특수 문자 → 표준 ASCII (미리 만든 str.translate 표, 조각마다 적용)
+2. 프론트매터: 응답이 프론트매터로 시작하면 파싱해 필수 키(layout, title, parent, date, tags)가
+   빠졌거나 비어 있으면 채우고, 없으면 기본 프론트매터를 앞에 붙임
+3. 코드 블록: 언어 표시가 없는 여는 펜스에 DEFAULT_FENCE_LANGUAGE를 붙이고,
+   끝까지 닫히지 않은 펜스는 닫음 (펜스 판정은 CommonMark 규칙: 들여쓰기 3칸 이하,
+   백틱 펜스의 info 문자열에는 백틱이 없음, 닫는 펜스 뒤에는 공백만)
+4. 제목/태그: 응답의 프론트매터에 있으면 그대로 사용 (제목/태그를 따로 요청하지 않음),
+   프론트매터가 없으면 본문 첫 줄의 '# 제목'을 제목으로 사용
+
+PostProcessor는 줄 단위 상태 기계라 스트리밍 조각을 받는 대로 feed()로 넘기고 마지막에
+finish()를 부르면 process()로 전체 문자열을 한 번에 처리한 것과 같은 결과를 돌려줍니다.
+"""
+
+import re
+from collections import Counter
+from typing import Optional
+
+# 유니코드 특수 문자 → 표준 ASCII
+# 모든 키가 코드 포인트 하나이므로 스트리밍 조각마다 따로 적용해도 전체에 적용한 결과와 같음
+UNICODE_REPLACEMENTS = str.maketrans({
+    '\u2011': '-',  # NON-BREAKING HYPHEN
+    '\u2010': '-',  # HYPHEN
+    '\u2012': '-',  # FIGURE DASH
+    '\u2013': '-',  # EN DASH
+    '\u2014': '-',  # EM DASH
+    '\u2015': '-',  # HORIZONTAL BAR
+    '\u2018': "'",  # LEFT SINGLE QUOTATION
+    '\u2019': "'",  # RIGHT SINGLE QUOTATION
+    '\u201C': '"',  # LEFT DOUBLE QUOTATION
+    '\u201D': '"',  # RIGHT DOUBLE QUOTATION
+    '\u2026': '...',  # HORIZONTAL ELLIPSIS
+    '\u00A0': ' ',  # NO-BREAK SPACE
+})
+
+# 프론트매터 필수 키 (이 순서로 채움)
+REQUIRED_KEYS = ('layout', 'title', 'parent', 'date', 'tags')
+
+DEFAULT_LAYOUT = 'default'
+DEFAULT_PARENT = '학습 기록'
+DEFAULT_TAGS = ('til', 'claude-code')
+
+# 언어 표시가 없는 코드 블록에 붙일 언어 (rouge의 일반 텍스트 렉서)
+DEFAULT_FENCE_LANGUAGE = 'text'
+
+# 이 줄 수 안에 닫는 '---'가 없으면 프론트매터가 아닌 본문으로 취급
+MAX_FRONTMATTER_LINES = 50
+
+_KEY_PATTERN = re.compile(r'([A-Za-z_][\w-]*)\s*:(.*)')
+_FENCE_PATTERN = re.compile(r' {0,3}(`{3,}|~{3,})(.*)')
+
+# 후처리 내역 이름 → 요약에 쓸 설명
+ISSUE_LABELS = {
+    'frontmatter_added': '프론트매터 추가',
+    'frontmatter_unterminated': '닫히지 않은 프론트매터',
+    'frontmatter_invalid_line': '해석할 수 없는 프론트매터 줄',
+    'key_filled': '빠진 프론트매터 키 채움',
+    'fence_language_added': '코드 블록 언어 표시 추가',
+    'fence_closed': '닫히지 않은 코드 블록 닫음',
+}
+
+
+def normalize_unicode(text: str) -> str:
+    """유니코드 특수 문자를 표준 ASCII로 변환"""
+    return text.translate(UNICODE_REPLACEMENTS)
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        quote, value = value[0], value[1:-1]
+        if quote == '"':
+            value = value.replace('\\"', '"').replace('\\\\', '\\')
+    return value
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def parse_tags(lines: list[str]) -> list[str]:
+    """
+    tags 키의 줄들을 태그 리스트로 변환
+
+    'tags: [a, b]', 'tags: a, b', 'tags:' 다음 줄들의 '- a' 형식을 지원합니다.
+    """
+    value = _KEY_PATTERN.match(lines[0]).group(2).strip()
+    if value.startswith('[') and value.endswith(']'):
+        items = value[1:-1].split(',')
+    elif value:
+        items = value.split(',')
+    else:
+        items = [line.strip()[1:] for line in lines[1:] if line.strip().startswith('-')]
+    return [tag for tag in (_unquote(item) for item in items) if tag]
+
+
+class Frontmatter:
+    """
+    프론트매터 줄들을 키별로 보관 (원래 줄과 순서를 유지)
+
+    값은 간단한 YAML만 해석합니다: 'key: value', 따옴표 문자열, 인라인/블록 리스트.
+    들여쓰기되었거나 '-'로 시작하는 줄은 앞 키의 값으로 이어 붙입니다.
+    """
+
+    def __init__(self, lines: list[str]):
+        self.fields: dict[str, list[str]] = {}
+        self.issues: Counter = Counter()
+        key = None
+        for line in lines:
+            match = _KEY_PATTERN.fullmatch(line.rstrip())
+            if match and not line[:1].isspace():
+                key = match.group(1)
+                self.fields[key] = [line]
+            elif key is not None and (not line.strip() or line[:1].isspace() or line.lstrip().startswith('-')):
+                self.fields[key].append(line)
+            else:
+                # 키 앞에 나온 줄이나 해석할 수 없는 줄은 그대로 보존
+                self.fields.setdefault(f'#{len(self.fields)}', []).append(line)
+                self.issues['frontmatter_invalid_line'] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """키의 한 줄 값 (따옴표 제거, 없거나 비어 있으면 None)"""
+        lines = self.fields.get(key)
+        if not lines:
+            return None
+        return _unquote(_KEY_PATTERN.match(lines[0]).group(2)) or None
+
+    def tags(self) -> Optional[list[str]]:
+        lines = self.fields.get('tags')
+        return parse_tags(lines) if lines else None
+
+    def set(self, key: str, value: str) -> None:
+        """키 값을 한 줄로 설정 (없으면 끝에 추가)"""
+        self.fields[key] = [f"{key}: {value}"]
+
+    def render(self) -> str:
+        lines = [line for lines in self.fields.values() for line in lines]
+        return '---\n' + ''.join(line + '\n' for line in lines) + '---\n'
+
+
+def split_frontmatter(text: str) -> tuple[Optional[Frontmatter], str]:
+    """
+    저장된 포스트를 (프론트매터, 본문)으로 나눔
+
+    Returns:
+        프론트매터가 없거나 닫히지 않았으면 (None, 원문)
+    """
+    if not text.startswith('---'):
+        return None, text
+    lines = text.split('\n')
+    if lines[0].strip() != '---':
+        return None, text
+    for index in range(1, min(len(lines), MAX_FRONTMATTER_LINES + 2)):
+        if lines[index].strip() == '---':
+            return Frontmatter(lines[1:index]), '\n'.join(lines[index + 1:])
+    return None, text
+
+
+class PostProcessor:
+    """
+    생성된 포스트를 줄 단위로 후처리 (스트리밍 조각 지원)
+
+    사용 예:
+        processor = PostProcessor(default_title="2026년 02월 01일 학습 기록", date="2026-02-01")
+        for chunk in chunks:
+            f.write(processor.feed(chunk))
+        f.write(processor.finish())
+        processor.title, processor.tags, processor.summary()
+
+    Attributes:
+        title: 최종 제목 (finish 후 확정)
+        tags: 최종 태그
+        source: 제목/태그 출처 ('frontmatter', 'given', 'heading', 'default')
+        issues: 후처리 내역 이름 → 횟수
+    """
+
+    def __init__(
+        self,
+        default_title: str,
+        date: str,
+        title: Optional[str] = None,
+        tags: Optional[list[str]] = None
+    ):
+        """
+        Args:
+            default_title: 제목을 알 수 없을 때 쓸 제목
+            date: 프론트매터 date 값 (YYYY-MM-DD)
+            title: 프론트매터가 없을 때 쓸 제목 (예: 제목/태그 요청 결과)
+            tags: 프론트매터가 없거나 tags가 비었을 때 쓸 태그
+        """
+        self.default_title = default_title
+        self.date = date
+        self.title = title or default_title
+        self.tags = list(tags) if tags else list(DEFAULT_TAGS)
+        self.source = 'given' if title else 'default'
+        self.issues: Counter = Counter()
+
+        self._given_title = title
+        self._state = 'head'
+        # 아직 줄바꿈이 오지 않은 마지막 줄의 조각들
+        self._pending: list[str] = []
+        self._held: list[str] = []
+        self._fence: Optional[str] = None
+
+    def process(self, text: str) -> str:
+        """전체 문자열을 한 번에 처리"""
+        return self.feed(text) + self.finish()
+
+    def feed(self, text: str) -> str:
+        """
+        조각 하나를 받아 지금까지 확정된 출력 반환 (마지막 줄바꿈 뒤는 다음 조각까지 보류)
+
+        새 조각만 훑으므로 긴 줄이 작은 조각으로 나뉘어 와도 전체 길이에 비례하는 시간만 듭니다.
+        """
+        text = text.translate(UNICODE_REPLACEMENTS)
+        if '\n' not in text:
+            if text:
+                self._pending.append(text)
+            return ''
+        head, *lines, tail = text.split('\n')
+        self._pending.append(head)
+        first = ''.join(self._pending)
+        self._pending = [tail] if tail else []
+        return self._line(first) + ''.join(self._line(line) for line in lines)
+
+    def finish(self) -> str:
+        """남은 내용을 처리하고 열린 프론트매터/코드 블록을 마무리"""
+        out = []
+        if self._pending:
+            line, self._pending = ''.join(self._pending), []
+            out.append(self._line(line, newline=False))
+        if self._state == 'head':
+            out.append(self._start_body(None))
+        elif self._state == 'frontmatter':
+            self.issues['frontmatter_unterminated'] += 1
+            out.append(self._abandon_frontmatter())
+        if self._fence is not None:
+            if out and not ''.join(out).endswith('\n'):
+                out.append('\n')
+            out.append(self._fence + '\n')
+            self._fence = None
+            self.issues['fence_closed'] += 1
+        return ''.join(out)
+
+    def summary(self) -> str:
+        """후처리 내역 요약 (없으면 빈 문자열)"""
+        return ', '.join(
+            f"{ISSUE_LABELS.get(name, name)} {count}회" for name, count in self.issues.items()
+        )
+
+    def _line(self, line: str, newline: bool = True) -> str:
+        if self._state == 'body':
+            return self._body_line(line) + ('\n' if newline else '')
+
+        if self._state == 'head':
+            if not line.strip():
+                self._held.append(line)
+                return ''
+            if line.strip() == '---':
+                self._state = 'frontmatter'
+                self._held = []
+                return ''
+            return self._start_body(line) + (self._body_line(line) + ('\n' if newline else ''))
+
+        # frontmatter
+        if line.strip() == '---':
+            return self._close_frontmatter()
+        self._held.append(line)
+        if len(self._held) > MAX_FRONTMATTER_LINES:
+            self.issues['frontmatter_unterminated'] += 1
+            return self._abandon_frontmatter()
+        return ''
+
+    def _start_body(self, first_line: Optional[str]) -> str:
+        """프론트매터 없이 본문 시작: 기본 프론트매터 (첫 줄이 '# 제목'이면 그 제목)"""
+        if first_line is not None and self._given_title is None and first_line.startswith('# '):
+            self.title = first_line[2:].strip() or self.default_title
+            self.source = 'heading'
+        self._state = 'body'
+        self.issues['frontmatter_added'] += 1
+        held, self._held = self._held, []
+        frontmatter = Frontmatter([])
+        self._fill(frontmatter)
+        return frontmatter.render() + '\n' + ''.join(line + '\n' for line in held if line.strip())
+
+    def _close_frontmatter(self) -> str:
+        frontmatter = Frontmatter(self._held)
+        self._held = []
+        self.issues.update(frontmatter.issues)
+        title = frontmatter.get('title')
+        if title:
+            self.title = title
+            self.source = 'frontmatter'
+        tags = frontmatter.tags()
+        if tags:
+            self.tags = tags
+        self._fill(frontmatter)
+        self._state = 'body'
+        return frontmatter.render()
+
+    def _abandon_frontmatter(self) -> str:
+        """닫히지 않은 '---' 블록은 본문으로 되돌림"""
+        held, self._held = self._held, []
+        out = self._start_body(None)
+        return out + '---\n' + ''.join(self._body_line(line) + '\n' for line in held)
+
+    def _fill(self, frontmatter: Frontmatter) -> None:
+        """빠졌거나 비어 있는 필수 키 채우기"""
+        defaults = {
+            'layout': DEFAULT_LAYOUT,
+            'title': _quote(self.title),
+            'parent': DEFAULT_PARENT,
+            'date': self.date,
+            'tags': f"[{', '.join(self.tags)}]",
+        }
+        existing = bool(frontmatter.fields)
+        for key in REQUIRED_KEYS:
+            present = frontmatter.tags() if key == 'tags' else frontmatter.get(key)
+            if not present:
+                frontmatter.set(key, defaults[key])
+                # date는 프롬프트에서 요구하지 않으므로 채워도 고친 것으로 세지 않음
+                if existing and key != 'date':
+                    self.issues['key_filled'] += 1
+
+    def _body_line(self, line: str) -> str:
+        match = _FENCE_PATTERN.match(line)
+        if match is None:
+            return line
+        marker, info = match.group(1), match.group(2).strip()
+        if self._fence is None:
+            # 백틱 펜스의 info에 백틱이 있으면 펜스가 아님 (예: 한 줄짜리 "```x```")
+            if marker[0] == '`' and '`' in info:
+                return line
+            self._fence = marker
+            if not info:
+                self.issues['fence_language_added'] += 1
+                return line.rstrip() + DEFAULT_FENCE_LANGUAGE
+        elif marker[0] == self._fence[0] and len(marker) >= len(self._fence) and not info:
+            self._fence = None
+        return line
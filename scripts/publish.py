@@ -6,22 +6,38 @@
     python3 scripts/publish.py --date today
     python3 scripts/publish.py --date yesterday
     python3 scripts/publish.py --date 2026-02-01
+    python3 scripts/publish.py --date week
+    python3 scripts/publish.py --date 2026-02-01..2026-02-07
     python3 scripts/publish.py --dry-run
     python3 scripts/publish.py --no-git
+    python3 scripts/publish.py --workers 0
+    python3 scripts/publish.py --from 2026-02-01 --to 2026-02-07
+    python3 scripts/publish.py --missing --concurrency 4
+    python3 scripts/publish.py --profile
 """
 
 import argparse
-import subprocess
+import asyncio
 import sys
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
 # 스크립트 디렉토리를 path에 추가
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir.parent))
 
-from scripts.collect_conversations import ConversationCollector
-from scripts.generate_blog_post import BlogPostGenerator
+from scripts.collect_conversations import SUMMARY_POLICIES, ConversationCollector
+from scripts.completion_cache import CompletionCache, SessionSummaryCache
+from scripts.dedup import DEFAULT_THRESHOLD
+from scripts.json_backend import BACKENDS
+from scripts.generate_blog_post import AsyncBlogPostGenerator
+from scripts.git_publish import GitPublisher
+from scripts.publish_manifest import PublishManifest
+from scripts.search_index import SearchIndex
+from scripts.metrics import PipelineMetrics
+from scripts.summarize import DEFAULT_TOKEN_BUDGET
 
 
 def parse_date(date_str: str) -> datetime:
@@ -30,109 +46,397 @@ def parse_date(date_str: str) -> datetime:
         return datetime.now()
     elif date_str == 'yesterday':
         return datetime.now() - timedelta(days=1)
-    elif date_str == 'week':
-        # 주간 요약은 일주일 전부터 오늘까지
-        return datetime.now()
     else:
         return datetime.strptime(date_str, '%Y-%m-%d')
 
 
-def git_commit_and_push(blog_dir: Path, target_date: datetime) -> bool:
-    """Git 커밋 및 푸시"""
-    try:
-        # 변경사항 확인
-        result = subprocess.run(
-            ['git', 'status', '--porcelain'],
-            cwd=blog_dir,
-            capture_output=True,
-            text=True
+def parse_date_range(date_str: str) -> tuple[datetime, datetime]:
+    """
+    날짜 또는 기간 문자열 파싱
+
+    Returns:
+        (시작 날짜, 끝 날짜) 튜플 (하루면 같은 날짜)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 끝 날짜가 시작 날짜보다 앞선 경우
+    """
+    if date_str == 'week':
+        # 주간 요약은 6일 전부터 오늘까지 (7일)
+        end_date = datetime.now()
+        return end_date - timedelta(days=6), end_date
+
+    if '..' in date_str:
+        start_str, end_str = date_str.split('..', 1)
+        start_date, end_date = parse_date(start_str), parse_date(end_str)
+        if end_date.date() < start_date.date():
+            raise ValueError(date_str)
+        return start_date, end_date
+
+    target_date = parse_date(date_str)
+    return target_date, target_date
+
+
+def format_period(start_date: datetime, end_date: datetime, fmt: str = '%Y-%m-%d') -> str:
+    """하루면 날짜 하나, 기간이면 '시작 ~ 끝'"""
+    if start_date.date() == end_date.date():
+        return start_date.strftime(fmt)
+    return f"{start_date.strftime(fmt)} ~ {end_date.strftime(fmt)}"
+
+
+def git_commit_and_push(
+    blog_dir: Path,
+    paths: list[Path],
+    target_date: datetime,
+    end_date: Optional[datetime] = None,
+    commit_msg: Optional[str] = None
+) -> bool:
+    """저장한 파일(paths)만 커밋하고 한 번 푸시 (commit_msg가 없으면 날짜로 생성)"""
+    if commit_msg is None:
+        if end_date is not None and end_date.date() != target_date.date():
+            commit_msg = f"Add learning post: {format_period(target_date, end_date)}"
+        else:
+            commit_msg = f"Add daily learning post: {target_date.strftime('%Y-%m-%d')}"
+    return GitPublisher(blog_dir).publish(paths, commit_msg)
+
+
+def publish_changed(
+    blog_dir: Path,
+    paths: list[Path],
+    metrics: PipelineMetrics,
+    target_date: datetime,
+    end_date: Optional[datetime] = None,
+    commit_msg: Optional[str] = None
+) -> bool:
+    """
+    지난번에 푸시한 내용과 다른 파일만 커밋/푸시 (모두 같으면 git을 실행하지 않음)
+
+    Returns:
+        성공 여부 (건너뛴 경우도 True)
+    """
+    manifest = PublishManifest(blog_dir)
+    with metrics.stage('git'):
+        changed = manifest.changed(paths)
+        metrics.count('git', 'files', len(changed))
+        metrics.count('git', 'unchanged', len(paths) - len(changed))
+        if not changed:
+            print("[정보] 지난번에 발행한 내용과 같아 Git 작업을 건너뜁니다.")
+            return True
+
+        success = git_commit_and_push(blog_dir, changed, target_date, end_date, commit_msg)
+        if success:
+            manifest.mark_published(changed)
+            manifest.save()
+    metrics.count('git', 'failed', 0 if success else 1)
+    return success
+
+
+def update_search_index(blog_dir: Path, paths: list[Path], metrics: PipelineMetrics) -> list[Path]:
+    """
+    저장한 포스트를 사이트 검색 색인(assets/search/)에 반영
+
+    이번에 쓴 파일만 돌려주면, 색인을 쓴 뒤 푸시에 실패했거나 --no-git으로 실행한 다음 번에는
+    포스트 해시가 같아 색인을 다시 쓰지 않으므로 색인 파일이 영영 커밋되지 않습니다. 그래서 색인
+    파일 전체와 지워진 샤드(이번에 지웠거나 발행한 뒤 지워진 것)를 돌려주고, 실제로 바뀐 파일은
+    publish_changed가 고릅니다.
+
+    Returns:
+        포스트와 함께 발행할 색인 파일들
+    """
+    with metrics.stage('index'):
+        index = SearchIndex(blog_dir)
+        result = index.update(paths)
+        deleted = [path for path in result.written if not path.exists()]
+        index_paths = list(dict.fromkeys(
+            index.index_files() + deleted + PublishManifest(blog_dir).missing(index.index_dir)
+        ))
+    metrics.count('index', 'docs_updated', result.updated)
+    metrics.count('index', 'files_written', len(result.written))
+    print(f"  {result.summary()}")
+    return index_paths
+
+
+def daily_post_path(posts_dir: Path, target_date) -> Path:
+    """하루 단위 포스트 파일 경로 (BlogPostGenerator.save_post 기본 파일명과 같음)"""
+    return posts_dir / f"{target_date.strftime('%Y-%m-%d')}-daily-learning.md"
+
+
+def find_missing_dates(
+    posts_dir: Path,
+    start_date: Optional[datetime],
+    end_date: datetime
+) -> list[datetime]:
+    """
+    하루 단위 포스트 파일이 없는 날짜 목록
+
+    Args:
+        posts_dir: docs/learning-records
+        start_date: 시작 날짜 (None이면 마지막으로 발행된 날짜의 다음 날)
+        end_date: 끝 날짜 (포함)
+
+    Raises:
+        ValueError: start_date가 없고 발행된 포스트도 없는 경우
+    """
+    if start_date is None:
+        published = sorted(
+            datetime.strptime(path.name[:10], '%Y-%m-%d')
+            for path in posts_dir.glob("????-??-??-daily-learning.md")
         )
+        if not published:
+            raise ValueError("발행된 포스트가 없어 시작 날짜를 알 수 없습니다. --from을 지정해주세요.")
+        start_date = published[-1] + timedelta(days=1)
+
+    days = (end_date.date() - start_date.date()).days + 1
+    return [
+        day for day in (start_date + timedelta(days=i) for i in range(days))
+        if not daily_post_path(posts_dir, day).exists()
+    ]
+
+
+def print_cache_summary(*caches: Optional[CompletionCache]) -> None:
+    """캐시별 적중/미스 보고 (--no-cache이거나 조회가 없었던 캐시는 생략)"""
+    for cache in caches:
+        if cache is not None and (cache.hits or cache.misses):
+            print(f"  {cache.summary()}")
+
+
+def count_collected(metrics: PipelineMetrics, collector: ConversationCollector, conversations: list) -> None:
+    """수집 단계 카운터 (파싱 통계 + 세션/메시지 수)"""
+    metrics.count_all('collect', asdict(collector.stats))
+    metrics.count('collect', 'conversations', len(conversations))
+    metrics.count('collect', 'messages', sum(len(c.messages) for c in conversations))
+
+
+def report_metrics(metrics: PipelineMetrics) -> None:
+    """측정 파일 저장 후 요약 출력 (단계를 하나도 실행하지 않았으면 생략)"""
+    if not metrics.stages:
+        return
+    path = metrics.write()
+    print(f"  {metrics.summary()}")
+    if path is not None:
+        print(f"  측정 파일: {path}")
+    for profile_path in metrics.profile_paths:
+        print(f"  프로파일: {profile_path}")
+
+
+def run_backfill(
+    args,
+    blog_dir: Path,
+    completion_cache: Optional[CompletionCache],
+    session_cache: Optional[SessionSummaryCache],
+    metrics: PipelineMetrics
+) -> int:
+    """
+    여러 날짜를 하루 단위 포스트로 한 번에 발행 (--from/--to, --missing)
+
+    대화는 기간 전체에 대해 한 번만 수집하고, 포스트 생성은 AsyncBlogPostGenerator로
+    --concurrency개까지 동시에 요청하며, 저장이 끝나면 커밋과 푸시를 한 번만 수행합니다.
+
+    Returns:
+        종료 코드
+    """
+    try:
+        end_date = parse_date(args.to_date) if args.to_date else datetime.now()
+        start_date = parse_date(args.from_date) if args.from_date else None
+    except ValueError as e:
+        print(f"[오류] 잘못된 날짜 형식: {e}")
+        return 1
+
+    if start_date is None and not args.missing:
+        print("[오류] --to는 --from 또는 --missing과 함께 사용해야 합니다.")
+        return 1
+    if start_date is not None and end_date.date() < start_date.date():
+        print(f"[오류] 끝 날짜가 시작 날짜보다 앞섭니다: {format_period(start_date, end_date)}")
+        return 1
+
+    posts_dir = blog_dir / "docs" / "learning-records"
+    if args.missing:
+        try:
+            dates = find_missing_dates(posts_dir, start_date, end_date)
+        except ValueError as e:
+            print(f"[오류] {e}")
+            return 1
+    else:
+        days = (end_date.date() - start_date.date()).days + 1
+        dates = [start_date + timedelta(days=i) for i in range(days)]
 
-        if not result.stdout.strip():
-            print("[정보] 커밋할 변경사항이 없습니다.")
-            return True
+    if not dates:
+        print("[완료] 발행할 날짜가 없습니다.")
+        return 0
 
-        # 스테이징
-        subprocess.run(['git', 'add', '.'], cwd=blog_dir, check=True)
+    print("=" * 60)
+    print(f"  Claude Code 대화 → 블로그 일괄 발행")
+    print(f"  날짜: {format_period(dates[0], dates[-1], '%Y년 %m월 %d일')} 중 {len(dates)}일")
+    print("=" * 60)
 
-        # 커밋
-        commit_msg = f"Add daily learning post: {target_date.strftime('%Y-%m-%d')}"
-        subprocess.run(
-            ['git', 'commit', '-m', commit_msg],
-            cwd=blog_dir,
-            check=True
+    # Step 1: 기간 전체를 한 번에 수집
+    print(f"\n[1/4] 대화 기록 수집 중...")
+
+    try:
+        collector = ConversationCollector(
+            workers=args.workers,
+            json_backend=args.json_backend,
+            claude_dir=args.claude_dir
         )
+    except ValueError as e:
+        print(f"\n[오류] {e}")
+        return 1
+    with metrics.stage('collect'):
+        conversations_by_date = collector.collect_range(dates[0], dates[-1])
+    count_collected(metrics, collector, [
+        conversation for conversations in conversations_by_date.values() for conversation in conversations
+    ])
+
+    targets = [
+        (day, conversations_by_date[day.date()])
+        for day in dates
+        if conversations_by_date.get(day.date())
+    ]
+    for day in dates:
+        if not conversations_by_date.get(day.date()):
+            print(f"  - {day.strftime('%Y-%m-%d')}: 대화 기록 없음, 건너뜀")
+
+    if not targets:
+        print("\n[완료] 해당 날짜들에 대화 기록이 없습니다.")
+        return 0
+
+    # Step 2: 날짜별 포스트 동시 생성
+    concurrency = max(1, args.concurrency)
+    print(f"\n[2/4] 블로그 포스트 {len(targets)}개 생성 중 (동시 {concurrency}개)...")
 
-        # 푸시
-        subprocess.run(['git', 'push'], cwd=blog_dir, check=True)
+    try:
+        generator = AsyncBlogPostGenerator(
+            cache=completion_cache,
+            session_cache=session_cache,
+            concurrency=concurrency,
+            token_budget=args.token_budget,
+            summary_policy=args.summary_policy,
+            dedup_threshold=None if args.no_dedup else args.dedup_threshold,
+            metrics=metrics
+        )
+    except ValueError as e:
+        print(f"\n[오류] {e}")
+        return 1
 
-        print("[성공] Git 커밋 및 푸시 완료!")
-        return True
+    async def generate_all() -> list:
+        async with generator:
+            return await generator.generate_posts(
+                [(conversations, day) for day, conversations in targets]
+            )
 
-    except subprocess.CalledProcessError as e:
-        print(f"[오류] Git 작업 실패: {e}")
-        return False
+    with metrics.stage('generate'):
+        posts = asyncio.run(generate_all())
+    for (day, _), post in zip(targets, posts):
+        if isinstance(post, Exception):
+            print(f"[오류] {day.strftime('%Y-%m-%d')} 포스트 생성 실패: {post}")
 
+    generated = [
+        (day, post) for (day, _), post in zip(targets, posts)
+        if not isinstance(post, Exception)
+    ]
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Claude Code 대화를 블로그로 발행',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-예시:
-    python3 publish.py --date today       # 오늘 대화 발행
-    python3 publish.py --date yesterday   # 어제 대화 발행
-    python3 publish.py --date 2026-02-01  # 특정 날짜 발행
-    python3 publish.py --dry-run          # 미리보기만 (저장 안함)
-    python3 publish.py --no-git           # Git 커밋/푸시 생략
-        """
-    )
-    parser.add_argument(
-        '--date',
-        default='today',
-        help='발행할 날짜 (today, yesterday, YYYY-MM-DD)'
-    )
-    parser.add_argument(
-        '--dry-run',
-        action='store_true',
-        help='실제 저장/커밋 없이 미리보기만'
-    )
-    parser.add_argument(
-        '--no-git',
-        action='store_true',
-        help='Git 커밋/푸시 건너뛰기'
-    )
-    parser.add_argument(
-        '--verbose', '-v',
-        action='store_true',
-        help='상세 출력'
-    )
-    args = parser.parse_args()
+    if args.dry_run:
+        for day, post_content in generated:
+            print("\n" + "=" * 60)
+            print(f"  [미리보기 모드] {day.strftime('%Y-%m-%d')} 포스트:")
+            print("=" * 60)
+            print(post_content[:1000])
+            if len(post_content) > 1000:
+                print(f"\n... (총 {len(post_content)}자, 생략됨)")
+        print("\n[완료] 미리보기 모드 - 파일이 저장되지 않았습니다.")
+        print_cache_summary(completion_cache, session_cache)
+        return 0
 
+    # Step 3: 포스트 저장
+    print(f"\n[3/4] 포스트 저장 중...")
+
+    with metrics.stage('save'):
+        # generate_complete_post가 이미 후처리한 포스트
+        saved = [
+            (day, generator.save_post(post_content, day, postprocess=False))
+            for day, post_content in generated
+        ]
+    metrics.count('save', 'posts', len(saved))
+    metrics.count('save', 'bytes_written', sum(path.stat().st_size for _, path in saved))
+    index_paths = update_search_index(blog_dir, [path for _, path in saved], metrics)
+
+    # Step 4: 한 번의 커밋과 푸시
+    if saved and not args.no_git:
+        print(f"\n[4/4] Git 커밋 및 푸시 중...")
+        day_list = ', '.join(day.strftime('%Y-%m-%d') for day, _ in saved)
+        success = publish_changed(
+            blog_dir, [path for _, path in saved] + index_paths, metrics, saved[0][0], saved[-1][0],
+            commit_msg=f"Add daily learning posts: {day_list}"
+        )
+        if not success:
+            print("[경고] Git 작업에 실패했습니다. 파일은 저장되었습니다.")
+    elif args.no_git:
+        print(f"\n[4/4] Git 커밋/푸시 건너뜀 (--no-git)")
+
+    print("\n" + "=" * 60)
+    print(f"  [완료] {len(saved)}/{len(targets)}개 포스트 발행 완료!")
+    for _, filepath in saved:
+        print(f"  파일: {filepath}")
+    print_cache_summary(completion_cache, session_cache)
+    print("=" * 60)
+
+    return 0 if len(saved) == len(targets) else 1
+
+
+def run_single(
+    args,
+    blog_dir: Path,
+    completion_cache: Optional[CompletionCache],
+    session_cache: Optional[SessionSummaryCache],
+    metrics: PipelineMetrics
+) -> int:
+    """
+    하루 또는 기간 하나를 포스트 하나로 발행 (--date)
+
+    Returns:
+        종료 코드
+    """
     # 날짜 파싱
     try:
-        target_date = parse_date(args.date)
+        target_date, end_date = parse_date_range(args.date)
     except ValueError:
         print(f"[오류] 잘못된 날짜 형식: {args.date}")
-        print("올바른 형식: today, yesterday, YYYY-MM-DD")
-        sys.exit(1)
-
-    blog_dir = Path(__file__).parent.parent
+        print("올바른 형식: today, yesterday, week, YYYY-MM-DD, YYYY-MM-DD..YYYY-MM-DD")
+        return 1
+    is_range = end_date.date() != target_date.date()
 
     print("=" * 60)
     print(f"  Claude Code 대화 → 블로그 발행")
-    print(f"  날짜: {target_date.strftime('%Y년 %m월 %d일')}")
+    print(f"  날짜: {format_period(target_date, end_date, '%Y년 %m월 %d일')}")
     print("=" * 60)
 
     # Step 1: 대화 수집
     print(f"\n[1/4] 대화 기록 수집 중...")
 
-    collector = ConversationCollector()
-    conversations = collector.collect_all(target_date)
+    try:
+        collector = ConversationCollector(
+            workers=args.workers,
+            json_backend=args.json_backend,
+            claude_dir=args.claude_dir
+        )
+    except ValueError as e:
+        print(f"\n[오류] {e}")
+        return 1
+    with metrics.stage('collect'):
+        if is_range:
+            # 기간 전체를 한 번에 읽고 날짜순으로 이어 붙임
+            conversations_by_date = collector.collect_range(target_date, end_date)
+            conversations = [
+                conversation
+                for day in sorted(conversations_by_date)
+                for conversation in conversations_by_date[day]
+            ]
+        else:
+            conversations = collector.collect_all(target_date)
+    count_collected(metrics, collector, conversations)
 
     if not conversations:
-        print("\n[완료] 해당 날짜에 대화 기록이 없습니다.")
-        sys.exit(0)
+        print(f"\n[완료] 해당 {'기간' if is_range else '날짜'}에 대화 기록이 없습니다.")
+        return 0
 
     stats = collector.get_statistics(conversations)
     print(f"  - {stats['total_conversations']}개 세션 발견")
@@ -147,34 +451,67 @@ def main():
     print(f"\n[2/4] 블로그 포스트 생성 중...")
 
     try:
-        generator = BlogPostGenerator()
+        generator = AsyncBlogPostGenerator(
+            cache=completion_cache,
+            session_cache=session_cache,
+            concurrency=args.concurrency,
+            token_budget=args.token_budget,
+            summary_policy=args.summary_policy,
+            dedup_threshold=None if args.no_dedup else args.dedup_threshold,
+            metrics=metrics
+        )
     except ValueError as e:
         print(f"\n[오류] {e}")
-        sys.exit(1)
+        return 1
 
-    post_content = generator.generate_post(conversations, target_date)
+    post_end_date = end_date if is_range else None
 
     if args.dry_run:
-        print("\n" + "=" * 60)
-        print("  [미리보기 모드] 생성된 포스트:")
-        print("=" * 60)
-        print(post_content[:3000])
-        if len(post_content) > 3000:
-            print(f"\n... (총 {len(post_content)}자, 생략됨)")
-        print("\n" + "=" * 60)
+        async def preview() -> None:
+            # 응답 조각을 후처리해 확정되는 대로 출력 (저장될 내용과 같음)
+            processor = generator.post_processor(target_date, end_date=post_end_date)
+            async with generator:
+                started = False
+                async for text in generator.stream_post(conversations, target_date, post_end_date):
+                    if not started:
+                        print("\n" + "=" * 60)
+                        print("  [미리보기 모드] 생성된 포스트:")
+                        print("=" * 60)
+                        started = True
+                    print(processor.feed(text), end='', flush=True)
+            print(processor.finish(), end='')
+
+        with metrics.stage('generate'):
+            asyncio.run(preview())
+        print("\n\n" + "=" * 60)
         print("[완료] 미리보기 모드 - 파일이 저장되지 않았습니다.")
-        sys.exit(0)
-
-    # Step 3: 포스트 저장
-    print(f"\n[3/4] 포스트 저장 중...")
-
-    filepath = generator.save_post(post_content, target_date)
+        print_cache_summary(completion_cache, session_cache)
+        return 0
+
+    async def generate_and_save() -> Path:
+        # 대화가 길면 세션별 요약을 동시에 요청하고, 본문은 받는 대로 임시 파일에 씀
+        async with generator:
+            return await generator.save_post_stream(
+                generator.stream_post(conversations, target_date, post_end_date),
+                target_date,
+                end_date=post_end_date
+            )
+
+    # 본문을 받으면서 저장하므로 저장 시간은 generate 단계에 포함됨
+    with metrics.stage('generate'):
+        filepath = asyncio.run(generate_and_save())
+    metrics.count('save', 'posts', 1)
+    metrics.count('save', 'bytes_written', filepath.stat().st_size)
+
+    # Step 3: 포스트 저장 (스트리밍 중 임시 파일에 쓰고 완료 시 교체됨)
+    print(f"\n[3/4] 포스트 저장 완료")
     print(f"  저장됨: {filepath}")
+    index_paths = update_search_index(blog_dir, [filepath], metrics)
 
     # Step 4: Git 커밋 및 푸시
     if not args.no_git:
         print(f"\n[4/4] Git 커밋 및 푸시 중...")
-        success = git_commit_and_push(blog_dir, target_date)
+        success = publish_changed(blog_dir, [filepath] + index_paths, metrics, target_date, end_date)
         if not success:
             print("[경고] Git 작업에 실패했습니다. 파일은 저장되었습니다.")
     else:
@@ -184,9 +521,145 @@ def main():
     print("\n" + "=" * 60)
     print(f"  [완료] 블로그 포스트 발행 완료!")
     print(f"  파일: {filepath}")
-    if not args.no_git:
+    print_cache_summary(completion_cache, session_cache)
+    if not args.no_git and not is_range:
         print(f"  URL: https://evan-hwang.github.io/posts/{target_date.strftime('%Y/%m/%d')}/daily-learning/")
     print("=" * 60)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Claude Code 대화를 블로그로 발행',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+    python3 publish.py --date today       # 오늘 대화 발행
+    python3 publish.py --date yesterday   # 어제 대화 발행
+    python3 publish.py --date 2026-02-01  # 특정 날짜 발행
+    python3 publish.py --date week        # 최근 7일(오늘 포함) 기간 요약 발행
+    python3 publish.py --date 2026-02-01..2026-02-07  # 기간 요약 발행
+    python3 publish.py --dry-run          # 미리보기만 (저장 안함)
+    python3 publish.py --no-git           # Git 커밋/푸시 생략
+    python3 publish.py --workers 8        # 8개 프로세스로 병렬 수집
+    python3 publish.py --from 2026-02-01 --to 2026-02-07  # 날짜별 포스트 일괄 발행
+    python3 publish.py --missing          # 마지막 포스트 이후 빠진 날짜 일괄 발행
+    python3 publish.py --missing --from 2026-01-01  # 기간 안에서 빠진 날짜만 발행
+    python3 publish.py --profile          # 단계별 cProfile 결과도 logs/에 저장
+        """
+    )
+    parser.add_argument(
+        '--date',
+        default='today',
+        help='발행할 날짜 또는 기간 (today, yesterday, week, YYYY-MM-DD, YYYY-MM-DD..YYYY-MM-DD)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='실제 저장/커밋 없이 미리보기만'
+    )
+    parser.add_argument(
+        '--no-git',
+        action='store_true',
+        help='Git 커밋/푸시 건너뛰기'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='대화 수집 병렬 프로세스 수 (기본값: 1, 0이면 CPU 수)'
+    )
+    parser.add_argument(
+        '--claude-dir',
+        type=lambda value: Path(value).expanduser(),
+        default=None,
+        help='Claude Code 데이터 디렉토리 (기본값: CLAUDE_CONFIG_DIR 또는 ~/.claude)'
+    )
+    parser.add_argument(
+        '--json-backend',
+        choices=BACKENDS,
+        default=None,
+        help='JSONL 디코딩 백엔드 (기본값: stdlib 또는 RECOBLOG_JSON_BACKEND)'
+    )
+    parser.add_argument(
+        '--from',
+        dest='from_date',
+        default=None,
+        help='일괄 발행 시작 날짜 (YYYY-MM-DD, 날짜별로 포스트 하나씩)'
+    )
+    parser.add_argument(
+        '--to',
+        dest='to_date',
+        default=None,
+        help='일괄 발행 끝 날짜 (기본값: 오늘)'
+    )
+    parser.add_argument(
+        '--missing',
+        action='store_true',
+        help='docs/learning-records에 포스트가 없는 날짜만 일괄 발행 '
+             '(--from이 없으면 마지막 포스트 다음 날부터)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='동시에 보낼 LLM 요청 수 (일괄 발행의 날짜별 포스트, 긴 대화의 세션별 요약, 기본값: 4)'
+    )
+    parser.add_argument(
+        '--token-budget',
+        type=int,
+        default=DEFAULT_TOKEN_BUDGET,
+        help=f'대화 원문을 그대로 보낼 최대 토큰 수, 넘으면 나눠서 요약 (기본값: {DEFAULT_TOKEN_BUDGET})'
+    )
+    parser.add_argument(
+        '--summary-policy',
+        choices=SUMMARY_POLICIES,
+        default=None,
+        help='예산을 넘을 때 나눠서 요약하지 않고, 이 우선순위로 예산 안의 메시지만 골라 보냄 '
+             '(round-robin: 대화별로 고르게, user-first: 사용자 메시지 우선, recent-first: 최근 대화 우선)'
+    )
+    parser.add_argument(
+        '--dedup-threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f'이 유사도(Jaccard, 0~1) 이상인 중복 메시지를 프롬프트에서 제외 (기본값: {DEFAULT_THRESHOLD}, 1.0이면 완전 일치만)'
+    )
+    parser.add_argument(
+        '--no-dedup',
+        action='store_true',
+        help='중복 메시지 제거 건너뛰기'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='LLM 응답 캐시(.cache/completions)와 세션 요약 캐시(.cache/session-summaries)를 '
+             '사용하지 않고 항상 API 호출'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='단계마다 cProfile 결과를 logs/profile-*.prof로 저장'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='상세 출력'
+    )
+    args = parser.parse_args()
+
+    blog_dir = Path(__file__).parent.parent
+    completion_cache = None if args.no_cache else CompletionCache()
+    session_cache = None if args.no_cache else SessionSummaryCache()
+
+    metrics = PipelineMetrics(profile=args.profile)
+    try:
+        if args.from_date or args.to_date or args.missing:
+            code = run_backfill(args, blog_dir, completion_cache, session_cache, metrics)
+        else:
+            code = run_single(args, blog_dir, completion_cache, session_cache, metrics)
+    finally:
+        report_metrics(metrics)
+    sys.exit(code)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+발행 매니페스트: 마지막으로 푸시한 파일별 내용 해시
+
+같은 날짜를 다시 발행했는데 저장한 포스트가 지난번에 푸시한 내용과 바이트 단위로 같으면
+git 명령을 하나도 실행하지 않고 건너뛰기 위한 것입니다. 커밋과 푸시가 성공한 파일만
+기록하므로, 푸시에 실패했거나 --no-git으로 저장만 한 파일은 다음 실행에서 다시 발행됩니다.
+없어진 파일(비게 된 검색 색인 샤드 등)도 바뀐 것으로 보고, 삭제를 푸시하면 기록에서 뺍니다.
+
+저장 위치: .cache/publish_manifest.json
+    {
+        "version": 1,
+        "files": {"docs/learning-records/2026-02-01-daily-learning.md":
+                  {"sha256": str, "bytes": int, "published": ISO 8601}}
+    }
+
+매니페스트가 없거나 손상되어도 모든 파일을 바뀐 것으로 보고 git으로 확인할 뿐이므로
+언제 지워도 됩니다.
+"""
+
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .state import DEFAULT_CACHE_DIR, load_json_state, save_json_state
+
+MANIFEST_VERSION = 1
+
+# 기본 매니페스트 경로
+DEFAULT_MANIFEST_PATH = DEFAULT_CACHE_DIR / "publish_manifest.json"
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    """파일 내용의 sha256 (파일이 없으면 None)"""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class PublishManifest:
+    """
+    파일별로 마지막으로 푸시한 내용 해시
+
+    사용 예:
+        manifest = PublishManifest(blog_dir)
+        changed = manifest.changed(paths)
+        if changed and git_commit_and_push(blog_dir, changed, ...):
+            manifest.mark_published(changed)
+            manifest.save()
+    """
+
+    def __init__(self, root: Path, path: Optional[Path] = None):
+        """
+        Args:
+            root: 블로그 저장소 루트 (파일 키는 이 기준 상대 경로)
+            path: 매니페스트 파일 경로 (기본값: .cache/publish_manifest.json)
+        """
+        self.root = Path(root).resolve()
+        self.path = path or DEFAULT_MANIFEST_PATH
+        self.files: dict[str, dict] = self._load()
+
+    def _load(self) -> dict:
+        state = load_json_state(self.path, default={})
+        if not isinstance(state, dict) or state.get('version') != MANIFEST_VERSION:
+            return {}
+        files = state.get('files')
+        return files if isinstance(files, dict) else {}
+
+    def _key(self, path: Path) -> str:
+        resolved = Path(path).resolve()
+        try:
+            return resolved.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(resolved)
+
+    def changed(self, paths: Iterable[Path]) -> list[Path]:
+        """지난번에 푸시한 내용과 다른(또는 기록이 없거나 없어진) 파일들"""
+        changed = []
+        for path in paths:
+            entry = self.files.get(self._key(path))
+            if entry is None or entry.get('sha256') != file_sha256(path):
+                changed.append(path)
+        return changed
+
+    def missing(self, directory: Path) -> list[Path]:
+        """directory 아래에서 푸시한 기록은 있지만 지금은 없는 파일들 (삭제를 아직 푸시하지 못한 파일)"""
+        prefix = self._key(directory).rstrip('/') + '/'
+        return [
+            self.root / key for key in sorted(self.files)
+            if key.startswith(prefix) and not (self.root / key).exists()
+        ]
+
+    def mark_published(self, paths: Iterable[Path]) -> None:
+        """paths의 현재 내용을 푸시한 것으로 기록 (없어진 파일은 기록에서 뺌, save를 불러야 저장됨)"""
+        now = datetime.now().isoformat(timespec='seconds')
+        for path in paths:
+            digest = file_sha256(path)
+            if digest is None:
+                self.files.pop(self._key(path), None)
+                continue
+            self.files[self._key(path)] = {
+                'sha256': digest,
+                'bytes': Path(path).stat().st_size,
+                'published': now,
+            }
+
+    def save(self) -> None:
+        save_json_state(self.path, {'version': MANIFEST_VERSION, 'files': self.files})
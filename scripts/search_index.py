@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+사이트 검색 색인: 용어 접두어별로 나눈 역색인을 발행할 때 갱신
+
+just-the-docs 기본 검색은 Jekyll이 빌드할 때마다 모든 페이지 본문을 담은 search-data.json
+하나를 다시 만들고, 브라우저는 첫 검색 때 그 파일을 통째로 내려받습니다. 포스트가 쌓일수록
+빌드와 다운로드가 함께 커지므로, 여기서는 포스트를 저장할 때 색인을 직접 만들어 둡니다.
+
+- 토큰화: 한글은 어절 끝의 흔한 조사를 떼고 2글자 단위(바이그램)로, 영문/숫자는 단어 단위로
+  (형태소 분석기 없이도 "비동기 캐시"가 "비동기로 캐시를"과 맞도록)
+- 샤드: 한글 용어는 첫 글자의 초성+중성, 영문 용어는 첫 글자, 숫자는 하나로 묶어 파일을 나눔
+- 갱신: 내용 해시가 바뀐 포스트만 다시 토큰화하고, 그 포스트의 예전/새 용어가 속한 샤드만
+  다시 씀 (내용이 같으면 쓰지 않고, 용어가 하나도 남지 않은 샤드는 지움)
+- 검색: assets/js/search.js가 docs.json과 검색어 용어가 속한 샤드만 내려받음
+
+저장 위치 (사이트 루트 기준):
+    assets/search/docs.json
+        {"version": 1, "tokenizer": {...}, "docs": {"문서 id": {"url", "title", "date", "tags", "excerpt"}}}
+    assets/search/shards/{샤드}.json
+        {"용어": [문서 id, 빈도, 문서 id, 빈도, ...]}
+    assets/search/_state.json (Jekyll이 복사하지 않는 갱신용 상태)
+        {"version": 1, "next_id": int, "files": {"docs/...md": {"id", "sha256", "shards": [...]}}}
+
+사용법:
+    python3 -m scripts.search_index              # docs/ 전체와 맞춤 (바뀐 파일만 갱신)
+    python3 -m scripts.search_index --rebuild    # 색인을 지우고 새로 만듦
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .postprocess import Frontmatter, split_frontmatter
+from .state import load_json_state, write_text_if_changed
+
+INDEX_VERSION = 1
+
+# 사이트 루트 기준 색인 디렉토리와 색인 대상
+INDEX_DIR = Path("assets") / "search"
+PAGES_GLOB = "docs/**/*.md"
+
+# 어절 끝에서 떼어낼 조사 (긴 것부터 확인, 떼고 남은 부분이 2글자 이상일 때만)
+PARTICLES = (
+    '에서는', '으로는', '에게서',
+    '에서', '으로', '에게', '까지', '부터', '처럼', '보다', '하고', '이나', '이랑', '와의', '과의',
+    '은', '는', '이', '가', '을', '를', '에', '의', '와', '과', '도', '로', '만', '나',
+)
+
+# 색인하지 않는 영문 단어
+STOPWORDS = frozenset({
+    'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'with',
+})
+
+# 이보다 긴 영문/숫자 토큰(해시, 긴 식별자)은 색인하지 않음
+MAX_TERM_LENGTH = 32
+
+# 제목과 태그에 나온 용어는 본문보다 여러 번 나온 것으로 침
+TITLE_WEIGHT = 5
+TAG_WEIGHT = 3
+
+# 검색 결과에 보여줄 본문 첫 문단 길이
+EXCERPT_CHARS = 120
+
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[0-9a-z][0-9a-z_]*')
+_LIQUID_PATTERN = re.compile(r'\{%.*?%\}|\{\{.*?\}\}', re.DOTALL)
+_LINK_TARGET_PATTERN = re.compile(r'\]\([^)]*\)')
+_HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$', re.MULTILINE)
+_MARKUP_PATTERN = re.compile(r'[*_`>#\[\]|]|\{:[^}]*\}')
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JONGSEONG_COUNT = 28
+
+
+def _strip_particle(word: str) -> str:
+    for particle in PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            return word[:-len(particle)]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    검색 용어 목록 (assets/js/search.js의 tokenize와 같은 규칙)
+
+    한글 어절은 조사를 뗀 뒤 2글자 이하면 그대로, 더 길면 2글자씩 겹쳐 나눕니다
+    ("비동기로" → "비동기" → "비동", "동기"). 한 글자 조사만 있는 어절은 버립니다.
+    """
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if _HANGUL_BASE <= ord(token[0]) <= _HANGUL_LAST:
+            word = _strip_particle(token)
+            if len(word) <= 2:
+                if word not in PARTICLES:
+                    terms.append(word)
+            else:
+                terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif 2 <= len(token) <= MAX_TERM_LENGTH and token not in STOPWORDS:
+            terms.append(token)
+    return terms
+
+
+def shard_key(term: str) -> str:
+    """
+    용어가 속한 샤드 이름
+
+    한글은 첫 글자의 초성+중성("h" + 두 자리씩, 예: "캐" → h0316), 영문은 첫 글자, 숫자는 "0"
+    """
+    code = ord(term[0])
+    if _HANGUL_BASE <= code <= _HANGUL_LAST:
+        return f"h{(code - _HANGUL_BASE) // _JONGSEONG_COUNT:04d}"
+    if term[0].isdigit():
+        return "0"
+    return term[0]
+
+
+@dataclass
+class SearchDocument:
+    """색인할 페이지 하나"""
+    url: str
+    title: str
+    date: str
+    tags: list[str]
+    excerpt: str
+    terms: Counter = field(default_factory=Counter)
+
+    def meta(self) -> dict:
+        """docs.json에 들어갈 표시용 정보"""
+        return {
+            'url': self.url,
+            'title': self.title,
+            'date': self.date,
+            'tags': self.tags,
+            'excerpt': self.excerpt,
+        }
+
+
+def page_url(relative: str, permalink: Optional[str] = None) -> str:
+    """Jekyll 기본 규칙에 따른 페이지 URL (baseurl 제외)"""
+    if permalink:
+        return permalink
+    if relative == 'index.md':
+        return '/'
+    if relative.endswith('/index.md'):
+        return '/' + relative[:-len('index.md')]
+    return '/' + relative[:-len('.md')] + '.html'
+
+
+def _excerpt(body: str) -> str:
+    """제목, 코드 블록, 표를 뺀 본문 첫 문단"""
+    in_fence = False
+    paragraph = []
+    for line in body.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        if not stripped or stripped.startswith(('#', '|', '---', '{:')):
+            if paragraph:
+                break
+            continue
+        paragraph.append(stripped)
+    text = ' '.join(_MARKUP_PATTERN.sub('', line) for line in paragraph)
+    text = ' '.join(text.split())
+    return text if len(text) <= EXCERPT_CHARS else text[:EXCERPT_CHARS].rstrip() + '…'
+
+
+def parse_page(relative: str, text: str) -> Optional[SearchDocument]:
+    """
+    페이지 하나를 색인할 문서로 변환
+
+    Returns:
+        프론트매터에 search_exclude: true가 있으면 None
+    """
+    frontmatter, body = split_frontmatter(text)
+    frontmatter = frontmatter or Frontmatter([])
+    if (frontmatter.get('search_exclude') or '').lower() == 'true':
+        return None
+
+    body = _LINK_TARGET_PATTERN.sub(']', _LIQUID_PATTERN.sub(' ', body))
+    title = frontmatter.get('title')
+    if not title:
+        heading = _HEADING_PATTERN.search(body)
+        title = heading.group(1).strip() if heading else Path(relative).stem
+    tags = frontmatter.tags() or []
+    page_date = frontmatter.get('date')
+    if not page_date:
+        try:
+            page_date = date.fromisoformat(Path(relative).name[:10]).isoformat()
+        except ValueError:
+            page_date = ''
+
+    terms = Counter(tokenize(body))
+    for term in tokenize(title):
+        terms[term] += TITLE_WEIGHT
+    for term in tokenize(' '.join(tags)):
+        terms[term] += TAG_WEIGHT
+
+    return SearchDocument(
+        url=page_url(relative, frontmatter.get('permalink')),
+        title=title,
+        date=page_date,
+        tags=tags,
+        excerpt=_excerpt(body),
+        terms=terms,
+    )
+
+
+@dataclass
+class IndexUpdate:
+    """색인 갱신 결과"""
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    written: list[Path] = field(default_factory=list)
+
+    def summary(self) -> str:
+        shards = sum(1 for path in self.written if path.parent.name == 'shards')
+        return (
+            f"검색 색인: 문서 {self.updated}개 갱신, {self.removed}개 삭제, "
+            f"{self.unchanged}개 그대로 / 샤드 {shards}개 씀"
+        )
+
+
+class SearchIndex:
+    """
+    사이트 루트의 assets/search/ 색인
+
+    사용 예:
+        index = SearchIndex(blog_dir)
+        index.update([post_path])
+        git_paths += index.index_files()
+    """
+
+    def __init__(self, site_dir: Path):
+        """
+        Args:
+            site_dir: Jekyll 사이트(블로그 저장소) 루트
+        """
+        self.site_dir = Path(site_dir).resolve()
+        self.index_dir = self.site_dir / INDEX_DIR
+        self.shard_dir = self.index_dir / "shards"
+        self.state_path = self.index_dir / "_state.json"
+        self.docs_path = self.index_dir / "docs.json"
+
+        self.next_id, self.files = self._load_state()
+        docs = load_json_state(self.docs_path, default={}) if self.files else {}
+        self.docs: dict[str, dict] = docs.get('docs', {}) if isinstance(docs, dict) else {}
+        # 이번 갱신에서 읽은 샤드 (용어 → {문서 id: 빈도}), 바뀐 샤드 이름
+        self._shards: dict[str, dict[str, dict[int, int]]] = {}
+        self._dirty: set[str] = set()
+
+    def _load_state(self) -> tuple[int, dict[str, dict]]:
+        state = load_json_state(self.state_path, default={})
+        if not isinstance(state, dict) or state.get('version') != INDEX_VERSION:
+            return 0, {}
+        files = state.get('files')
+        if not isinstance(files, dict):
+            return 0, {}
+        return int(state.get('next_id', 0)), files
+
+    def _relative(self, path: Path) -> str:
+        """사이트 루트 기준 상대 경로 (사이트 밖이면 ValueError)"""
+        resolved = Path(path).resolve()
+        try:
+            return resolved.relative_to(self.site_dir).as_posix()
+        except ValueError:
+            raise ValueError(f"사이트 밖의 경로입니다: {path}") from None
+
+    def pages(self) -> list[Path]:
+        """색인 대상 페이지 (docs/ 아래 모든 마크다운)"""
+        return sorted(self.site_dir.glob(PAGES_GLOB))
+
+    def index_files(self) -> list[Path]:
+        """
+        지금 있는 색인 파일 전체 (docs.json, 상태 파일, 샤드)
+
+        샤드 수는 용어 첫 글자 종류로 제한되므로(한글 399개 + 영문/숫자) 발행할 때마다 모두 넘기고,
+        실제로 바뀐 파일은 발행 매니페스트가 고르게 합니다.
+        """
+        return [
+            path for path in (self.docs_path, self.state_path) if path.exists()
+        ] + sorted(self.shard_dir.glob("*.json"))
+
+    def _shard(self, key: str) -> dict[str, dict[int, int]]:
+        if key not in self._shards:
+            data = load_json_state(self.shard_dir / f"{key}.json", default={})
+            self._shards[key] = {
+                term: dict(zip(postings[::2], postings[1::2]))
+                for term, postings in (data.items() if isinstance(data, dict) else ())
+            }
+        return self._shards[key]
+
+    def _drop(self, relative: str) -> None:
+        """문서 하나를 예전 샤드들에서 뺌"""
+        entry = self.files.pop(relative)
+        doc_id = entry['id']
+        for key in entry['shards']:
+            shard = self._shard(key)
+            for term in [term for term, postings in shard.items() if doc_id in postings]:
+                del shard[term][doc_id]
+                if not shard[term]:
+                    del shard[term]
+            self._dirty.add(key)
+        self.docs.pop(str(doc_id), None)
+
+    def _add(self, relative: str, digest: str, doc_id: int, document: Optional[SearchDocument]) -> None:
+        """문서 하나를 새 용어들의 샤드에 넣음 (search_exclude면 해시만 기록)"""
+        shards: dict[str, list[str]] = defaultdict(list)
+        if document is not None:
+            for term in document.terms:
+                shards[shard_key(term)].append(term)
+            for key, terms in shards.items():
+                shard = self._shard(key)
+                for term in terms:
+                    shard.setdefault(term, {})[doc_id] = document.terms[term]
+                self._dirty.add(key)
+            self.docs[str(doc_id)] = document.meta()
+        self.files[relative] = {'id': doc_id, 'sha256': digest, 'shards': sorted(shards)}
+
+    def update(self, paths: Iterable[Path], remove: Iterable[Path] = ()) -> IndexUpdate:
+        """
+        바뀐 페이지만 다시 색인하고, 영향을 받은 샤드만 저장
+
+        Args:
+            paths: 저장(추가/수정)한 페이지들 (내용 해시가 같으면 건너뜀)
+            remove: 색인에서 뺄 페이지들 (삭제한 파일)
+
+        Returns:
+            갱신 결과 (written: 실제로 쓴 색인 파일들)
+        """
+        result = IndexUpdate()
+        for path in remove:
+            relative = self._relative(path)
+            if relative in self.files:
+                self._drop(relative)
+                result.removed += 1
+
+        for path in paths:
+            relative = self._relative(path)
+            data = Path(path).read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            entry = self.files.get(relative)
+            if entry is not None and entry['sha256'] == digest:
+                result.unchanged += 1
+                continue
+
+            document = parse_page(relative, data.decode('utf-8'))
+            if entry is not None:
+                doc_id = entry['id']
+                self._drop(relative)
+            else:
+                doc_id = self.next_id
+                self.next_id += 1
+            self._add(relative, digest, doc_id, document)
+            result.updated += 1
+
+        if result.updated or result.removed:
+            result.written = self._save()
+        return result
+
+    def sync(self) -> IndexUpdate:
+        """docs/ 아래 페이지 전체와 맞춤 (바뀐 파일 갱신, 사라진 파일 삭제)"""
+        pages = self.pages()
+        present = {self._relative(page) for page in pages}
+        missing = [self.site_dir / relative for relative in self.files if relative not in present]
+        return self.update(pages, remove=missing)
+
+    def _save(self) -> list[Path]:
+        """바뀐 샤드와 docs.json, 상태 파일 저장 (내용이 같은 파일은 쓰지 않음)"""
+        written = []
+        for key in sorted(self._dirty):
+            path = self.shard_dir / f"{key}.json"
+            shard = self._shards[key]
+            if not shard:
+                if path.exists():
+                    path.unlink()
+                    written.append(path)
+                continue
+            data = {
+                term: [value for doc_id in sorted(postings) for value in (doc_id, postings[doc_id])]
+                for term, postings in sorted(shard.items())
+            }
+            if write_text_if_changed(path, _dump(data)):
+                written.append(path)
+        self._dirty.clear()
+
+        docs = {
+            'version': INDEX_VERSION,
+            'tokenizer': {
+                'particles': list(PARTICLES),
+                'stopwords': sorted(STOPWORDS),
+                'max_term_length': MAX_TERM_LENGTH,
+            },
+            'docs': dict(sorted(self.docs.items(), key=lambda item: int(item[0]))),
+        }
+        state = {
+            'version': INDEX_VERSION,
+            'next_id': self.next_id,
+            'files': dict(sorted(self.files.items())),
+        }
+        for path, data in ((self.docs_path, docs), (self.state_path, state)):
+            if write_text_if_changed(path, _dump(data)):
+                written.append(path)
+        return written
+
+    def clear(self) -> None:
+        """색인 파일을 모두 지우고 빈 상태로 되돌림 (--rebuild)"""
+        for path in self.shard_dir.glob("*.json"):
+            path.unlink()
+        for path in (self.docs_path, self.state_path):
+            if path.exists():
+                path.unlink()
+        self.next_id, self.files, self.docs = 0, {}, {}
+        self._shards.clear()
+        self._dirty.clear()
+
+
+def _dump(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사이트 검색 색인 갱신')
+    parser.add_argument(
+        '--site-dir',
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help='Jekyll 사이트 루트 (기본값: 저장소 루트)'
+    )
+    parser.add_argument('--rebuild', action='store_true', help='색인을 지우고 새로 만듦')
+    args = parser.parse_args()
+
+    index = SearchIndex(args.site_dir)
+    if args.rebuild:
+        index.clear()
+    result = index.sync()
+    print(f"[완료] {result.summary()}")
+    for path in result.written:
+        print(f"  {path.relative_to(index.site_dir)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+파이프라인 로컬 상태 파일(JSON) 유틸리티
+
+체크포인트, 인덱스, 캐시 같은 상태 파일은 블로그 저장소의 .cache/ 아래에 저장됩니다.
+쓰기는 임시 파일 + os.replace로 원자적으로 수행하여, 실행 도중 중단되어도
+반쯤 쓰인 상태 파일이 남지 않도록 합니다.
+"""
+
+import filecmp
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+# 기본 상태 디렉토리 (저장소 루트/.cache)
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache"
+
+# 새 파일 권한에 적용할 umask (읽으려면 바꿔야 하므로, 쓰는 도중이 아니라 import할 때 한 번만 읽음)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def load_json_state(path: Path, default: Any = None) -> Any:
+    """
+    JSON 상태 파일 로드
+
+    파일이 없거나 손상된 경우 default를 반환합니다. 상태 파일은 언제든
+    다시 만들 수 있는 캐시이므로 읽기 실패는 치명적인 오류로 취급하지 않습니다.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"[경고] 상태 파일을 읽을 수 없어 무시합니다: {path}: {e}")
+        return default
+
+
+def _file_mode(path: Path) -> int:
+    """기존 파일의 권한, 없으면 open()으로 새로 만들 때와 같은 권한 (0o666에 umask 적용)"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+class AtomicWriter:
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체하는 텍스트 파일 쓰기 (with 문으로 사용)
+
+    mkstemp는 임시 파일을 0o600으로 만들고 os.replace는 그 권한을 그대로 가져오므로,
+    교체 전에 기존 파일의 권한(없으면 umask를 적용한 기본 권한)을 붙입니다.
+    블록이 정상적으로 끝나면 교체하고, 예외가 나면 임시 파일을 지웁니다.
+
+    Attributes:
+        changed: 파일을 교체했는지 (skip_unchanged이고 내용이 같으면 False)
+    """
+
+    def __init__(self, path: Path, skip_unchanged: bool = False):
+        """
+        Args:
+            path: 최종 파일 경로
+            skip_unchanged: 결과가 기존 파일과 바이트 단위로 같으면 교체하지 않음 (mtime 유지)
+        """
+        self.path = path
+        self.skip_unchanged = skip_unchanged
+        self.changed = False
+        self._file: Optional[TextIO] = None
+        self._tmp_path: Optional[str] = None
+
+    def __enter__(self) -> TextIO:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        self._file = os.fdopen(fd, 'w', encoding='utf-8')
+        return self._file
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._file.close()
+            if exc_type is None:
+                if not (self.skip_unchanged and self.path.exists()
+                        and filecmp.cmp(self._tmp_path, self.path, shallow=False)):
+                    os.chmod(self._tmp_path, _file_mode(self.path))
+                    os.replace(self._tmp_path, self.path)
+                    self.changed = True
+                    return
+        except BaseException:
+            self._discard()
+            raise
+        self._discard()
+
+    def _discard(self) -> None:
+        try:
+            os.unlink(self._tmp_path)
+        except OSError:
+            pass
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """임시 파일에 쓴 뒤 os.replace로 교체하여 원자적으로 저장"""
+    with AtomicWriter(path) as f:
+        f.write(text)
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """
+    내용이 다를 때만 원자적으로 저장
+
+    기존 파일과 바이트 단위로 같으면 쓰지 않으므로 파일과 mtime이 그대로 남습니다
+    (다시 실행해도 git 변경이나 사이트 재빌드가 생기지 않음).
+
+    Returns:
+        파일을 썼으면 True, 내용이 같아 건너뛰었으면 False
+    """
+    data = text.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read(len(data) + 1) == data:
+                return False
+    except FileNotFoundError:
+        pass
+    atomic_write_text(path, text)
+    return True
+
+
+def save_json_state(path: Path, data: Any) -> None:
+    """JSON 상태 파일을 원자적으로 저장"""
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, separators=(',', ':')))
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+긴 대화 기록의 단계적 요약(map-reduce) 도구
+
+하루치 대화가 토큰 예산을 넘으면 글자 수로 잘라내는 대신,
+1. 대화 세션(Conversation)마다 요약하고 (map, 예산보다 긴 세션은 조각으로 나눠 요약)
+2. 요약들이 예산 안에 들어올 때까지 묶어서 다시 요약합니다 (reduce)
+
+세션 요약은 세션 내용으로만 정해지므로 SessionSummaryCache에 저장해 두고, 다시 발행할 때는
+새로 생기거나 바뀐 세션만 요약합니다. 같은 이유로 세션 조각에는 항상 날짜를 표시합니다
+(하루 포스트에서 만든 요약을 기간 포스트에서도 그대로 재사용).
+
+마지막 요약은 BlogPostGenerator가 블로그 포스트 프롬프트에 넣습니다.
+토큰 수는 tiktoken이 설치되어 있으면 그것으로, 없으면 문자 종류별 근사치로 셉니다.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from .collect_conversations import Conversation, ConversationCollector
+
+# 한 번에 원문 그대로 보낼 수 있는 대화 내용의 최대 토큰 수
+DEFAULT_TOKEN_BUDGET = 24_000
+
+# map 단계 조각 하나의 최대 토큰 수
+DEFAULT_CHUNK_TOKENS = 8_000
+
+# map/reduce 요약 응답의 최대 토큰 수
+SUMMARY_MAX_TOKENS = 1024
+
+
+@lru_cache(maxsize=1)
+def _tiktoken_encoding():
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding('cl100k_base')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수 추정
+
+    tiktoken이 없으면 ASCII는 4글자당 1토큰, 한글 등 그 외 문자는 1글자당 1토큰으로
+    셉니다. 실제보다 약간 크게 잡히는 쪽이라 예산을 넘기지 않습니다.
+    """
+    encoding = _tiktoken_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    ascii_chars = sum(1 for ch in text if ch < '\x80')
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def chunk_conversations(
+    collector: ConversationCollector,
+    conversations: Iterable[Conversation],
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    show_date: bool = False
+) -> list[str]:
+    """
+    대화들을 토큰 예산 크기의 요약용 텍스트 조각으로 나눔
+
+    작은 대화들은 순서대로 한 조각에 모으고, 예산보다 큰 대화는 메시지 경계에서
+    여러 조각으로 나눕니다(이어지는 조각에는 대화 헤더를 다시 붙임).
+    모든 대화가 적어도 한 조각에 포함됩니다.
+
+    Args:
+        collector: format_for_summary 형식을 만드는 수집기
+        conversations: 나눌 대화들 (시간순)
+        chunk_tokens: 조각 하나의 최대 토큰 수
+        show_date: 시간 앞에 날짜도 표시
+
+    Returns:
+        format_for_summary 형식의 텍스트 조각 리스트
+    """
+    chunks: list[str] = []
+    parts: list[str] = []
+    tokens = 0
+
+    for conv in conversations:
+        blocks = _message_blocks(collector.iter_summary_parts([conv], show_date))
+        header = blocks[0]
+        header_tokens = estimate_tokens('\n'.join(header)) + 1
+
+        for index, block in enumerate(blocks):
+            block_tokens = estimate_tokens('\n'.join(block)) + 1
+            if parts and tokens + block_tokens > chunk_tokens:
+                chunks.append('\n'.join(parts))
+                parts, tokens = [], 0
+            if index > 0 and not parts:
+                parts.extend(header)
+                tokens += header_tokens
+            parts.extend(block)
+            tokens += block_tokens
+
+    if parts:
+        chunks.append('\n'.join(parts))
+    return chunks
+
+
+def _message_blocks(parts: Iterable[str]) -> list[list[str]]:
+    """iter_summary_parts 조각들을 [대화 헤더, 메시지1, 메시지2, ...] 블록으로 묶음"""
+    blocks: list[list[str]] = [[]]
+    for part in parts:
+        if part.startswith("\n### "):
+            blocks.append([])
+        blocks[-1].append(part)
+    return blocks
+
+
+def group_by_budget(texts: list[str], budget: int) -> list[list[str]]:
+    """순서를 유지하며 합계가 budget 이하가 되도록 묶음 (하나가 budget보다 크면 단독 그룹)"""
+    groups: list[list[str]] = []
+    current: list[str] = []
+    tokens = 0
+    for text in texts:
+        text_tokens = estimate_tokens(text)
+        if current and tokens + text_tokens > budget:
+            groups.append(current)
+            current, tokens = [], 0
+        current.append(text)
+        tokens += text_tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _period_label(target_date: datetime, end_date: Optional[datetime]) -> str:
+    if end_date is not None and end_date.date() != target_date.date():
+        return f"{target_date.strftime('%Y년 %m월 %d일')} ~ {end_date.strftime('%Y년 %m월 %d일')}"
+    return target_date.strftime('%Y년 %m월 %d일')
+
+
+def session_chunks(
+    collector: ConversationCollector,
+    conversation: Conversation,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS
+) -> list[str]:
+    """세션 하나를 요약용 조각으로 나눔 (날짜 표시 포함, 예산 안이면 조각 하나)"""
+    return chunk_conversations(collector, [conversation], chunk_tokens, show_date=True)
+
+
+def build_map_prompt(chunk: str, index: int, total: int) -> str:
+    """
+    세션 조각 하나를 요약하는 프롬프트
+
+    포스트 날짜에 의존하지 않아야 세션 요약을 다른 날짜/기간 포스트에서도 재사용할 수 있습니다.
+    """
+    part = f" ({index}/{total} 부분)" if total > 1 else ""
+    return f"""다음은 Claude Code로 작업한 대화 세션 하나의 기록입니다{part}.
+나중에 다른 세션의 요약과 합쳐 블로그 포스트를 작성할 예정입니다.
+
+## 요청사항:
+- 프로젝트별로 학습하거나 작업한 내용, 해결한 문제, 핵심 개념을 간결하게 요약해주세요
+- 중요한 코드나 명령어는 짧게 인용해주세요
+- 한국어 마크다운 목록 형식으로 작성하고, 서론이나 맺음말은 쓰지 마세요
+
+## 대화 내용:
+{chunk}
+"""
+
+
+def build_reduce_prompt(
+    summaries: list[str],
+    target_date: datetime,
+    end_date: Optional[datetime] = None
+) -> str:
+    """여러 부분 요약을 하나로 합치는 프롬프트"""
+    joined = '\n\n---\n\n'.join(summaries)
+    return f"""다음은 {_period_label(target_date, end_date)} Claude Code 대화 기록을 나눠서 요약한 결과들입니다.
+
+## 요청사항:
+- 같은 주제나 프로젝트끼리 합쳐 하나의 요약으로 정리해주세요
+- 어떤 부분 요약의 내용도 빠뜨리지 말고, 중복만 제거해주세요
+- 한국어 마크다운 목록 형식으로 작성하고, 서론이나 맺음말은 쓰지 마세요
+
+## 부분 요약:
+{joined}
+"""
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+프로젝트별 agent-*.jsonl 인덱스
+
+각 agent 파일에 어떤 sessionId가 들어 있는지와 timestamp 범위(min_ts, max_ts)를
+프로젝트 단위로 저장해 두고, 파일의 mtime/크기가 바뀐 경우에만 갱신합니다.
+파일은 뒤에 덧붙여지기만 하므로 크기가 늘어난 파일은 이전에 읽은 위치 이후만 다시 읽습니다.
+캐시를 쓰지 않을 때는 recent_files로 수정 시각만 보고 고른 뒤, 세션 확인은 파일을 읽으면서 합니다.
+
+저장 위치: {cache_dir}/transcript_index/{encoded-project}.json
+    {
+        "version": 3,
+        "files": {
+            "agent-xxx.jsonl": {
+                "mtime_ns": int, "size": int, "offset": int,
+                "sessions": [session_id, ...],
+                "min_ts": int | null, "max_ts": int | null,  # epoch 밀리초
+                "tail": bool   # 줄바꿈 없이 끝난 마지막 줄(offset 이후)을 읽었는지
+            }
+        }
+    }
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .json_backend import SESSION_ID_PATTERN, TIMESTAMP_PATTERN
+from .state import load_json_state, save_json_state
+
+# 인덱스 형식 버전 (형식이 바뀌면 올려서 전체 재생성 유도)
+INDEX_VERSION = 3
+
+
+def iso_to_epoch_ms(ts_str: str) -> Optional[int]:
+    """ISO 8601 문자열을 epoch 밀리초로 변환 (타임존 없는 값은 로컬 시각으로 간주)"""
+    try:
+        ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return int(ts.timestamp() * 1000)
+
+
+def scan_transcript(agent_file: Path, entry: dict, include_tail: bool = False) -> dict:
+    """
+    entry의 offset 이후의 완성된 줄들에서 sessionId와 timestamp 범위를 수집해 entry 갱신
+
+    include_tail이면 줄바꿈 없이 끝난 마지막 줄도 읽되, offset은 그 줄 앞에 둡니다
+    (줄이 나중에 이어 쓰이면 다시 읽으며, 같은 값이 다시 더해질 뿐이라 안전함).
+    """
+    offset = entry.get('offset', 0)
+    sessions = set(entry.get('sessions', []))
+    min_ts = entry.get('min_ts')
+    max_ts = entry.get('max_ts')
+
+    with open(agent_file, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            # 아직 쓰는 중일 수 있는 마지막 줄은 다음 갱신에서 다시 읽음
+            if line.endswith(b'\n'):
+                offset += len(line)
+            elif not include_tail:
+                break
+            for match in SESSION_ID_PATTERN.finditer(line):
+                sessions.add(match.group(1).decode('utf-8', errors='replace'))
+            # 중첩 객체의 timestamp까지 포함되면 범위가 넓어질 뿐이므로 안전함
+            for match in TIMESTAMP_PATTERN.finditer(line):
+                ts_ms = iso_to_epoch_ms(match.group(1).decode('ascii', errors='replace'))
+                if ts_ms is None:
+                    continue
+                if min_ts is None or ts_ms < min_ts:
+                    min_ts = ts_ms
+                if max_ts is None or ts_ms > max_ts:
+                    max_ts = ts_ms
+
+    entry['offset'] = offset
+    entry['sessions'] = sorted(sessions)
+    entry['min_ts'] = min_ts
+    entry['max_ts'] = max_ts
+    return entry
+
+
+def entry_matches(entry: dict, session_ids: set[str], start_ms: int, end_ms: int) -> bool:
+    """엔트리가 주어진 세션을 포함하고 timestamp 범위가 [start_ms, end_ms)와 겹치는지"""
+    if session_ids and session_ids.isdisjoint(entry.get('sessions', [])):
+        return False
+    min_ts, max_ts = entry.get('min_ts'), entry.get('max_ts')
+    return min_ts is not None and max_ts >= start_ms and min_ts < end_ms
+
+
+def recent_files(project_dir: Path, min_mtime_ns: int = 0) -> tuple[list[Path], int]:
+    """
+    인덱스 없이 수정 시각만 보고 고른 agent 파일 (캐시를 쓰지 않는 실행용)
+
+    Returns:
+        (min_mtime_ns 이후에 수정된 파일 경로 리스트(파일명 순), 전체 agent 파일 수)
+    """
+    agent_files = sorted(project_dir.glob("agent-*.jsonl"))
+    selected = []
+    for agent_file in agent_files:
+        try:
+            if agent_file.stat().st_mtime_ns >= min_mtime_ns:
+                selected.append(agent_file)
+        except OSError:
+            continue
+    return selected, len(agent_files)
+
+
+class TranscriptIndex:
+    """sessionId → agent 파일 인덱스"""
+
+    def __init__(self, index_dir: Path):
+        self.index_dir = index_dir
+
+    def _index_path(self, project_dir: Path) -> Path:
+        return self.index_dir / f"{project_dir.name}.json"
+
+    def _load(self, project_dir: Path) -> dict:
+        state = load_json_state(self._index_path(project_dir), default={})
+        if not isinstance(state, dict) or state.get('version') != INDEX_VERSION:
+            return {}
+        return state.get('files', {})
+
+    def update(self, project_dir: Path, min_mtime_ns: int = 0) -> tuple[dict[str, dict], int]:
+        """
+        프로젝트 디렉토리의 인덱스를 mtime/크기 기준으로 증분 갱신
+
+        Args:
+            project_dir: ~/.claude/projects/{encoded-path}
+            min_mtime_ns: 이보다 오래전에 수정된 파일은 다시 읽지 않고 결과에서 제외
+                (기존 엔트리는 다음 실행을 위해 그대로 보존)
+
+        Returns:
+            (dict[파일명, 인덱스 엔트리] (min_mtime_ns 조건을 통과한 파일만), 전체 agent 파일 수)
+        """
+        files = self._load(project_dir)
+        updated: dict[str, dict] = {}
+        selected: dict[str, dict] = {}
+        changed = False
+
+        agent_files = sorted(project_dir.glob("agent-*.jsonl"))
+        for agent_file in agent_files:
+            try:
+                st = agent_file.stat()
+            except OSError:
+                continue
+
+            entry = files.get(agent_file.name)
+            if st.st_mtime_ns < min_mtime_ns:
+                if entry:
+                    updated[agent_file.name] = entry
+                continue
+
+            if entry and entry.get('size') == st.st_size:
+                # 크기가 그대로면 줄바꿈 없이 끝난 마지막 줄은 다 쓰인 것으로 보고 한 번 읽음
+                if entry.get('offset', 0) < st.st_size and not entry.get('tail'):
+                    try:
+                        entry = scan_transcript(agent_file, entry, include_tail=True)
+                    except IOError as e:
+                        print(f"[경고] 파일 읽기 오류: {agent_file}: {e}")
+                        continue
+                    entry['tail'] = True
+                    changed = True
+                if entry.get('mtime_ns') != st.st_mtime_ns:
+                    entry['mtime_ns'] = st.st_mtime_ns
+                    changed = True
+                updated[agent_file.name] = entry
+                selected[agent_file.name] = entry
+                continue
+
+            # 줄어든 파일은 새로 쓰인 것으로 보고 처음부터 다시 읽음
+            if not entry or st.st_size < entry.get('offset', 0):
+                entry = {}
+
+            try:
+                entry = scan_transcript(agent_file, entry)
+            except IOError as e:
+                print(f"[경고] 파일 읽기 오류: {agent_file}: {e}")
+                continue
+
+            entry['mtime_ns'] = st.st_mtime_ns
+            entry['size'] = st.st_size
+            entry['tail'] = False
+            updated[agent_file.name] = entry
+            selected[agent_file.name] = entry
+            changed = True
+
+        if changed or updated.keys() != files.keys():
+            save_json_state(self._index_path(project_dir), {
+                'version': INDEX_VERSION,
+                'files': updated,
+            })
+
+        return selected, len(agent_files)
+
+    def select_entries(
+        self,
+        project_dir: Path,
+        session_ids: set[str],
+        start_ms: int,
+        end_ms: int
+    ) -> tuple[list[tuple[Path, list[str]]], int]:
+        """
+        [start_ms, end_ms) 구간과 겹치고 주어진 세션을 포함한 agent 파일과 그 세션 목록
+
+        구간 시작보다 먼저 수정이 멈춘 파일은 열지 않고, 인덱스의 timestamp 범위가
+        구간과 겹치지 않는 파일도 건너뜁니다.
+
+        Args:
+            project_dir: ~/.claude/projects/{encoded-path}
+            session_ids: 찾을 세션 ID 세트 (비어 있으면 세션으로 거르지 않음)
+            start_ms: 구간 시작 (epoch 밀리초, 포함)
+            end_ms: 구간 끝 (epoch 밀리초, 미포함)
+
+        Returns:
+            (파일명 순으로 정렬된 (agent 파일 경로, 파일에 들어 있는 세션 ID 리스트),
+             프로젝트의 전체 agent 파일 수)
+        """
+        files, candidates = self.update(project_dir, min_mtime_ns=start_ms * 1_000_000)
+        selected = [
+            (project_dir / name, entry.get('sessions', []))
+            for name, entry in files.items()
+            if entry_matches(entry, session_ids, start_ms, end_ms)
+        ]
+        return selected, candidates
+
+    def select_files(
+        self,
+        project_dir: Path,
+        session_ids: set[str],
+        start_ms: int,
+        end_ms: int
+    ) -> list[Path]:
+        """select_entries에서 파일 경로만 반환"""
+        return [
+            agent_file
+            for agent_file, _ in self.select_entries(project_dir, session_ids, start_ms, end_ms)[0]
+        ]
@@ -0,0 +1,39 @@
+"""
+수집기 마이크로벤치마크 공통 fixture
+
+합성 코퍼스는 세션마다 한 번만 만들고 모든 벤치마크가 공유합니다.
+규모는 RECOBLOG_BENCH_SCALE 환경변수로 바꿀 수 있습니다 (10k, 100k, 1m, 10m, 기본값 10k).
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from benchmarks.synthetic_corpus import SCALES, CorpusInfo, write_corpus
+from tests.conftest import BASELINE_SCALE
+from scripts.collect_conversations import ConversationCollector
+
+
+@pytest.fixture(scope='session')
+def corpus(tmp_path_factory) -> CorpusInfo:
+    scale = os.environ.get('RECOBLOG_BENCH_SCALE', BASELINE_SCALE)
+    return write_corpus(tmp_path_factory.mktemp('claude'), SCALES[scale])
+
+
+@pytest.fixture(scope='session')
+def target_date(corpus: CorpusInfo) -> datetime:
+    """코퍼스 가운데 날짜"""
+    return corpus.dates()[corpus.days // 2]
+
+
+@pytest.fixture
+def collector(corpus: CorpusInfo) -> ConversationCollector:
+    """상태 파일 없이 매번 원본을 읽는 수집기"""
+    return ConversationCollector(use_cache=False, claude_dir=corpus.claude_dir)
+
+
+@pytest.fixture
+def cached_collector(corpus: CorpusInfo, tmp_path) -> ConversationCollector:
+    """체크포인트/인덱스를 쓰는 수집기 (첫 호출에서 상태 파일 생성)"""
+    return ConversationCollector(cache_dir=tmp_path / "cache", claude_dir=corpus.claude_dir)
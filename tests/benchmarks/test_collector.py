@@ -0,0 +1,55 @@
+"""
+ConversationCollector 마이크로벤치마크
+
+    python -m pytest -m perf tests/benchmarks --benchmark-storage=benchmarks/baselines \
+        --benchmark-compare --benchmark-compare-fail=min:30%
+
+benchmarks/baselines의 기준선과 비교해 최솟값이 기준선보다 30% 넘게 느려진 벤치마크가 있으면
+실패합니다. 기준선은 기계별로 저장되므로 처음 실행하는 기계에서는 비교 없이 결과만 나옵니다.
+새 기준선 저장:
+
+    python -m pytest -m perf tests/benchmarks --benchmark-storage=benchmarks/baselines \
+        --benchmark-save=baseline
+"""
+
+import pytest
+
+pytestmark = pytest.mark.perf
+
+
+def test_get_today_sessions(benchmark, collector, target_date):
+    sessions = benchmark(collector.get_today_sessions, target_date)
+    assert sessions
+
+
+def test_get_today_sessions_checkpoint(benchmark, cached_collector, target_date):
+    cached_collector.get_today_sessions(target_date)
+    sessions = benchmark(cached_collector.get_today_sessions, target_date)
+    assert sessions
+
+
+def test_collect_project_conversations(benchmark, collector, target_date):
+    sessions = collector.get_today_sessions(target_date)
+    project, session_ids = max(sessions.items(), key=lambda item: len(item[1]))
+    conversations = benchmark(
+        collector.collect_project_conversations, project, session_ids, target_date
+    )
+    assert conversations
+
+
+def test_collect_all(benchmark, collector, target_date):
+    conversations = benchmark(collector.collect_all, target_date)
+    assert conversations
+
+
+def test_collect_all_indexed(benchmark, cached_collector, target_date):
+    cached_collector.collect_all(target_date)
+    conversations = benchmark(cached_collector.collect_all, target_date)
+    assert conversations
+
+
+@pytest.mark.parametrize('show_date', [False, True])
+def test_format_for_summary(benchmark, collector, target_date, show_date):
+    conversations = collector.collect_all(target_date)
+    text = benchmark(collector.format_for_summary, conversations, show_date=show_date)
+    assert text
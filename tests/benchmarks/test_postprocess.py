@@ -0,0 +1,50 @@
+"""
+포스트 후처리 마이크로벤치마크
+
+    python -m pytest -m perf tests/benchmarks/test_postprocess.py
+
+모의 LLM 서버가 돌려주는 것과 같은 모양의 긴 포스트(프론트매터, 언어 표시가 없는 코드 블록,
+유니코드 특수 문자 포함)를 한 번에, 또 스트리밍처럼 작은 조각으로 나눠 처리합니다.
+"""
+
+import pytest
+
+from scripts.postprocess import PostProcessor
+
+pytestmark = pytest.mark.perf
+
+# 스트리밍 조각 크기 (토큰 몇 개 분량)
+CHUNK_CHARS = 16
+
+
+@pytest.fixture(scope='module')
+def post() -> str:
+    section = (
+        "## 배운 점 — “캐시” 구조\n\n"
+        "요청 수를 줄이는 것이 핵심이다… 세마포어로 동시 요청을 제한했다.\n\n"
+        "```\nasync with semaphore:\n    await client.create()\n```\n\n"
+        "```python\nprint('ok')\n```\n\n"
+    )
+    return (
+        "---\nlayout: default\ntitle: \"후처리 벤치마크\"\nparent: 학습 기록\nnav_order: 1\n---\n\n"
+        + section * 500
+    )
+
+
+def make_processor() -> PostProcessor:
+    return PostProcessor(default_title="2026년 02월 01일 학습 기록", date="2026-02-01")
+
+
+def test_postprocess(benchmark, post):
+    result = benchmark(lambda: make_processor().process(post))
+    assert "```text" in result and "—" not in result
+
+
+def test_postprocess_streamed(benchmark, post):
+    chunks = [post[i:i + CHUNK_CHARS] for i in range(0, len(post), CHUNK_CHARS)]
+
+    def run() -> str:
+        processor = make_processor()
+        return ''.join(processor.feed(chunk) for chunk in chunks) + processor.finish()
+
+    assert benchmark(run) == make_processor().process(post)
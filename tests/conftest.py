@@ -0,0 +1,29 @@
+"""
+pytest 공통 설정
+
+벤치마크(perf 마커)는 기본 실행에서 빠지고, 기준선 비교 옵션과 함께 따로 실행합니다:
+
+    python -m pytest -m perf --benchmark-storage=benchmarks/baselines \
+        --benchmark-compare --benchmark-compare-fail=min:30%
+
+기준선은 기계(OS, Python 버전)별로 저장되므로, 이 기계의 기준선이 없거나 기준선과 다른
+규모(RECOBLOG_BENCH_SCALE)로 돌릴 때는 비교를 끄고 결과만 보여줍니다.
+"""
+
+import os
+
+# 저장된 기준선의 코퍼스 규모
+BASELINE_SCALE = '10k'
+
+
+def pytest_configure(config):
+    if not config.pluginmanager.hasplugin('benchmark'):
+        return
+
+    from pytest_benchmark.utils import get_machine_id
+
+    baseline_dir = config.rootpath / "benchmarks" / "baselines" / get_machine_id()
+    scale = os.environ.get('RECOBLOG_BENCH_SCALE', BASELINE_SCALE)
+    if scale != BASELINE_SCALE or not any(baseline_dir.glob("*.json")):
+        config.option.benchmark_compare = False
+        config.option.benchmark_compare_fail = []
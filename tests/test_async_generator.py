@@ -0,0 +1,113 @@
+"""
+비동기 포스트 생성기 테스트 (로컬 모의 LLM 서버 사용)
+
+    python -m pytest tests/test_async_generator.py
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from benchmarks.mock_llm_server import MockLLMServer
+from scripts.completion_cache import CompletionCache
+from scripts.generate_blog_post import AsyncBlogPostGenerator
+from tests.test_generate_blog_post import TARGET_DATE, conversation, words
+
+CONCURRENCY = 2
+
+
+@pytest.fixture
+def server():
+    # 요청이 겹치도록 첫 바이트까지 잠깐 기다리고, 응답은 짧게
+    with MockLLMServer(latency=0.05, tokens_per_second=0, response_tokens=40) as server:
+        yield server
+
+
+def make_generator(server: MockLLMServer, **kwargs) -> AsyncBlogPostGenerator:
+    return AsyncBlogPostGenerator(
+        api_key="mock", base_url=server.base_url, concurrency=CONCURRENCY,
+        token_budget=200, chunk_tokens=200, **kwargs
+    )
+
+
+def sessions(count: int = 6) -> list:
+    return [conversation(f"s{i}", [words(f"q{i}-", 20), words(f"r{i}-", 20)]) for i in range(count)]
+
+
+def test_session_summaries_respect_concurrency(server):
+    async def run() -> str:
+        async with make_generator(server) as generator:
+            return await generator._prepare_post_prompt(sessions(), TARGET_DATE)
+
+    prompt = asyncio.run(run())
+
+    stats = server.snapshot()
+    assert stats['requests'] >= 6
+    assert stats['max_concurrent'] == CONCURRENCY
+    assert "## 대화 요약:" in prompt
+
+
+def test_generate_posts_for_several_dates(server):
+    targets = [(sessions(2), TARGET_DATE), (sessions(8), TARGET_DATE + timedelta(days=1))]
+
+    async def run() -> list:
+        async with make_generator(server) as generator:
+            return await generator.generate_posts(targets)
+
+    posts = asyncio.run(run())
+
+    assert all(isinstance(post, str) for post in posts), posts
+    assert all(post.startswith("---\nlayout: default\n") for post in posts)
+    assert "date: 2026-02-02" in posts[1]
+
+
+def test_stream_matches_complete_and_is_cached(server, tmp_path):
+    cache = CompletionCache(tmp_path / "completions")
+
+    async def run() -> tuple[str, list[str], str, str]:
+        async with make_generator(server, cache=cache) as generator:
+            complete = await generator._complete("질문", 40)
+            pieces = [piece async for piece in generator._stream_complete("스트리밍 질문", 40)]
+            # 두 번째 요청은 캐시에서 한 조각으로 받음
+            cached = [piece async for piece in generator._stream_complete("스트리밍 질문", 40)]
+            return complete, pieces, ''.join(cached), generator.model
+
+    complete, pieces, cached, model = asyncio.run(run())
+
+    assert len(pieces) > 1 and ''.join(pieces) == complete == cached
+    assert server.snapshot()['streamed'] == 1
+    assert cache.get(model, "스트리밍 질문", 40) == complete
+
+
+@pytest.mark.parametrize('content', [
+    "---\ntitle: 프론트매터 제목\ntags: [python]\n---\n\n본문\n",
+    "# 첫 줄 제목\n\n본문\n",
+    "제목 없는 본문\n",
+])
+def test_backfill_post_matches_streamed_post(tmp_path, monkeypatch, content):
+    """일괄 발행(generate_complete_post)과 하루 단위 발행(save_post_stream)이 같은 제목 규칙을 따름"""
+    generator = AsyncBlogPostGenerator(api_key="mock", base_url="http://127.0.0.1:9")
+    generator.posts_dir = tmp_path
+
+    async def generate_post(conversations, target_date, end_date=None) -> str:
+        return content
+
+    async def complete(prompt: str, max_tokens: int) -> str:
+        raise AssertionError("본문 외에 LLM 요청을 보냄")
+
+    async def chunks():
+        for start in range(0, len(content), 7):
+            yield content[start:start + 7]
+
+    monkeypatch.setattr(generator, 'generate_post', generate_post)
+    monkeypatch.setattr(generator, '_complete', complete)
+
+    async def run() -> tuple[str, str]:
+        post = await generator.generate_complete_post([], TARGET_DATE)
+        path = await generator.save_post_stream(chunks(), TARGET_DATE)
+        return post, path.read_text(encoding='utf-8')
+
+    post, streamed = asyncio.run(run())
+
+    assert post == streamed
@@ -0,0 +1,231 @@
+"""
+대화 기록 수집기 테스트 (합성 ~/.claude 코퍼스)
+
+    python -m pytest tests/test_collect_conversations.py
+"""
+
+import heapq
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic_corpus import CorpusInfo, write_corpus
+from scripts import collect_conversations, transcript_index
+from scripts.collect_conversations import ConversationCollector, merge_sorted
+
+
+@pytest.fixture(scope='module')
+def corpus(tmp_path_factory) -> CorpusInfo:
+    # 여러 세션이 이어 쓴 파일과 자정을 넘긴 세션이 생기도록 프로젝트 수를 작게 잡음
+    return write_corpus(tmp_path_factory.mktemp('claude'), 4000, days=4, projects=3, sessions_per_day=8)
+
+
+def write_jsonl(path: Path, entries: list[dict]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(''.join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries), encoding='utf-8')
+    return path
+
+
+def transcript_line(session_id: str, local: datetime, text: str) -> dict:
+    ts = local.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    return {"type": "user", "sessionId": session_id, "timestamp": ts,
+            "message": {"role": "user", "content": text}}
+
+
+def history_line(session_id: str, local: datetime, project: str) -> dict:
+    return {"display": "질문", "timestamp": int(local.timestamp() * 1000),
+            "project": project, "sessionId": session_id}
+
+
+def make_collector(corpus: CorpusInfo, tmp_path, **kwargs) -> ConversationCollector:
+    return ConversationCollector(cache_dir=tmp_path / "cache", claude_dir=corpus.claude_dir, **kwargs)
+
+
+def test_uncached_collection_reads_each_file_once(corpus, tmp_path, monkeypatch):
+    cached = make_collector(corpus, tmp_path)
+    uncached = make_collector(corpus, tmp_path, use_cache=False)
+    expected = {
+        (day, project): cached.collect_project_conversations(project, session_ids, day)
+        for day in corpus.dates()
+        for project, session_ids in cached.get_today_sessions(day).items()
+    }
+
+    def scan_transcript(agent_file, entry, include_tail=False):
+        raise AssertionError(f"인덱스 없이 수집할 때 미리 훑음: {agent_file}")
+
+    monkeypatch.setattr(transcript_index, 'scan_transcript', scan_transcript)
+
+    for (day, project), conversations in expected.items():
+        session_ids = uncached.get_today_sessions(day)[project]
+        candidates = uncached.select_agent_files(project, session_ids, day)
+        opened = uncached.stats.files_opened
+
+        assert uncached.collect_project_conversations(project, session_ids, day) == conversations
+        # 수정 시각으로 고른 파일을 한 번씩만 열고, 세션 확인은 읽으면서 함
+        assert uncached.stats.files_opened - opened == len(candidates)
+
+
+def test_session_from_previous_day_is_not_collected_without_cache(tmp_path):
+    """자정을 넘긴 세션 A는 다음 날 history에 없으므로, 같은 프로젝트에 다른 세션이 있어도 제외"""
+    project = "/work/recoblog"
+    project_dir = tmp_path / "claude" / "projects" / project.replace('/', '-')
+    evening, after_midnight, morning = (
+        datetime(2026, 2, 1, 23, 30), datetime(2026, 2, 2, 0, 30), datetime(2026, 2, 2, 10, 0)
+    )
+    write_jsonl(project_dir / "agent-a.jsonl", [
+        transcript_line("session-a", evening, "어제 시작한 작업"),
+        transcript_line("session-a", after_midnight, "자정 넘어 이어진 작업"),
+    ])
+    write_jsonl(project_dir / "agent-b.jsonl", [transcript_line("session-b", morning, "오늘 작업")])
+    write_jsonl(tmp_path / "claude" / "history.jsonl", [
+        history_line("session-a", evening, project), history_line("session-b", morning, project),
+    ])
+    for name, local in (("agent-a.jsonl", after_midnight), ("agent-b.jsonl", morning)):
+        os.utime(project_dir / name, (local.timestamp(), local.timestamp()))
+
+    for use_cache in (True, False):
+        collector = ConversationCollector(
+            cache_dir=tmp_path / "cache", claude_dir=tmp_path / "claude", use_cache=use_cache
+        )
+        conversations = collector.collect_all(datetime(2026, 2, 2))
+        assert [conv.session_id for conv in conversations] == ["session-b"], use_cache
+
+
+def test_messages_before_the_session_line_are_kept_without_cache(tmp_path):
+    """history에 있는 세션이 파일 중간에 처음 나와도, 인덱스처럼 파일의 그날 메시지를 모두 수집"""
+    project = "/work/recoblog"
+    project_dir = tmp_path / "claude" / "projects" / project.replace('/', '-')
+    write_jsonl(project_dir / "agent-a.jsonl", [
+        transcript_line("session-x", datetime(2026, 2, 2, 9), "먼저 쓴 세션"),
+        transcript_line("session-a", datetime(2026, 2, 2, 10), "history의 세션"),
+    ])
+
+    collected = [
+        ConversationCollector(cache_dir=tmp_path / "cache", claude_dir=tmp_path / "claude", use_cache=use_cache)
+        .collect_project_conversations(project, {"session-a"}, datetime(2026, 2, 2))
+        for use_cache in (True, False)
+    ]
+
+    assert collected[0] == collected[1]
+    assert [msg.content for msg in collected[1][0].messages] == ["먼저 쓴 세션", "history의 세션"]
+
+
+def test_cached_and_uncached_collection_are_identical(corpus, tmp_path):
+    cached = make_collector(corpus, tmp_path)
+    uncached = make_collector(corpus, tmp_path, use_cache=False)
+
+    for day in corpus.dates():
+        assert uncached.collect_all(day) == cached.collect_all(day), day
+    assert (uncached.collect_range(corpus.dates()[0], corpus.dates()[-1])
+            == cached.collect_range(corpus.dates()[0], corpus.dates()[-1]))
+    # 다시 실행해 인덱스를 읽어 고른 결과도 같음
+    assert cached.collect_all(corpus.dates()[1]) == uncached.collect_all(corpus.dates()[1])
+
+
+def test_range_collection_matches_daily_collection(corpus, tmp_path):
+    collector = make_collector(corpus, tmp_path)
+
+    by_date = collector.collect_range(corpus.dates()[0], corpus.dates()[-1])
+
+    assert {datetime.combine(d, datetime.min.time()): convs for d, convs in by_date.items()} == {
+        day: collector.collect_all(day) for day in corpus.dates()
+    }
+
+
+def test_merge_sorted_bounds_open_streams():
+    open_now = peak = 0
+
+    def stream(values):
+        nonlocal open_now, peak
+        open_now += 1
+        peak = max(peak, open_now)
+        try:
+            yield from values
+        finally:
+            open_now -= 1
+
+    data = [[(i * 7 + j * 3) % 50 for j in range(20)] for i in range(23)]
+    data = [sorted(values) for values in data]
+    tagged = [[(value, i) for value in values] for i, values in enumerate(data)]
+
+    merged = list(merge_sorted((stream(values) for values in tagged), key=lambda t: t[0], max_open=4))
+
+    # 같은 값끼리는 앞 스트림의 항목이 먼저 (heapq.merge와 같음)
+    assert merged == list(heapq.merge(*tagged, key=lambda t: t[0]))
+    assert peak <= 4 and open_now == 0
+
+
+def test_iter_messages_in_batches_matches_single_merge(corpus, tmp_path, monkeypatch):
+    collector = make_collector(corpus, tmp_path)
+    day = corpus.dates()[1]
+    streams = collector.iter_agent_streams(day)
+    assert len(streams) > 2
+    expected = list(heapq.merge(*streams, key=lambda m: m.timestamp_ms))
+
+    monkeypatch.setattr(collect_conversations, 'MAX_OPEN_STREAMS', 2)
+
+    assert list(collector.iter_messages(day)) == expected
+
+
+def test_collect_all_groups_iter_messages(corpus, tmp_path, monkeypatch):
+    collector = make_collector(corpus, tmp_path)
+    day = corpus.dates()[1]
+    # 중간 결과를 임시 파일에 쓰는 병합 경로도 거치도록
+    monkeypatch.setattr(collect_conversations, 'MAX_OPEN_STREAMS', 2)
+
+    conversations = collector.collect_all(day)
+    messages = list(collector.iter_messages(day))
+
+    def key(msg):
+        return msg.timestamp_ms, msg.session_id, msg.content
+
+    assert len(conversations) > 2
+    assert sorted((msg for conv in conversations for msg in conv.messages), key=key) == sorted(messages, key=key)
+    assert collector.stats.files_opened == 2 * len(collector.iter_agent_streams(day))
+
+
+def test_read_error_propagates(corpus, tmp_path, monkeypatch):
+    collector = make_collector(corpus, tmp_path)
+    day = corpus.dates()[1]
+    streams = collector.iter_agent_streams(day)
+    streams[-1].agent_file = tmp_path / "agent-deleted.jsonl"
+    monkeypatch.setattr(collector, 'iter_agent_streams', lambda target_date: streams)
+
+    with pytest.raises(OSError):
+        list(collector.iter_messages(day))
+    with pytest.raises(OSError):
+        streams[-1].to_conversation()
+
+
+@pytest.mark.parametrize('command', [
+    [str(Path(collect_conversations.__file__))],
+    ['-m', 'scripts.collect_conversations'],
+])
+def test_script_runs_directly(tmp_path, command):
+    repo = Path(collect_conversations.__file__).parent.parent
+    result = subprocess.run(
+        [sys.executable, *command],
+        cwd=repo if command[0] == '-m' else tmp_path,
+        env={**os.environ, 'CLAUDE_CONFIG_DIR': str(tmp_path / "claude")},
+        capture_output=True, text=True, timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "대화 기록이 없습니다" in result.stdout
+
+
+def test_process_pool_matches_serial_collection(corpus, tmp_path):
+    serial = make_collector(corpus, tmp_path)
+    parallel = make_collector(corpus, tmp_path, workers=2)
+    first, last = corpus.dates()[0], corpus.dates()[-1]
+
+    assert parallel.collect_all(first) == serial.collect_all(first)
+    assert parallel.collect_range(first, last) == serial.collect_range(first, last)
+    # 워커에서 읽은 통계도 직렬 경로와 같이 합산됨
+    assert parallel.stats == serial.stats
+    assert parallel.stats.files_opened > 0
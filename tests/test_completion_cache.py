@@ -0,0 +1,118 @@
+"""
+LLM 응답 캐시와 세션 요약 캐시 테스트
+
+    python -m pytest tests/test_completion_cache.py
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from scripts import completion_cache
+from scripts.completion_cache import CompletionCache, SessionSummaryCache, session_summary_key
+from scripts.generate_blog_post import BlogPostGenerator
+
+MODEL = "gpt-test"
+DAY = 24 * 60 * 60
+
+
+@pytest.fixture
+def cache(tmp_path) -> CompletionCache:
+    return CompletionCache(tmp_path / "completions", max_age_days=30)
+
+
+def entries(cache: CompletionCache) -> list:
+    return sorted(cache.cache_dir.glob("*/*.json"))
+
+
+def age(path, days: float) -> None:
+    when = time.time() - days * DAY
+    os.utime(path, (when, when))
+
+
+def test_put_then_get(cache):
+    assert cache.get(MODEL, "질문", 100) is None
+    cache.put(MODEL, "질문", 100, "답변")
+
+    assert cache.get(MODEL, "질문", 100) == "답변"
+    assert cache.get(MODEL, "질문", 200) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_age_is_measured_from_last_use(cache):
+    cache.put(MODEL, "오래 쓰인 질문", 100, "답변")
+    cache.put(MODEL, "안 쓰인 질문", 100, "답변")
+    used, unused = (cache._path(completion_cache.completion_key(MODEL, prompt, 100))
+                    for prompt in ("오래 쓰인 질문", "안 쓰인 질문"))
+    # 어제 사용한 항목은 살아 있고, 31일 동안 사용하지 않은 항목은 만료
+    age(used, 1)
+    age(unused, 31)
+
+    assert cache.get(MODEL, "오래 쓰인 질문", 100) == "답변"
+    assert cache.get(MODEL, "안 쓰인 질문", 100) is None
+    assert cache.evict() == 1
+    assert entries(cache) == [used]
+
+
+def test_eviction_runs_once_per_interval(cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(CompletionCache, 'evict', lambda self: calls.append(1) or 0)
+
+    for i in range(completion_cache.EVICT_INTERVAL + 1):
+        cache.put(MODEL, f"질문 {i}", 100, "답변")
+
+    assert len(calls) == 2
+
+
+def test_size_limit_removes_least_recently_used(tmp_path):
+    cache = CompletionCache(tmp_path / "completions")
+    for i, days in enumerate((3, 1, 2)):
+        cache.put(MODEL, f"질문 {i}", 100, "답변")
+        age(cache._path(completion_cache.completion_key(MODEL, f"질문 {i}", 100)), days)
+    newest = cache._path(completion_cache.completion_key(MODEL, "질문 1", 100))
+    # 가장 최근에 쓴 항목 하나만 들어가는 크기
+    cache.max_bytes = newest.stat().st_size
+
+    assert cache.evict() == 2
+    assert entries(cache) == [newest]
+
+
+def test_session_summary_cache(tmp_path):
+    cache = SessionSummaryCache(tmp_path / "sessions")
+    key = session_summary_key(MODEL, ["조각 1", "조각 2"], 100)
+
+    assert cache.get(key) is None
+    cache.put(key, "요약", MODEL, "/work/recoblog", "session-a")
+
+    assert cache.get(key) == "요약"
+    assert session_summary_key(MODEL, ["조각 1", "조각 2 (수정)"], 100) != key
+    assert cache.summary() == "세션 요약 캐시: 재사용 1개, 새로 요약 1개"
+
+
+def fake_client(content: str, finish_reason: str):
+    def create(stream=False, **kwargs):
+        if stream:
+            return iter([
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content),
+                                                         finish_reason=None)]),
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None),
+                                                         finish_reason=finish_reason)]),
+            ])
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)])
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+@pytest.mark.parametrize('finish_reason, cached', [('stop', True), ('length', False)])
+def test_truncated_completion_is_not_cached(cache, finish_reason, cached):
+    generator = BlogPostGenerator(api_key="test", cache=cache)
+    generator.model = MODEL
+    generator.client = fake_client("응답", finish_reason)
+
+    assert generator._complete("질문", 100) == "응답"
+    assert ''.join(generator._stream_complete("스트리밍 질문", 100)) == "응답"
+
+    assert (cache.get(MODEL, "질문", 100) is not None) == cached
+    assert (cache.get(MODEL, "스트리밍 질문", 100) is not None) == cached
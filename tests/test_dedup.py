@@ -0,0 +1,87 @@
+"""
+중복 메시지 제거 테스트
+
+    python -m pytest tests/test_dedup.py
+"""
+
+import pytest
+
+from scripts.dedup import MIN_WORDS, dedup_conversations
+from scripts.generate_blog_post import BlogPostGenerator
+from tests.test_generate_blog_post import conversation, words
+
+
+def contents(conversations) -> list[list[str]]:
+    return [[msg.content for msg in conv.messages] for conv in conversations]
+
+
+def test_near_duplicate_is_removed_and_first_occurrence_wins():
+    original = words("w", 100)
+    # 마지막 단어만 다른 메시지 (Jaccard 약 0.94)
+    near = original.rsplit(' ', 1)[0] + " changed"
+    distinct = words("other", 100)
+    conv = conversation("s", [original, "답변", near, "답변 2", distinct])
+
+    result, report = dedup_conversations([conv], threshold=0.8)
+
+    assert contents(result) == [[original, "답변", "답변 2", distinct]]
+    assert (report.exact_removed, report.near_removed, report.messages) == (0, 1, 5)
+    assert report.bytes_saved == len(near.encode('utf-8'))
+
+
+def test_exact_duplicates_are_removed_across_sessions():
+    message = words("w")
+    first = conversation("a", [message, "답변"])
+    second = conversation("b", ["  ".join(message.split()), "다른 답변"])
+
+    result, report = dedup_conversations([first, second], threshold=1.0)
+
+    assert contents(result) == [[message, "답변"], ["다른 답변"]]
+    assert report.exact_removed == 1 and report.near_removed == 0
+
+
+def test_only_same_role_is_compared():
+    message = words("w")
+    # user, assistant 순서로 같은 내용
+    conv = conversation("s", [message, message])
+
+    result, report = dedup_conversations([conv])
+
+    assert contents(result) == [[message, message]] and report.removed == 0
+
+
+def test_short_messages_and_distinct_messages_are_kept():
+    short = ' '.join(["계속"] * (MIN_WORDS - 1))
+    conv = conversation("s", [short, words("a"), short, words("b")])
+
+    result, report = dedup_conversations([conv])
+
+    assert result == [conv] and report.removed == 0
+
+
+def test_fully_duplicated_conversation_is_dropped_and_input_untouched():
+    message = words("w")
+    first = conversation("a", [message])
+    second = conversation("b", [message])
+
+    result, _ = dedup_conversations([first, second])
+
+    assert [conv.session_id for conv in result] == ["a"]
+    assert contents([second]) == [[message]]
+
+
+def test_result_is_deterministic():
+    convs = [conversation(f"s{i}", [words(f"w{i % 3}", 60), words(f"r{i}", 60)]) for i in range(6)]
+
+    assert contents(dedup_conversations(convs)[0]) == contents(dedup_conversations(convs)[0])
+
+
+@pytest.mark.parametrize('threshold', [0, -0.5, 1.01, 2])
+def test_invalid_threshold_is_rejected(threshold):
+    with pytest.raises(ValueError):
+        dedup_conversations([conversation("s", [words("w")])], threshold=threshold)
+
+
+def test_generator_rejects_invalid_threshold():
+    with pytest.raises(ValueError):
+        BlogPostGenerator(api_key="test", dedup_threshold=1.5)
@@ -0,0 +1,119 @@
+"""
+포스트 생성기 테스트 (API 요청 없이 프롬프트 준비와 저장 단계만)
+
+    python -m pytest tests/test_generate_blog_post.py
+"""
+
+import os
+import stat
+from datetime import datetime, timedelta
+
+import pytest
+
+from scripts import state
+from scripts.collect_conversations import Conversation, Message
+from scripts.completion_cache import SessionSummaryCache
+from scripts.generate_blog_post import BlogPostGenerator, StreamingPostWriter
+
+TARGET_DATE = datetime(2026, 2, 1)
+STARTED = datetime(2026, 2, 1, 9, 0)
+
+
+def words(seed: str, count: int = 40) -> str:
+    """서로 겹치지 않는 단어 count개로 된 문장"""
+    return ' '.join(f"{seed}{i}" for i in range(count))
+
+
+def conversation(session_id: str, contents: list[str], project: str = "/work/recoblog") -> Conversation:
+    messages = [
+        Message(
+            'user' if i % 2 == 0 else 'assistant', content,
+            STARTED + timedelta(minutes=i), project, session_id
+        )
+        for i, content in enumerate(contents)
+    ]
+    return Conversation(
+        project=project,
+        session_id=session_id,
+        messages=messages,
+        start_time=messages[0].timestamp,
+        end_time=messages[-1].timestamp,
+    )
+
+
+@pytest.fixture
+def generator() -> BlogPostGenerator:
+    # 예산을 작게 잡아 항상 세션별로 나눠서 요약하게 함
+    return BlogPostGenerator(api_key="test", token_budget=200, chunk_tokens=200)
+
+
+def test_session_prompts_do_not_depend_on_other_sessions(generator):
+    shared = words("shared")
+    first = conversation("session-a", [shared, words("a")])
+    second = conversation("session-b", [shared, words("b"), words("c"), words("b")])
+
+    _, alone = generator.prepare_content([second], TARGET_DATE)
+    _, together = generator.prepare_content([first, second], TARGET_DATE)
+
+    prompts = {conv.session_id: prompts for conv, prompts in together}
+    assert prompts["session-b"] == alone[0][1]
+    # 세션 안의 중복은 지워지고, 다른 세션과 겹치는 메시지는 남음
+    text = '\n'.join(prompts["session-b"])
+    assert text.count("b0 b1 b2") == 1 and "shared0" in text
+
+
+def test_prepare_content_within_budget_sends_conversations_directly(generator):
+    content, sessions = generator.prepare_content(
+        [conversation("short", ["짧은 질문", "짧은 답변"])], TARGET_DATE
+    )
+
+    assert sessions == [] and "짧은 질문" in content
+
+
+def test_rerun_only_summarizes_new_sessions(tmp_path, monkeypatch):
+    generator = BlogPostGenerator(
+        api_key="test", token_budget=200, chunk_tokens=200,
+        session_cache=SessionSummaryCache(tmp_path / "sessions")
+    )
+    requested = []
+
+    def complete(prompt: str, max_tokens: int) -> str:
+        requested.append(prompt)
+        return f"요약 {len(requested)}"
+
+    monkeypatch.setattr(generator, '_complete', complete)
+    sessions = [conversation(f"s{i}", [words(f"q{i}-", 20), words(f"r{i}-", 20)]) for i in range(6)]
+
+    generator._prepare_post_prompt(sessions, TARGET_DATE)
+    assert len(requested) == 6
+
+    requested.clear()
+    late = conversation("late", [words("late-q", 20), words("late-r", 20)])
+    prompt = generator._prepare_post_prompt([late] + sessions, TARGET_DATE)
+
+    assert len(requested) == 1 and "late-q0" in requested[0]
+    assert all(f"요약 {i}" in prompt for i in range(1, 7))
+
+
+def test_streamed_post_has_normal_mode_and_unchanged_rerun_is_skipped(generator, tmp_path, monkeypatch):
+    monkeypatch.setattr(state, '_UMASK', 0o022)
+    generator.posts_dir = tmp_path / "docs" / "learning-records"
+    chunks = ["# 오늘 배운 것\n\n본", "문입니다.\n"]
+
+    path = generator.save_post_stream(iter(chunks), TARGET_DATE)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    mtime_ns = path.stat().st_mtime_ns
+    os.chmod(path, 0o640)
+
+    with StreamingPostWriter(path, generator.post_processor(TARGET_DATE)) as writer:
+        for text in chunks:
+            writer.write(text)
+
+    assert not writer.changed and path.stat().st_mtime_ns == mtime_ns
+
+    with StreamingPostWriter(path, generator.post_processor(TARGET_DATE)) as writer:
+        writer.write("# 바뀐 제목\n")
+
+    assert writer.changed and stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert os.listdir(path.parent) == [path.name]
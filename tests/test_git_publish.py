@@ -0,0 +1,170 @@
+"""
+GitPublisher 테스트 (로컬 bare 원격 저장소 사용)
+
+    python -m pytest tests/test_git_publish.py
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scripts.git_publish import GitPublisher
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git이 없음")
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ['git', *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def init_repo(path: Path) -> Path:
+    path.mkdir()
+    git(path, 'init', '-q', '-b', 'main')
+    git(path, 'config', 'user.name', 'Test')
+    git(path, 'config', 'user.email', 'test@example.com')
+    git(path, 'config', 'commit.gpgsign', 'false')
+    return path
+
+
+@pytest.fixture
+def remote(tmp_path) -> Path:
+    path = tmp_path / "remote.git"
+    git(tmp_path, 'init', '-q', '--bare', '-b', 'main', str(path))
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path, remote) -> Path:
+    """첫 커밋을 원격에 push하고 upstream을 설정한 블로그 저장소"""
+    path = init_repo(tmp_path / "blog")
+    (path / "index.md").write_text("# 블로그\n", encoding='utf-8')
+    git(path, 'add', 'index.md')
+    git(path, 'commit', '-q', '-m', 'Initial commit')
+    git(path, 'remote', 'add', 'origin', str(remote))
+    git(path, 'push', '-q', '-u', 'origin', 'main')
+    return path
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def changed_files(cwd: Path, ref: str) -> list[str]:
+    return git(cwd, 'show', '--name-only', '--format=', ref).splitlines()
+
+
+def test_publish_commits_only_given_paths(repo, remote):
+    post = write(repo / "docs" / "learning-records" / "2026-02-01-daily-learning.md", "# 포스트\n")
+    write(repo / "logs" / "publish.log", "로그\n")
+    write(repo / ".env", "OPENAI_API_KEY=secret\n")
+
+    assert GitPublisher(repo).publish([post], "Add daily learning post: 2026-02-01")
+
+    assert git(remote, 'log', '-1', '--format=%s', 'main') == "Add daily learning post: 2026-02-01"
+    assert changed_files(remote, 'main') == ["docs/learning-records/2026-02-01-daily-learning.md"]
+    assert git(repo, 'rev-parse', 'HEAD') == git(remote, 'rev-parse', 'main')
+    # 커밋한 파일은 인덱스에도 반영되어 깨끗하고, 나머지는 추적하지 않은 채로 남음
+    status = git(repo, 'status', '--porcelain', '--untracked-files=all').splitlines()
+    assert sorted(status) == ["?? .env", "?? logs/publish.log"]
+
+
+def test_publish_updates_existing_file_and_keeps_other_staged_changes(repo, remote):
+    post = write(repo / "docs" / "post.md", "첫 버전\n")
+    GitPublisher(repo).publish([post], "Add post")
+
+    write(post, "두 번째 버전\n")
+    write(repo / "index.md", "# 사용자가 스테이징한 변경\n")
+    git(repo, 'add', 'index.md')
+
+    assert GitPublisher(repo).publish([post], "Update post")
+
+    assert changed_files(remote, 'main') == ["docs/post.md"]
+    assert git(remote, 'show', 'main:docs/post.md') == "두 번째 버전"
+    assert git(remote, 'show', 'main:index.md') == "# 블로그"
+    assert git(repo, 'status', '--porcelain').splitlines() == ["M  index.md"]
+
+
+def test_publish_multiple_paths_in_one_commit(repo, remote):
+    posts = [
+        write(repo / "docs" / "learning-records" / f"2026-02-0{day}-daily-learning.md", f"# {day}일\n")
+        for day in (1, 2, 3)
+    ]
+    before = git(remote, 'rev-parse', 'main')
+
+    assert GitPublisher(repo).publish(posts, "Add daily learning posts")
+
+    assert git(remote, 'rev-list', '--count', f'{before}..main') == '1'
+    assert changed_files(remote, 'main') == [
+        f"docs/learning-records/2026-02-0{day}-daily-learning.md" for day in (1, 2, 3)
+    ]
+
+
+def test_publish_without_changes_makes_no_commit(repo, remote):
+    post = write(repo / "docs" / "post.md", "내용\n")
+    GitPublisher(repo).publish([post], "Add post")
+    head = git(repo, 'rev-parse', 'HEAD')
+
+    assert GitPublisher(repo).publish([post], "Add post again")
+
+    assert git(repo, 'rev-parse', 'HEAD') == head
+    assert git(remote, 'rev-parse', 'main') == head
+
+
+def test_commit_preserves_executable_mode(repo):
+    script = write(repo / "scripts" / "run.sh", "#!/bin/sh\necho ok\n")
+    script.chmod(0o755)
+
+    commit = GitPublisher(repo).commit([script], "Add script")
+
+    assert git(repo, 'ls-tree', commit, 'scripts/run.sh').split()[0] == '100755'
+
+
+def test_publish_removes_missing_paths(repo, remote):
+    keep = write(repo / "assets" / "search" / "shards" / "a.json", "{}\n")
+    gone = write(repo / "assets" / "search" / "shards" / "h0316.json", "{}\n")
+    GitPublisher(repo).publish([keep, gone], "Add shards")
+
+    gone.unlink()
+    write(keep, '{"ai":[0,1]}\n')
+    assert GitPublisher(repo).publish([keep, gone], "Update shards")
+
+    assert git(remote, 'ls-tree', '-r', '--name-only', 'main', 'assets') == "assets/search/shards/a.json"
+    assert git(repo, 'status', '--porcelain') == ''
+
+
+def test_commit_in_empty_repository(tmp_path):
+    repo = init_repo(tmp_path / "empty")
+    post = write(repo / "post.md", "첫 글\n")
+
+    commit = GitPublisher(repo).commit([post], "First post")
+
+    assert git(repo, 'rev-parse', 'main') == commit
+    assert changed_files(repo, commit) == ["post.md"]
+    assert git(repo, 'status', '--porcelain') == ''
+
+
+def test_commit_rejects_paths_outside_repository(repo, tmp_path):
+    outside = write(tmp_path / "outside.md", "밖\n")
+
+    with pytest.raises(ValueError):
+        GitPublisher(repo).commit([outside], "Outside")
+    assert not GitPublisher(repo).publish([outside], "Outside")
+
+
+def test_publish_reports_push_failure(repo, remote):
+    post = write(repo / "docs" / "post.md", "내용\n")
+    git(repo, 'remote', 'set-url', 'origin', str(remote.parent / "missing.git"))
+
+    assert not GitPublisher(repo).publish([post], "Add post")
+    assert changed_files(repo, 'HEAD') == ["docs/post.md"]
+
+    # 커밋은 로컬에 남아 있다가 다음 실행에서 새 변경이 없어도 push됨
+    git(repo, 'remote', 'set-url', 'origin', str(remote))
+    assert GitPublisher(repo).publish([post], "Add post")
+    assert git(remote, 'rev-parse', 'main') == git(repo, 'rev-parse', 'HEAD')
@@ -0,0 +1,142 @@
+"""
+history.jsonl 체크포인트와 이진 탐색 스캔 테스트
+
+    python -m pytest tests/test_history_reader.py
+"""
+
+import json
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from scripts.history_reader import HistoryCheckpoint, history_date_key, scan_history_by_date
+
+START = int(datetime(2026, 2, 1).timestamp() * 1000)
+HOUR = 60 * 60 * 1000
+
+
+def history_line(ts: int, session_id: str, project: str = "/work/recoblog") -> str:
+    return json.dumps({"display": "질문", "timestamp": ts, "project": project, "sessionId": session_id}) + "\n"
+
+
+def write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def linear_scan(path: Path, start_ts: int = 0, end_ts: int = 1 << 62) -> dict:
+    """기준 결과: 모든 줄을 처음부터 읽음"""
+    sessions_by_date: dict = {}
+    for line in path.read_bytes().split(b'\n'):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        ts = entry.get('timestamp') if isinstance(entry, dict) else None
+        if isinstance(ts, int) and start_ts <= ts < end_ts:
+            day = history_date_key(ts)
+            sessions_by_date.setdefault(day, {}).setdefault(entry['project'], set()).add(entry['sessionId'])
+    return sessions_by_date
+
+
+@pytest.fixture
+def history(tmp_path) -> Path:
+    return write(tmp_path / "history.jsonl", ''.join(
+        history_line(START + i * HOUR, f"old-{i}") for i in range(30)
+    ))
+
+
+@pytest.fixture
+def checkpoint(tmp_path) -> HistoryCheckpoint:
+    return HistoryCheckpoint(tmp_path / "cache" / "history_checkpoint.json")
+
+
+def test_appended_tail_is_read_incrementally(history, checkpoint):
+    assert checkpoint.refresh(history) == linear_scan(history)
+
+    with open(history, 'a', encoding='utf-8') as f:
+        f.write(history_line(START + 40 * HOUR, "new"))
+        # 아직 쓰는 중인 줄은 다음 갱신에서 읽음
+        f.write(history_line(START + 41 * HOUR, "partial")[:-10])
+    state = json.loads(checkpoint.path.read_text())
+
+    result = checkpoint.refresh(history)
+    assert "new" in str(result) and "partial" not in str(result)
+    assert json.loads(checkpoint.path.read_text())['offset'] > state['offset']
+
+    with open(history, 'a', encoding='utf-8') as f:
+        f.write(history_line(START + 41 * HOUR, "partial")[-10:])
+    assert checkpoint.refresh(history) == linear_scan(history)
+
+
+def test_truncated_file_is_rescanned(history, checkpoint):
+    checkpoint.refresh(history)
+
+    write(history, history_line(START, "after-truncate"))
+
+    assert checkpoint.refresh(history) == linear_scan(history)
+
+
+def test_rotated_file_is_rescanned(history, checkpoint, tmp_path):
+    checkpoint.refresh(history)
+    inode = history.stat().st_ino
+
+    # 더 큰 새 파일로 교체 (inode 변경)
+    rotated = write(tmp_path / "history.jsonl.new", ''.join(
+        history_line(START + i * HOUR, f"rotated-{i}") for i in range(40)
+    ))
+    os.replace(rotated, history)
+    assert history.stat().st_ino != inode
+
+    assert checkpoint.refresh(history) == linear_scan(history)
+
+
+def test_rewritten_head_is_rescanned(history, checkpoint):
+    checkpoint.refresh(history)
+    inode = history.stat().st_ino
+
+    # 같은 inode에 앞부분이 다른 더 큰 내용을 씀 (앞부분 지문 변경)
+    write(history, ''.join(history_line(START + i * HOUR, f"rewritten-{i}") for i in range(40)))
+    assert history.stat().st_ino == inode
+
+    assert checkpoint.refresh(history) == linear_scan(history)
+
+
+def test_corrupt_checkpoint_is_rescanned(history, checkpoint):
+    checkpoint.path.parent.mkdir(parents=True)
+    write(checkpoint.path, "{not json")
+
+    assert checkpoint.refresh(history) == linear_scan(history)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_binary_search_matches_linear_scan(tmp_path, seed):
+    rng = random.Random(seed)
+    lines = []
+    ts = START
+    for i in range(rng.randint(1, 400)):
+        ts += rng.randint(0, 2 * HOUR)
+        # 기록 순서가 timestamp와 조금 어긋난 줄 (ORDER_SLACK_MS 이내)
+        jitter = -rng.randint(0, 5 * 60 * 1000) if rng.random() < 0.1 else 0
+        if rng.random() < 0.05:
+            lines.append('{"display": "잘린 줄", "timest\n')
+        if rng.random() < 0.03:
+            lines.append("\n")
+        lines.append(history_line(ts + jitter, f"s{i % 17}", f"/work/p{i % 3}"))
+    history = write(tmp_path / "history.jsonl", ''.join(lines))
+    end = ts + HOUR
+
+    for _ in range(20):
+        start_ts = rng.randint(START - HOUR, end)
+        end_ts = start_ts + rng.choice((HOUR, 24 * HOUR, 7 * 24 * HOUR))
+        assert scan_history_by_date(history, start_ts, end_ts) == linear_scan(history, start_ts, end_ts)
+
+
+def test_empty_history(tmp_path, checkpoint):
+    history = write(tmp_path / "history.jsonl", "")
+
+    assert scan_history_by_date(history, START, START + HOUR) == {}
+    assert checkpoint.refresh(history) == {}
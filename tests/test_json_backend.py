@@ -0,0 +1,108 @@
+"""
+JSONL 디코딩 백엔드와 bytes 사전 필터 테스트
+
+    python -m pytest tests/test_json_backend.py
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from scripts import collect_conversations
+from scripts.collect_conversations import AgentFileStream, ConversationCollector, DayWindow
+from scripts.json_backend import BACKENDS, get_backend, may_contain_message
+from tests.test_collect_conversations import corpus  # noqa: F401 (fixture)
+
+START_ISO = b'2026-02-01T15:00:00'
+END_ISO = b'2026-02-02T15:00:00'
+
+LINES = [
+    {"type": "user", "sessionId": "s", "timestamp": "2026-02-01T16:00:00.000Z",
+     "message": {"role": "user", "content": "질문"}},
+    {"type": "assistant", "sessionId": "s", "timestamp": "2026-02-01T16:00:01.000Z",
+     "message": {"role": "assistant", "content": [{"type": "text", "text": "답변"}, {"type": "tool_use"}]}},
+    {"type": "user", "sessionId": "s", "timestamp": "2026-02-01T16:00:02Z", "message": "문자열 message"},
+    {"type": "summary", "summary": "요약", "leafUuid": "s"},
+    {"type": "user", "timestamp": None, "message": {"content": None}},
+    {"sessionId": "s"},
+]
+
+
+def available_backends() -> list[str]:
+    names = []
+    for name in BACKENDS:
+        try:
+            get_backend(name)
+        except ValueError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize('line, expected', [
+    (b'{"type": "progress", "timestamp": "2026-02-01T16:00:00.000Z"}', False),
+    (b'{"type": "user", "timestamp": "2026-02-01T16:00:00.000Z"}', True),
+    (b'{"type": "user", "timestamp": "2026-02-01T14:59:59.999Z"}', False),
+    (b'{"type": "user", "timestamp": "2026-02-02T15:00:00.000Z"}', False),
+    # 중첩 객체의 timestamp가 구간 안이면 통과 (보수적)
+    (b'{"type": "user", "timestamp": "2026-01-01T00:00:00Z", "x": {"timestamp": "2026-02-02T00:00:00Z"}}', True),
+    # 정규 UTC 형식이 아니면 디코딩에 맡김
+    (b'{"type": "assistant", "timestamp": "2026-02-02T09:00:00+09:00"}', True),
+    (b'{"type": "user"}', False),
+])
+def test_may_contain_message(line, expected):
+    assert may_contain_message(line, START_ISO, END_ISO) is expected
+
+
+@pytest.mark.parametrize('name', available_backends())
+def test_backends_decode_the_same_entries(name):
+    backend = get_backend(name)
+    stdlib = get_backend('stdlib')
+
+    for entry in LINES:
+        line = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        if name == 'msgspec' and not isinstance(entry.get('message', {}), dict):
+            # msgspec은 타입이 맞지 않는 message를 검증 오류(ValueError)로 거름
+            with pytest.raises(ValueError):
+                backend.decode_transcript(line)
+            continue
+        assert backend.decode_transcript(line) == stdlib.decode_transcript(line), entry
+
+    with pytest.raises(ValueError):
+        backend.decode_transcript(b'{"type": "user", "sessionId": "trunc')
+    assert backend.loads(b'{"a": [1, "\xea\xb0\x80"]}') == {"a": [1, "가"]}
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        get_backend('simdjson')
+
+
+@pytest.mark.parametrize('name', available_backends())
+def test_backends_collect_the_same_conversations(corpus, tmp_path, name):  # noqa: F811
+    def collect(backend: str) -> list:
+        collector = ConversationCollector(
+            cache_dir=tmp_path / backend, claude_dir=corpus.claude_dir, json_backend=backend
+        )
+        return [collector.collect_all(day) for day in corpus.dates()]
+
+    assert collect(name) == collect('stdlib')
+
+
+def test_prefilter_does_not_change_the_result(corpus, monkeypatch):  # noqa: F811
+    agent_files = sorted((corpus.claude_dir / "projects").glob("*/agent-*.jsonl"))
+    windows = [DayWindow.for_date(day) for day in corpus.dates()]
+    windows.append(DayWindow.for_date(datetime(2026, 2, 2, 0), days=2))
+
+    def read_all() -> list:
+        return [
+            list(AgentFileStream(agent_file, "/work", window))
+            for agent_file in agent_files for window in windows
+        ]
+
+    filtered = read_all()
+    monkeypatch.setattr(collect_conversations, 'may_contain_message', lambda line, start, end: True)
+
+    assert read_all() == filtered
+    assert any(filtered)
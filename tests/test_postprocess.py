@@ -0,0 +1,92 @@
+"""
+포스트 후처리 테스트 (코드 펜스 판정과 스트리밍 조각 처리)
+
+    python -m pytest tests/test_postprocess.py
+"""
+
+import pytest
+
+from scripts.postprocess import PostProcessor
+
+FRONTMATTER = (
+    "---\nlayout: default\ntitle: \"후처리\"\nparent: 학습 기록\n"
+    "date: 2026-02-01\ntags: [til]\n---\n"
+)
+
+POST = FRONTMATTER + (
+    "\n# 후처리\n\n"
+    "들여쓴 코드 블록 안의 펜스 모양 줄:\n\n"
+    "    ```\n    print('indented')\n\n"
+    "한 줄짜리 ```inline``` 코드와\n"
+    "```x```\n\n"
+    "~~~\nwith open(path) as f:\n```python\n~~~\n\n"
+    "````markdown\n```\n중첩된 예시\n```\n````\n\n"
+    "```\nprint('“닫히지 않음”')\n"
+)
+
+
+def make_processor() -> PostProcessor:
+    return PostProcessor(default_title="2026년 02월 01일 학습 기록", date="2026-02-01")
+
+
+def body(text: str) -> str:
+    return make_processor().process(FRONTMATTER + text)[len(FRONTMATTER):]
+
+
+def streamed(text: str, sizes: list[int]) -> str:
+    """text를 sizes 길이의 조각들로 (남는 부분은 마지막 조각으로) 나눠 처리"""
+    processor = make_processor()
+    out, start = [], 0
+    for size in sizes:
+        out.append(processor.feed(text[start:start + size]))
+        start += size
+    out.append(processor.feed(text[start:]))
+    return ''.join(out) + processor.finish()
+
+
+def test_indented_fence_is_not_a_fence():
+    assert body("    ```\n    code\n\n```\nx\n```\n") == "    ```\n    code\n\n```text\nx\n```\n"
+
+
+def test_up_to_three_spaces_of_indentation_is_a_fence():
+    assert body("   ```\nx\n   ```\n") == "   ```text\nx\n   ```\n"
+
+
+def test_backtick_info_with_backticks_is_not_a_fence():
+    text = "```x```\n\n```\ncode\n```\n"
+    assert body(text) == "```x```\n\n```text\ncode\n```\n"
+
+
+def test_tilde_info_may_contain_backticks():
+    assert body("~~~ `weird`\nx\n~~~\n") == "~~~ `weird`\nx\n~~~\n"
+
+
+def test_closing_fence_needs_same_marker_and_nothing_after_it():
+    text = "````\n```\n``` not closing\n~~~~\n````  \nafter\n"
+    assert body(text) == "````text\n```\n``` not closing\n~~~~\n````  \nafter\n"
+
+
+def test_unclosed_fence_is_closed():
+    processor = make_processor()
+    result = processor.process(FRONTMATTER + "```\nx")
+    assert result.endswith("```text\nx\n```\n")
+    assert processor.issues['fence_closed'] == 1
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 5, 7, 16])
+def test_fixed_chunks_match_whole_text(size):
+    chunks = [size] * (len(POST) // size)
+    assert streamed(POST, chunks) == make_processor().process(POST)
+
+
+def test_every_two_way_split_matches_whole_text():
+    # 펜스 표시, 줄 중간, 줄바꿈 바로 앞뒤를 모두 자름
+    expected = make_processor().process(POST)
+    for cut in range(len(POST) + 1):
+        assert streamed(POST, [cut]) == expected, cut
+
+
+def test_long_line_in_many_chunks():
+    line = "긴 줄 " * 20000
+    text = FRONTMATTER + "```\n" + line + "\n```\n" + line
+    assert streamed(text, [1] * len(text)) == make_processor().process(text)
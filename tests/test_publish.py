@@ -0,0 +1,91 @@
+"""
+publish.py 발행 단계 테스트 (검색 색인 + 매니페스트 + 로컬 bare 원격 저장소)
+
+    python -m pytest tests/test_publish.py
+"""
+
+import argparse
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from scripts import publish_manifest
+from scripts.metrics import PipelineMetrics
+from scripts.publish import publish_changed, run_backfill, update_search_index
+from tests.test_git_publish import git, init_repo
+from tests.test_search_index import post, write
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git이 없음")
+
+TARGET_DATE = datetime(2026, 2, 1)
+
+
+@pytest.fixture
+def blog(tmp_path, monkeypatch) -> Path:
+    """원격에 push할 수 있는 블로그 저장소 (매니페스트는 tmp_path 안에 저장)"""
+    monkeypatch.setattr(publish_manifest, 'DEFAULT_MANIFEST_PATH', tmp_path / "manifest.json")
+    remote = tmp_path / "remote.git"
+    git(tmp_path, 'init', '-q', '--bare', '-b', 'main', str(remote))
+    path = init_repo(tmp_path / "blog")
+    write(path / "index.md", "# 블로그\n")
+    git(path, 'add', 'index.md')
+    git(path, 'commit', '-q', '-m', 'Initial commit')
+    git(path, 'remote', 'add', 'origin', str(remote))
+    git(path, 'push', '-q', '-u', 'origin', 'main')
+    return path
+
+
+def save_post(blog: Path, title: str, body: str) -> Path:
+    return write(blog / "docs" / "learning-records" / "2026-02-01-daily-learning.md", post(title, body))
+
+
+def publish(blog: Path, post_path: Path) -> bool:
+    metrics = PipelineMetrics(log_dir=blog.parent / "logs")
+    index_paths = update_search_index(blog, [post_path], metrics)
+    return publish_changed(blog, [post_path] + index_paths, metrics, TARGET_DATE)
+
+
+def remote_files(blog: Path) -> list[str]:
+    return git(blog, 'ls-tree', '-r', '--name-only', 'origin/main').splitlines()
+
+
+def test_index_written_by_no_git_run_is_published_later(blog):
+    post_path = save_post(blog, "캐시 정리", "asyncio 캐시")
+    # --no-git 실행: 색인만 쓰고 커밋하지 않음
+    update_search_index(blog, [post_path], PipelineMetrics(log_dir=blog.parent / "logs"))
+
+    assert publish(blog, post_path)
+
+    files = remote_files(blog)
+    assert "docs/learning-records/2026-02-01-daily-learning.md" in files
+    assert {"assets/search/docs.json", "assets/search/_state.json",
+            "assets/search/shards/h0316.json", "assets/search/shards/a.json"} <= set(files)
+    assert git(blog, 'status', '--porcelain', '--untracked-files=all', 'assets') == ''
+
+
+def test_shard_deleted_by_no_git_run_is_removed_later(blog):
+    post_path = save_post(blog, "캐시 정리", "asyncio 캐시")
+    assert publish(blog, post_path)
+
+    # --no-git 실행에서 "캐시"가 빠져 h0316 샤드가 지워짐
+    post_path = save_post(blog, "비동기 정리", "asyncio")
+    update_search_index(blog, [post_path], PipelineMetrics(log_dir=blog.parent / "logs"))
+
+    assert publish(blog, post_path)
+
+    files = remote_files(blog)
+    assert "assets/search/shards/h0316.json" not in files
+    assert "assets/search/shards/a.json" in files
+    assert git(blog, 'status', '--porcelain', '--untracked-files=all') == ''
+
+
+@pytest.mark.parametrize('missing', [False, True])
+def test_backfill_rejects_reversed_range(tmp_path, capsys, missing):
+    args = argparse.Namespace(from_date='2026-02-07', to_date='2026-02-01', missing=missing)
+
+    code = run_backfill(args, tmp_path, None, None, PipelineMetrics(log_dir=tmp_path / "logs"))
+
+    assert code == 1
+    assert "[오류]" in capsys.readouterr().out
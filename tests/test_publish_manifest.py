@@ -0,0 +1,64 @@
+"""
+발행 매니페스트 테스트
+
+    python -m pytest tests/test_publish_manifest.py
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scripts.publish_manifest import PublishManifest
+
+
+@pytest.fixture
+def root(tmp_path) -> Path:
+    return tmp_path / "blog"
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def manifest(root: Path) -> PublishManifest:
+    return PublishManifest(root, path=root / ".cache" / "publish_manifest.json")
+
+
+def test_published_files_are_unchanged_until_edited(root):
+    post = write(root / "docs" / "post.md", "첫 버전\n")
+    assert manifest(root).changed([post]) == [post]
+
+    published = manifest(root)
+    published.mark_published([post])
+    published.save()
+
+    assert manifest(root).changed([post]) == []
+    write(post, "두 번째 버전\n")
+    assert manifest(root).changed([post]) == [post]
+
+
+def test_missing_file_is_changed_and_deletion_is_recorded(root):
+    shard = write(root / "assets" / "search" / "shards" / "h0316.json", "{}\n")
+    kept = write(root / "assets" / "search" / "shards" / "a.json", "{}\n")
+    published = manifest(root)
+    published.mark_published([shard, kept])
+    published.save()
+
+    shard.unlink()
+    current = manifest(root)
+    assert current.changed([shard, kept]) == [shard]
+    assert current.missing(root / "assets" / "search") == [shard]
+
+    current.mark_published([shard])
+    current.save()
+    assert manifest(root).missing(root / "assets" / "search") == []
+    assert manifest(root).changed([kept]) == []
+
+
+def test_corrupt_manifest_treats_everything_as_changed(root):
+    post = write(root / "docs" / "post.md", "내용\n")
+    write(root / ".cache" / "publish_manifest.json", "{not json")
+
+    assert manifest(root).changed([post]) == [post]
@@ -0,0 +1,168 @@
+"""
+사이트 검색 색인 테스트
+
+    python -m pytest tests/test_search_index.py
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from scripts.git_publish import GitPublisher
+from scripts.search_index import SearchIndex, shard_key, tokenize
+from tests.test_git_publish import git, init_repo
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def post(title: str, body: str, tags: str = "[]") -> str:
+    return f"---\nlayout: default\ntitle: \"{title}\"\ntags: {tags}\n---\n\n# {title}\n\n{body}\n"
+
+
+def snapshot(site: Path) -> dict[str, str]:
+    """색인 파일 내용 (갱신 순서와 무관하게 비교할 수 있도록 상태 파일 제외)"""
+    return {
+        path.relative_to(site).as_posix(): path.read_text(encoding='utf-8')
+        for path in sorted((site / "assets" / "search").rglob("*.json"))
+        if path.name != "_state.json"
+    }
+
+
+@pytest.fixture
+def site(tmp_path) -> Path:
+    write(tmp_path / "docs" / "python" / "index.md", post("Python", "파이썬 관련 학습 기록입니다."))
+    write(
+        tmp_path / "docs" / "learning-records" / "2026-02-01-daily-learning.md",
+        post("비동기 캐시 정리", "asyncio 세마포어로 동시 요청을 제한했다.", "[python, asyncio]"),
+    )
+    return tmp_path
+
+
+def test_tokenize_strips_particles_and_splits_hangul_bigrams():
+    assert tokenize("비동기로 캐시를 적용했다") == ['비동', '동기', '캐시', '적용', '용했', '했다']
+    assert tokenize("The KEDA와 Python의 값") == ['keda', 'python', '값']
+    assert tokenize("비동기 캐시") == tokenize("비동기는 캐시가")
+
+
+def test_shard_key():
+    assert shard_key("캐시") == "h0316"
+    assert shard_key("캐싱") == shard_key("캐시")
+    assert shard_key("asyncio") == "a"
+    assert shard_key("2026") == "0"
+
+
+def test_update_indexes_pages(site):
+    result = SearchIndex(site).sync()
+
+    assert result.updated == 2
+    docs = json.loads((site / "assets" / "search" / "docs.json").read_text(encoding='utf-8'))['docs']
+    by_url = {doc['url']: doc for doc in docs.values()}
+    assert set(by_url) == {"/docs/python/", "/docs/learning-records/2026-02-01-daily-learning.html"}
+    assert by_url["/docs/learning-records/2026-02-01-daily-learning.html"]['date'] == "2026-02-01"
+
+    shard = json.loads((site / "assets" / "search" / "shards" / "h0316.json").read_text(encoding='utf-8'))
+    doc_id = next(int(i) for i, doc in docs.items() if doc['title'] == "비동기 캐시 정리")
+    # 제목에 나온 용어는 TITLE_WEIGHT만큼 더해짐
+    assert shard['캐시'] == [doc_id, 6]
+
+
+def test_update_rewrites_only_affected_shards(site):
+    SearchIndex(site).sync()
+    new_post = write(
+        site / "docs" / "learning-records" / "2026-02-02-daily-learning.md",
+        post("쿠버네티스", "kubernetes 파드"),
+    )
+
+    result = SearchIndex(site).update([new_post])
+
+    shards = sorted(path.stem for path in result.written if path.parent.name == 'shards')
+    assert shards == sorted({shard_key(term) for term in tokenize("쿠버네티스 kubernetes 파드")})
+
+    # 다시 갱신해도 쓰는 파일이 없음
+    assert SearchIndex(site).update([new_post]).written == []
+
+
+def test_emptied_shard_is_deleted(site):
+    post_path = site / "docs" / "learning-records" / "2026-02-01-daily-learning.md"
+    SearchIndex(site).sync()
+    shard = site / "assets" / "search" / "shards" / "h0316.json"
+    assert shard.exists()
+
+    # "캐시"가 빠지면 h0316 샤드에 남는 용어가 없음
+    write(post_path, post("비동기 정리", "asyncio 세마포어로 동시 요청을 제한했다.", "[python, asyncio]"))
+    result = SearchIndex(site).update([post_path])
+
+    assert shard in result.written and not shard.exists()
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason="git이 없음")
+def test_emptied_shard_deletion_is_published(tmp_path):
+    remote = tmp_path / "remote.git"
+    git(tmp_path, 'init', '-q', '--bare', '-b', 'main', str(remote))
+    site = init_repo(tmp_path / "blog")
+    git(site, 'remote', 'add', 'origin', str(remote))
+    post_path = write(
+        site / "docs" / "learning-records" / "2026-02-01-daily-learning.md", post("캐시 정리", "캐시")
+    )
+    result = SearchIndex(site).update([post_path])
+    assert GitPublisher(site).commit([post_path, *result.written], "Add post")
+    git(site, 'push', '-q', '-u', 'origin', 'main')
+
+    write(post_path, post("비동기 정리", "asyncio"))
+    result = SearchIndex(site).update([post_path])
+
+    assert GitPublisher(site).publish([post_path, *result.written], "Update post")
+    tracked = git(remote, 'ls-tree', '-r', '--name-only', 'main').splitlines()
+    assert "assets/search/shards/h0316.json" not in tracked
+    assert "assets/search/shards/a.json" in tracked
+    assert git(remote, 'show', f'main:{post_path.relative_to(site).as_posix()}') == post_path.read_text(
+        encoding='utf-8'
+    ).rstrip('\n')
+
+
+def test_incremental_updates_match_rebuild(site):
+    SearchIndex(site).sync()
+    write(
+        site / "docs" / "learning-records" / "2026-02-01-daily-learning.md",
+        post("비동기 캐시 정리", "캐시 키를 해시로 바꿨다.", "[python]"),
+    )
+    (site / "docs" / "python" / "index.md").unlink()
+    write(site / "docs" / "ai" / "index.md", post("AI", "LLM 학습 기록"))
+    SearchIndex(site).sync()
+    incremental = snapshot(site)
+
+    rebuilt = SearchIndex(site)
+    rebuilt.clear()
+    rebuilt.sync()
+
+    # 문서 id는 달라질 수 있으므로 url 기준으로 비교
+    def normalize(files: dict[str, str]) -> dict:
+        docs = json.loads(files.pop("assets/search/docs.json"))['docs']
+        url = {int(i): doc['url'] for i, doc in docs.items()}
+        return {
+            path: {
+                term: sorted((url[p[i]], p[i + 1]) for i in range(0, len(p), 2))
+                for term, p in json.loads(text).items()
+            }
+            for path, text in files.items()
+        }
+
+    incremental = normalize(incremental)
+    assert incremental == normalize(snapshot(site))
+    # 지운 문서의 용어는 남지 않음
+    assert not any('파이' in terms for terms in incremental.values())
+
+
+def test_search_exclude(site):
+    write(site / "docs" / "draft.md", "---\ntitle: 초안\nsearch_exclude: true\n---\n\n비공개 초안\n")
+
+    SearchIndex(site).sync()
+
+    docs = json.loads((site / "assets" / "search" / "docs.json").read_text(encoding='utf-8'))['docs']
+    assert "초안" not in {doc['title'] for doc in docs.values()}
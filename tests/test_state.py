@@ -0,0 +1,51 @@
+"""
+상태 파일 유틸리티 테스트 (원자적 쓰기와 파일 권한)
+
+    python -m pytest tests/test_state.py
+"""
+
+import os
+import stat
+
+import pytest
+
+from scripts import state
+from scripts.state import AtomicWriter, atomic_write_text
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_new_file_gets_umask_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(state, '_UMASK', 0o022)
+    path = tmp_path / "docs" / "post.md"
+
+    atomic_write_text(path, "본문\n")
+
+    assert path.read_text(encoding='utf-8') == "본문\n"
+    assert mode(path) == 0o644
+
+
+def test_rewrite_keeps_existing_mode(tmp_path):
+    path = tmp_path / "post.md"
+    path.write_text("이전\n", encoding='utf-8')
+    os.chmod(path, 0o640)
+
+    atomic_write_text(path, "새 본문\n")
+
+    assert path.read_text(encoding='utf-8') == "새 본문\n"
+    assert mode(path) == 0o640
+
+
+def test_failed_write_leaves_file_and_no_temp(tmp_path):
+    path = tmp_path / "post.md"
+    path.write_text("이전\n", encoding='utf-8')
+
+    with pytest.raises(RuntimeError):
+        with AtomicWriter(path) as f:
+            f.write("반쯤")
+            raise RuntimeError("중단")
+
+    assert path.read_text(encoding='utf-8') == "이전\n"
+    assert os.listdir(tmp_path) == ["post.md"]
@@ -0,0 +1,95 @@
+"""
+단계적 요약(map-reduce) 테스트 (API 요청 대신 가짜 응답 사용)
+
+    python -m pytest tests/test_summarize.py
+"""
+
+import pytest
+
+from scripts.collect_conversations import ConversationCollector
+from scripts.summarize import chunk_conversations, estimate_tokens, group_by_budget
+from tests.test_generate_blog_post import TARGET_DATE, conversation, generator, words  # noqa: F401
+
+
+def test_chunks_stay_within_budget_and_keep_every_message():
+    collector = ConversationCollector()
+    convs = [
+        conversation("short", ["짧은 질문", "짧은 답변"]),
+        conversation("long", [words(f"m{i}", 60) for i in range(12)]),
+    ]
+
+    chunks = chunk_conversations(collector, convs, chunk_tokens=300)
+
+    assert len(chunks) > 2
+    assert all(estimate_tokens(chunk) <= 300 for chunk in chunks)
+    text = '\n'.join(chunks)
+    assert all(msg.content in text for conv in convs for msg in conv.messages)
+    # 나뉜 세션의 이어지는 조각을 포함해 모든 조각이 세션 헤더로 시작함
+    assert all(chunk.startswith("\n## 프로젝트: recoblog") for chunk in chunks)
+
+
+def test_group_by_budget_keeps_order_and_isolates_oversized_texts():
+    texts = [words("a", 10), words("b", 10), words("c", 200), words("d", 10)]
+
+    groups = group_by_budget(texts, budget=estimate_tokens(texts[0]) * 2 + 1)
+
+    assert [text for group in groups for text in group] == texts
+    assert groups == [texts[:2], [texts[2]], [texts[3]]]
+
+
+def summarize_with(generator, monkeypatch, reduce_reply):  # noqa: F811
+    """map 요청에는 짧은 요약, reduce 요청에는 reduce_reply(prompt)로 답하는 생성기로 프롬프트 생성"""
+    calls = {'map': 0, 'reduce': 0}
+
+    def complete(prompt: str, max_tokens: int) -> str:
+        if "부분 요약:" in prompt:
+            calls['reduce'] += 1
+            return reduce_reply(prompt)
+        calls['map'] += 1
+        return words(f"summary{calls['map']}-", 30)
+
+    monkeypatch.setattr(generator, '_complete', complete)
+    # 세션 하나는 조각 하나에 들어가지만 8개를 합치면 예산을 넘음
+    convs = [conversation(f"s{i}", [words(f"q{i}-", 20), words(f"r{i}-", 20)]) for i in range(8)]
+    return generator._prepare_post_prompt(convs, TARGET_DATE), calls
+
+
+def test_reduce_until_within_budget(generator, monkeypatch):  # noqa: F811
+    prompt, calls = summarize_with(generator, monkeypatch, lambda prompt: words("merged", 20))
+
+    assert calls['map'] == 8 and calls['reduce'] >= 1
+    content = prompt.split("## 대화 요약:")[1]
+    assert "merged" in content and "summary1-0" not in content
+    assert estimate_tokens(generator.join_summaries(["merged"])) <= generator.token_budget
+
+
+def test_reduce_terminates_when_summaries_do_not_shrink(generator, monkeypatch):  # noqa: F811
+    # reduce 응답이 입력을 그대로 돌려줘도 묶음 수가 매번 줄어들어 끝남
+    prompt, calls = summarize_with(
+        generator, monkeypatch, lambda prompt: prompt.split("## 부분 요약:\n")[1]
+    )
+
+    assert 1 <= calls['reduce'] <= 8
+    content = prompt.split("## 대화 요약:")[1]
+    assert all(f"summary{i}-0" in content for i in range(1, 9))
+
+
+def test_reduce_groups_stops_when_nothing_can_be_merged(generator):  # noqa: F811
+    fits = [words("a", 10), words("b", 10)]
+    oversized = [words("x", 300), words("y", 300)]
+
+    assert generator.reduce_groups(fits) is None
+    assert generator.reduce_groups([words("only", 500)]) is None
+    # 하나하나가 조각 예산보다 커서 더 묶을 수 없음
+    assert generator.reduce_groups(oversized) is None
+
+
+@pytest.mark.parametrize('count', [5, 9, 20])
+def test_reduce_groups_always_shrinks(generator, count):  # noqa: F811
+    # 합계는 예산(200)을 넘지만 몇 개씩은 묶을 수 있는 크기
+    summaries = [words(f"s{i}-", 30) for i in range(count)]
+
+    groups = generator.reduce_groups(summaries)
+
+    assert groups is not None and len(groups) < count
+    assert [text for group in groups for text in group] == summaries
@@ -0,0 +1,165 @@
+"""
+agent-*.jsonl 인덱스 테스트
+
+    python -m pytest tests/test_transcript_index.py
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from scripts import transcript_index
+from scripts.transcript_index import TranscriptIndex
+from tests.test_collect_conversations import transcript_line, write_jsonl
+
+DAY_START = datetime(2026, 2, 2)
+START_MS = int(DAY_START.timestamp() * 1000)
+END_MS = START_MS + 24 * 60 * 60 * 1000
+
+
+def touch(path: Path, local: datetime) -> None:
+    os.utime(path, (local.timestamp(), local.timestamp()))
+
+
+@pytest.fixture
+def project_dir(tmp_path) -> Path:
+    """
+    agent-a: 전날 끝난 세션 (수정 시각도 전날)
+    agent-b: 그날 세션 b
+    agent-c: 전날 세션 c와 그날 세션 d를 이어 씀
+    """
+    path = tmp_path / "projects" / "-work-recoblog"
+    write_jsonl(path / "agent-a.jsonl", [transcript_line("a", datetime(2026, 2, 1, 10), "어제")])
+    write_jsonl(path / "agent-b.jsonl", [transcript_line("b", datetime(2026, 2, 2, 9), "오늘")])
+    write_jsonl(path / "agent-c.jsonl", [
+        transcript_line("c", datetime(2026, 2, 1, 20), "어제"),
+        transcript_line("d", datetime(2026, 2, 2, 11), "오늘"),
+    ])
+    touch(path / "agent-a.jsonl", datetime(2026, 2, 1, 10, 1))
+    touch(path / "agent-b.jsonl", datetime(2026, 2, 2, 9, 1))
+    touch(path / "agent-c.jsonl", datetime(2026, 2, 2, 11, 1))
+    return path
+
+
+@pytest.fixture
+def index(tmp_path) -> TranscriptIndex:
+    return TranscriptIndex(tmp_path / "cache" / "transcript_index")
+
+
+def count_scans(monkeypatch) -> list[str]:
+    scanned = []
+    scan = transcript_index.scan_transcript
+
+    def counting(agent_file, entry, include_tail=False):
+        scanned.append(agent_file.name)
+        return scan(agent_file, entry, include_tail)
+
+    monkeypatch.setattr(transcript_index, 'scan_transcript', counting)
+    return scanned
+
+
+@pytest.mark.parametrize('session_ids, expected', [
+    (set(), ["agent-b.jsonl", "agent-c.jsonl"]),
+    ({"b"}, ["agent-b.jsonl"]),
+    ({"d"}, ["agent-c.jsonl"]),
+    # 세션 c의 파일이지만 인덱스만으로는 그날 메시지가 없는지 알 수 없어 고름
+    ({"c"}, ["agent-c.jsonl"]),
+    ({"a"}, []),
+    ({"없는 세션"}, []),
+])
+def test_select_entries(project_dir, index, session_ids, expected):
+    selected, candidates = index.select_entries(project_dir, session_ids, START_MS, END_MS)
+
+    assert [path.name for path, _ in selected] == expected
+    assert candidates == 3
+
+
+def test_file_outside_time_range_is_skipped(project_dir, index):
+    # 수정 시각은 구간 안이지만 기록은 모두 구간 전
+    touch(project_dir / "agent-a.jsonl", datetime(2026, 2, 2, 12))
+
+    assert index.select_files(project_dir, {"a"}, START_MS, END_MS) == []
+    assert index.select_entries(project_dir, set(), START_MS, END_MS)[0][0][1] == ["b"]
+
+
+def test_unchanged_files_are_not_rescanned(project_dir, index, monkeypatch):
+    index.select_entries(project_dir, set(), START_MS, END_MS)
+    scanned = count_scans(monkeypatch)
+
+    index.select_entries(project_dir, set(), START_MS, END_MS)
+
+    # 전날 멈춘 파일은 처음부터 열지 않음
+    assert scanned == []
+    assert "agent-a.jsonl" not in index._load(project_dir)
+
+
+def test_appended_file_is_scanned_from_last_offset(project_dir, index, monkeypatch):
+    index.select_entries(project_dir, {"b"}, START_MS, END_MS)
+    agent_b = project_dir / "agent-b.jsonl"
+    offset = index._load(project_dir)["agent-b.jsonl"]['offset']
+
+    with open(agent_b, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(transcript_line("e", datetime(2026, 2, 2, 15), "이어서")) + "\n")
+    touch(agent_b, datetime(2026, 2, 2, 15, 1))
+    scanned = count_scans(monkeypatch)
+
+    assert index.select_files(project_dir, {"e"}, START_MS, END_MS) == [agent_b]
+    assert scanned == ["agent-b.jsonl"]
+    entry = index._load(project_dir)["agent-b.jsonl"]
+    assert entry['sessions'] == ["b", "e"] and entry['offset'] == agent_b.stat().st_size > offset
+
+
+def test_rewritten_file_is_scanned_from_start(project_dir, index):
+    index.select_entries(project_dir, set(), START_MS, END_MS)
+    agent_c = project_dir / "agent-c.jsonl"
+
+    # 더 짧은 내용으로 다시 쓰인 파일 (이전 세션이 남아 있으면 안 됨)
+    write_jsonl(agent_c, [transcript_line("f", datetime(2026, 2, 2, 16), "새로 씀")])
+    touch(agent_c, datetime(2026, 2, 2, 16, 1))
+
+    assert index.select_files(project_dir, {"d"}, START_MS, END_MS) == []
+    assert index.select_entries(project_dir, {"f"}, START_MS, END_MS) == ([(agent_c, ["f"])], 3)
+
+
+def test_partial_last_line_is_read_later(project_dir, index):
+    agent_b = project_dir / "agent-b.jsonl"
+    line = agent_b.read_text(encoding='utf-8')
+    with open(agent_b, 'a', encoding='utf-8') as f:
+        f.write(line.replace('"b"', '"g"')[:-20])
+    touch(agent_b, datetime(2026, 2, 2, 9, 2))
+
+    assert index.select_files(project_dir, {"g"}, START_MS, END_MS) == []
+
+    with open(agent_b, 'a', encoding='utf-8') as f:
+        f.write(line.replace('"b"', '"g"')[-20:])
+    touch(agent_b, datetime(2026, 2, 2, 9, 3))
+
+    assert index.select_files(project_dir, {"g"}, START_MS, END_MS) == [agent_b]
+
+
+def test_unterminated_last_line_is_read_once_size_is_stable(project_dir, index, monkeypatch):
+    agent_h = project_dir / "agent-h.jsonl"
+    agent_h.write_text(json.dumps(transcript_line("h", datetime(2026, 2, 2, 17), "줄바꿈 없음")), encoding='utf-8')
+    touch(agent_h, datetime(2026, 2, 2, 17, 1))
+
+    # 처음에는 아직 쓰는 중일 수 있어 건너뜀
+    assert index.select_files(project_dir, {"h"}, START_MS, END_MS) == []
+    # 크기가 그대로면 다 쓰인 줄로 보고 읽음
+    assert index.select_files(project_dir, {"h"}, START_MS, END_MS) == [agent_h]
+    assert index._load(project_dir)["agent-h.jsonl"]['offset'] == 0
+
+    scanned = count_scans(monkeypatch)
+    assert index.select_files(project_dir, {"h"}, START_MS, END_MS) == [agent_h]
+    assert scanned == []
+
+    # 나중에 줄이 끝나고 이어 쓰이면 그 줄부터 다시 읽음
+    with open(agent_h, 'a', encoding='utf-8') as f:
+        f.write("\n" + json.dumps(transcript_line("i", datetime(2026, 2, 2, 18), "이어서")) + "\n")
+    touch(agent_h, datetime(2026, 2, 2, 18, 1))
+
+    assert index.select_files(project_dir, {"i"}, START_MS, END_MS) == [agent_h]
+    entry = index._load(project_dir)["agent-h.jsonl"]
+    assert entry['sessions'] == ["h", "i"] and entry['offset'] == agent_h.stat().st_size